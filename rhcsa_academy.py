@@ -7,11 +7,23 @@ Comprehensive course based on real RHCSA exam questions with progress tracking
 import os
 import sys
 import json
+import mmap
 import time
+import struct
+import argparse
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Union
 from pathlib import Path
 
+import rhcsa_bank
+import rhcsa_search
+from rhcsa_analytics import DEFAULT_STATE, refresh, trend_label
+from rhcsa_answerlog import DEFAULT_LOG
+from rhcsa_progress import ProgressTracker, SQLiteProgressTracker
+from rhcsa_search import SearchIndex, TrigramIndex
+from rhcsa_srs import DAY, DEFAULT_DECK, ReviewScheduler, bank_ref, load_deck, save_deck
+from rhcsa_storage import Timings, load_cached, source_hash
+
 # ANSI color codes
 class Colors:
     HEADER = '\033[95m'
@@ -56,6 +68,9 @@ def wait_for_enter(message="Press Enter to continue..."):
 
 class Lesson:
     """Represents a single lesson within a module"""
+    __slots__ = ('title', 'theory', 'example', 'commands', 'tips',
+                 'exam_question', 'exam_solution', 'practice_tasks')
+    
     def __init__(self, title: str, theory: str, example: str, 
                  commands: List[str], tips: List[str], exam_question: str, 
                  exam_solution: str, practice_tasks: List[str]):
@@ -70,6 +85,8 @@ class Lesson:
 
 class Quiz:
     """Represents a quiz question"""
+    __slots__ = ('question', 'options', 'correct', 'explanation')
+    
     def __init__(self, question: str, options: List[str], 
                  correct: int, explanation: str):
         self.question = question
@@ -78,138 +95,147 @@ class Quiz:
         self.explanation = explanation
 
 class Module:
-    """Represents a learning module"""
+    """Represents a learning module
+    
+    Lessons and quiz may be given as lists or as zero-argument loaders. Loaders
+    are called on first access, so listing modules only costs the metadata.
+    """
+    __slots__ = ('id', 'title', 'description', 'difficulty', 'lesson_count',
+                 '_lessons', '_quiz')
+    
     def __init__(self, id: str, title: str, description: str, 
-                 difficulty: str, lessons: List[Lesson], quiz: List[Quiz]):
+                 difficulty: str,
+                 lessons: Union[List[Lesson], Callable[[], List[Lesson]]],
+                 quiz: Union[List[Quiz], Callable[[], List[Quiz]]],
+                 lesson_count: Optional[int] = None):
         self.id = id
         self.title = title
         self.description = description
-        self.difficulty = difficulty
-        self.lessons = lessons
-        self.quiz = quiz
-
-class ProgressTracker:
-    """Tracks and persists user progress"""
-    def __init__(self, progress_file='rhcsa_progress.json'):
-        self.progress_file = progress_file
-        self.data = self.load_progress()
+        self.difficulty = sys.intern(difficulty)
+        self._lessons = lessons
+        self._quiz = quiz
+        if lesson_count is None:
+            lesson_count = len(self.lessons)
+        self.lesson_count = lesson_count
     
-    def load_progress(self) -> Dict:
-        """Load progress from JSON file"""
-        if os.path.exists(self.progress_file):
-            try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return self.create_new_progress()
-        return self.create_new_progress()
-    
-    def create_new_progress(self) -> Dict:
-        """Create new progress structure"""
-        return {
-            'started_at': datetime.now().isoformat(),
-            'last_accessed': datetime.now().isoformat(),
-            'modules': {},
-            'bookmarks': [],
-            'notes': {},
-            'quiz_scores': {},
-            'completed_lessons': [],
-            'total_study_time': 0,
-            'achievements': []
-        }
-    
-    def save_progress(self):
-        """Save progress to JSON file"""
-        self.data['last_accessed'] = datetime.now().isoformat()
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
-    
-    def mark_lesson_complete(self, module_id: str, lesson_index: int):
-        """Mark a lesson as complete"""
-        key = f"{module_id}_{lesson_index}"
-        if key not in self.data['completed_lessons']:
-            self.data['completed_lessons'].append(key)
-        
-        if module_id not in self.data['modules']:
-            self.data['modules'][module_id] = {
-                'started': True,
-                'completed_lessons': [],
-                'quiz_completed': False
-            }
-        
-        if lesson_index not in self.data['modules'][module_id]['completed_lessons']:
-            self.data['modules'][module_id]['completed_lessons'].append(lesson_index)
-        
-        self.save_progress()
+    @property
+    def lessons(self) -> List[Lesson]:
+        if callable(self._lessons):
+            self._lessons = self._lessons()
+            self.lesson_count = len(self._lessons)
+        return self._lessons
     
-    def save_quiz_score(self, module_id: str, score: int, total: int):
-        """Save quiz score"""
-        self.data['quiz_scores'][module_id] = {
-            'score': score,
-            'total': total,
-            'percentage': (score / total * 100) if total > 0 else 0,
-            'date': datetime.now().isoformat()
-        }
-        if module_id in self.data['modules']:
-            self.data['modules'][module_id]['quiz_completed'] = True
-        self.save_progress()
-    
-    def add_bookmark(self, module_id: str, lesson_index: int, note: str = ""):
-        """Add a bookmark"""
-        bookmark = {
-            'module_id': module_id,
-            'lesson_index': lesson_index,
-            'note': note,
-            'date': datetime.now().isoformat()
-        }
-        self.data['bookmarks'].append(bookmark)
-        self.save_progress()
-    
-    def add_note(self, module_id: str, lesson_index: int, note: str):
-        """Add a note"""
-        key = f"{module_id}_{lesson_index}"
-        if key not in self.data['notes']:
-            self.data['notes'][key] = []
-        self.data['notes'][key].append({
-            'note': note,
-            'date': datetime.now().isoformat()
+    @property
+    def quiz(self) -> List[Quiz]:
+        if callable(self._quiz):
+            self._quiz = self._quiz()
+        return self._quiz
+
+# Compiled curriculum pack: header, JSON module index, one JSON body per module
+CURRICULUM_MAGIC = b'RHCP'
+CURRICULUM_VERSION = 1
+CURRICULUM_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, index length
+LESSON_FIELDS = ('title', 'theory', 'example', 'commands', 'tips',
+                 'exam_question', 'exam_solution', 'practice_tasks')
+QUIZ_FIELDS = ('question', 'options', 'correct', 'explanation')
+
+def encode_curriculum(modules: List[Module]) -> bytes:
+    """Serialize modules into a curriculum pack"""
+    index = []
+    bodies = []
+    offset = 0
+    for module in modules:
+        body = json.dumps({
+            'lessons': [[getattr(l, f) for f in LESSON_FIELDS] for l in module.lessons],
+            'quiz': [[getattr(q, f) for f in QUIZ_FIELDS] for q in module.quiz]
+        }, separators=(',', ':')).encode('utf-8')
+        index.append({
+            'id': module.id,
+            'title': module.title,
+            'description': module.description,
+            'difficulty': module.difficulty,
+            'lesson_count': len(module.lessons),
+            'offset': offset,
+            'length': len(body)
         })
-        self.save_progress()
+        bodies.append(body)
+        offset += len(body)
+    raw_index = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    header = CURRICULUM_HEADER.pack(CURRICULUM_MAGIC, CURRICULUM_VERSION, 0, len(raw_index))
+    return header + raw_index + b''.join(bodies)
+
+class _PackedModuleBody:
+    """Decodes one module body from a curriculum pack on first use"""
+    def __init__(self, buf, start: int, length: int):
+        self._buf = buf
+        self._start = start
+        self._length = length
+        self._body = None
     
-    def get_module_progress(self, module_id: str, total_lessons: int) -> Dict:
-        """Get progress for a specific module"""
-        if module_id not in self.data['modules']:
-            return {'completed': 0, 'total': total_lessons, 'percentage': 0}
-        
-        completed = len(self.data['modules'][module_id]['completed_lessons'])
-        return {
-            'completed': completed,
-            'total': total_lessons,
-            'percentage': (completed / total_lessons * 100) if total_lessons > 0 else 0
-        }
+    def _load(self) -> Dict:
+        if self._body is None:
+            self._body = json.loads(self._buf[self._start:self._start + self._length].decode('utf-8'))
+        return self._body
     
-    def get_overall_progress(self, total_modules: int) -> Dict:
-        """Get overall progress"""
-        completed_modules = sum(1 for m in self.data['modules'].values() 
-                               if m.get('quiz_completed', False))
-        return {
-            'completed_modules': completed_modules,
-            'total_modules': total_modules,
-            'percentage': (completed_modules / total_modules * 100) if total_modules > 0 else 0,
-            'total_lessons_completed': len(self.data['completed_lessons'])
-        }
+    def lessons(self) -> List[Lesson]:
+        return [Lesson(*fields) for fields in self._load()['lessons']]
+    
+    def quiz(self) -> List[Quiz]:
+        return [Quiz(*fields) for fields in self._load()['quiz']]
+
+def decode_curriculum(buf) -> List[Module]:
+    """Build lazily loaded modules from a curriculum pack buffer"""
+    magic, version, _, index_len = CURRICULUM_HEADER.unpack_from(buf, 0)
+    if magic != CURRICULUM_MAGIC or version != CURRICULUM_VERSION:
+        raise ValueError("Not a compatible curriculum pack")
+    start = CURRICULUM_HEADER.size
+    index = json.loads(buf[start:start + index_len].decode('utf-8'))
+    base = start + index_len
+    modules = []
+    for entry in index:
+        body = _PackedModuleBody(buf, base + entry['offset'], entry['length'])
+        modules.append(Module(entry['id'], entry['title'], entry['description'],
+                              entry['difficulty'], body.lessons, body.quiz,
+                              lesson_count=entry['lesson_count']))
+    return modules
+
+def open_curriculum(path: str) -> List[Module]:
+    """Memory-map a curriculum pack from disk"""
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return decode_curriculum(buf)
 
 class RHCSAAcademy:
     """Main application class"""
     
-    def __init__(self):
-        self.progress = ProgressTracker()
-        self.modules = self.load_curriculum()
+    PRACTICE_SIZE = 10   # questions per practice session
+    NEW_PER_SESSION = 5  # never-seen questions added when few are due
+    
+    def __init__(self, timings: Timings = None, progress=None, reviews_file: str = DEFAULT_DECK,
+                 analytics_file: str = DEFAULT_STATE, answer_log: str = DEFAULT_LOG):
+        self.timings = timings
+        self.progress = progress or ProgressTracker(background=True)
+        self.reviews_file = reviews_file
+        self.analytics_file = analytics_file
+        self.answer_log = answer_log
+        self.reviews: Optional[ReviewScheduler] = None
+        self.modules = self.load_modules()
+        self.modules_by_id = {m.id: m for m in self.modules}
+        self.search_index = None
+        self.fuzzy_index = None
+        self.question_bank = None
         self.current_module = None
         self.current_lesson = None
     
+    def load_modules(self) -> List[Module]:
+        """Load the curriculum from the compiled cache, rebuilding it when this source changes"""
+        return load_cached(
+            'curriculum', source_hash(__file__), '.pack',
+            build=lambda: encode_curriculum(self.load_curriculum()),
+            load=open_curriculum, fallback=decode_curriculum, timings=self.timings)
+    
     def load_curriculum(self) -> List[Module]:
-        """Load all learning modules based on real exam content"""
+        """Build the full curriculum from source (compiled into the cached pack by load_modules)"""
         return [
             # Module 1: System Recovery and Boot Process
             Module(
@@ -1022,7 +1048,7 @@ KEY POINTS:
             print_separator()
             
             for idx, module in enumerate(self.modules, 1):
-                progress = self.progress.get_module_progress(module.id, len(module.lessons))
+                progress = self.progress.get_module_progress(module.id, module.lesson_count)
                 
                 # Color code by difficulty
                 diff_color = Colors.RED if module.difficulty == "Critical" else Colors.YELLOW
@@ -1061,16 +1087,18 @@ KEY POINTS:
             print_colored(f"  {module.description}", Colors.CYAN)
             print_separator()
             
-            progress = self.progress.get_module_progress(module.id, len(module.lessons))
+            progress = self.progress.get_module_progress(module.id, module.lesson_count)
             print_colored(f"\n  Progress: {progress['completed']}/{progress['total']} lessons completed", Colors.GREEN)
             
             print("\n  LESSONS:\n")
+            bookmarked = {b['lesson_index'] for b in self.progress.get_bookmarks(module.id)}
             for idx, lesson in enumerate(module.lessons):
-                completed = f"{module.id}_{idx}" in self.progress.data['completed_lessons']
+                completed = self.progress.is_lesson_complete(module.id, idx)
                 status = "✓" if completed else " "
-                print(f"  [{status}] {idx + 1}. {lesson.title}")
+                marker = " 🔖" if idx in bookmarked else ""
+                print(f"  [{status}] {idx + 1}. {lesson.title}{marker}")
             
-            print(f"\n  [{'✓' if module.id in self.progress.data['quiz_scores'] else ' '}] {len(module.lessons) + 1}. 🎯 Module Quiz")
+            print(f"\n  [{'✓' if self.progress.get_quiz_score(module.id) else ' '}] {len(module.lessons) + 1}. 🎯 Module Quiz")
             
             print("\n" + "═" * 70)
             print("\n  Options:")
@@ -1184,33 +1212,39 @@ KEY POINTS:
         
         score = 0
         total = len(module.quiz)
+        deck = self.review_deck()
         
-        for idx, quiz in enumerate(module.quiz, 1):
-            print(f"\n  Question {idx} of {total}:")
-            print(f"  {quiz.question}\n")
-            
-            for option in quiz.options:
-                print(f"  {option}")
-            
-            answer = input("\n  Your answer (A/B/C/D): ").strip().upper()
-            
-            correct_letter = ['A', 'B', 'C', 'D'][quiz.correct]
-            
-            if answer == correct_letter:
-                score += 1
-                print_colored("\n  ✓ Correct!", Colors.GREEN)
-            else:
-                print_colored(f"\n  ✗ Wrong! Correct answer: {correct_letter}", Colors.RED)
-            
-            print_colored(f"\n  💡 Explanation: {quiz.explanation}", Colors.CYAN)
-            
-            if idx < total:
-                wait_for_enter()
-                clear_screen()
-                print_banner()
-                print_separator()
-                print_colored(f"  🎯 {module.title} - QUIZ", Colors.BOLD)
-                print_separator()
+        try:
+            for idx, quiz in enumerate(module.quiz, 1):
+                print(f"\n  Question {idx} of {total}:")
+                print(f"  {quiz.question}\n")
+                
+                for option in quiz.options:
+                    print(f"  {option}")
+                
+                answer = input("\n  Your answer (A/B/C/D): ").strip().upper()
+                
+                correct_letter = ['A', 'B', 'C', 'D'][quiz.correct]
+                # Every answer schedules the question for Practice Quiz
+                deck.review(('quiz', module.id, idx - 1), answer == correct_letter)
+                
+                if answer == correct_letter:
+                    score += 1
+                    print_colored("\n  ✓ Correct!", Colors.GREEN)
+                else:
+                    print_colored(f"\n  ✗ Wrong! Correct answer: {correct_letter}", Colors.RED)
+                
+                print_colored(f"\n  💡 Explanation: {quiz.explanation}", Colors.CYAN)
+                
+                if idx < total:
+                    wait_for_enter()
+                    clear_screen()
+                    print_banner()
+                    print_separator()
+                    print_colored(f"  🎯 {module.title} - QUIZ", Colors.BOLD)
+                    print_separator()
+        finally:
+            save_deck(self.reviews_file, deck)
         
         # Save score
         self.progress.save_quiz_score(module.id, score, total)
@@ -1227,7 +1261,103 @@ KEY POINTS:
             print_colored("\n  👍 Good job! Consider reviewing incorrect answers.", Colors.YELLOW)
         else:
             print_colored("\n  📚 Keep studying! Review the lessons and try again.", Colors.RED)
+        if score < total:
+            print_colored("  Missed questions come back in Practice Quiz (option 5) when due.", Colors.CYAN)
+        
+        wait_for_enter()
+    
+    def review_deck(self) -> ReviewScheduler:
+        """The spaced-repetition deck, loaded on first use"""
+        if self.reviews is None:
+            self.reviews = load_deck(self.reviews_file)
+        return self.reviews
+    
+    def practice_item(self, key):
+        """The Quiz or bank question a review card refers to, or None if it is gone"""
+        kind, ref, index = key
+        if kind == 'quiz':
+            module = self.modules_by_id.get(ref)
+            if module and index < len(module.quiz):
+                return module.quiz[index]
+            return None
+        bank = self.load_question_bank()
+        if ref == bank_ref(bank) and index < len(bank):
+            return bank.get(index)
+        return None
+    
+    def new_practice_keys(self):
+        """Keys of every quiz and Millionaire question, in curriculum order"""
+        for module in self.modules:
+            for index in range(len(module.quiz)):
+                yield ('quiz', module.id, index)
+        bank = self.load_question_bank()
+        ref = bank_ref(bank)
+        for qid in range(len(bank)):
+            yield ('question', ref, qid)
+    
+    def practice_quiz(self):
+        """Spaced-repetition practice over module quizzes and Millionaire questions"""
+        clear_screen()
+        print_banner()
+        print_separator()
+        print_colored("  🎯 PRACTICE QUIZ MODE", Colors.BOLD)
+        print_separator()
+        
+        deck = self.review_deck()
+        now = int(time.time())
+        due = deck.due(now, self.PRACTICE_SIZE, accept=lambda key: self.practice_item(key) is not None)
+        items = [card.key for card in due]
+        for key in self.new_practice_keys():
+            if len(items) >= self.PRACTICE_SIZE or len(items) - len(due) >= self.NEW_PER_SESSION:
+                break
+            if key not in deck:
+                items.append(key)
+        
+        if not items:
+            print("\n  Nothing is due for review. Come back later!")
+            wait_for_enter()
+            return
+        print(f"\n  {len(due)} due for review, {len(items) - len(due)} new")
         
+        score = 0
+        try:
+            for idx, key in enumerate(items, 1):
+                item = self.practice_item(key)
+                source = (self.modules_by_id[key[1]].title if key[0] == 'quiz'
+                          else f"Millionaire - {item.topic}")
+                print_colored(f"\n  Question {idx} of {len(items)} ({source}):", Colors.BOLD)
+                print(f"  {item.question}\n")
+                for option in item.options:
+                    print(f"  {option}")
+                
+                answer = input("\n  Your answer (A/B/C/D): ").strip().upper()
+                correct_letter = ['A', 'B', 'C', 'D'][item.correct]
+                card = deck.review(key, answer == correct_letter)
+                
+                if answer == correct_letter:
+                    score += 1
+                    print_colored(f"\n  ✓ Correct! Next review in {card.interval:g} "
+                                  f"day{'' if card.interval == 1 else 's'}", Colors.GREEN)
+                else:
+                    print_colored(f"\n  ✗ Wrong! Correct answer: {correct_letter}", Colors.RED)
+                    print_colored(f"  It will come back in {(card.due - card.reviewed) // 60} minutes", Colors.YELLOW)
+                print_colored(f"\n  💡 Explanation: {item.explanation}", Colors.CYAN)
+                
+                if idx < len(items):
+                    wait_for_enter()
+                    clear_screen()
+                    print_banner()
+                    print_separator()
+                    print_colored("  🎯 PRACTICE QUIZ MODE", Colors.BOLD)
+                    print_separator()
+        finally:
+            save_deck(self.reviews_file, deck)
+        
+        print("\n" + "═" * 70)
+        print_colored(f"\n  PRACTICE COMPLETE! Score: {score}/{len(items)}", Colors.BOLD)
+        upcoming = deck.due(now + DAY, limit=1000)
+        print_colored(f"  Due in the next 24 hours: {len(upcoming)}"
+                      f"{'+' if len(upcoming) == 1000 else ''}", Colors.CYAN)
         wait_for_enter()
     
     def show_progress_dashboard(self):
@@ -1243,11 +1373,13 @@ KEY POINTS:
         print(f"\n  🎯 Overall Completion: {overall['percentage']:.1f}%")
         print(f"  📚 Modules Completed: {overall['completed_modules']}/{overall['total_modules']}")
         print(f"  📖 Total Lessons Completed: {overall['total_lessons_completed']}")
+        if overall['quiz_average'] is not None:
+            print(f"  🎯 Average Quiz Score: {overall['quiz_average']:.1f}%")
         
         print("\n  📈 Module-by-Module Progress:\n")
         
         for module in self.modules:
-            progress = self.progress.get_module_progress(module.id, len(module.lessons))
+            progress = self.progress.get_module_progress(module.id, module.lesson_count)
             bar_length = 30
             filled = int(bar_length * progress['percentage'] / 100)
             bar = "█" * filled + "░" * (bar_length - filled)
@@ -1257,26 +1389,167 @@ KEY POINTS:
             print_colored(f"  [{bar}] {progress['percentage']:.0f}%", color)
             
             # Quiz score if available
-            if module.id in self.progress.data['quiz_scores']:
-                quiz = self.progress.data['quiz_scores'][module.id]
+            quiz = self.progress.get_quiz_score(module.id)
+            if quiz:
                 print_colored(f"  Quiz: {quiz['score']}/{quiz['total']} ({quiz['percentage']:.1f}%)", Colors.CYAN)
             print()
         
         print("═" * 70)
         
-        if self.progress.data['bookmarks']:
-            print(f"\n  🔖 Bookmarks: {len(self.progress.data['bookmarks'])}")
+        if self.analytics_file:
+            self.show_topic_trends()
+        
+        bookmark_count = self.progress.get_bookmark_count()
+        if bookmark_count:
+            print(f"\n  🔖 Bookmarks: {bookmark_count}")
         
-        if self.progress.data['notes']:
-            print(f"  📝 Notes: {sum(len(notes) for notes in self.progress.data['notes'].values())}")
+        note_count = self.progress.get_note_count()
+        if note_count:
+            print(f"  📝 Notes: {note_count}")
         
-        started = datetime.fromisoformat(self.progress.data['started_at'])
+        activity = self.progress.get_activity()
+        started = datetime.fromisoformat(activity['started_at'])
         print(f"\n  📅 Started: {started.strftime('%Y-%m-%d %H:%M')}")
-        last = datetime.fromisoformat(self.progress.data['last_accessed'])
+        last = datetime.fromisoformat(activity['last_accessed'])
         print(f"  🕐 Last Accessed: {last.strftime('%Y-%m-%d %H:%M')}")
         
         wait_for_enter()
     
+    def show_topic_trends(self):
+        """Lifetime accuracy and weekly trend per topic, from module quizzes and Millionaire games"""
+        analytics = refresh(self.analytics_file, self.answer_log,
+                            ((m.id, m.title, self.progress.get_quiz_score(m.id)) for m in self.modules))
+        if not analytics.topics:
+            return
+        print("\n  📈 Topic Trends (all quizzes and Millionaire games):\n")
+        for topic in sorted(analytics.topics):
+            correct, total = analytics.lifetime(topic)
+            percentage = correct / total * 100 if total else 0
+            color = Colors.GREEN if percentage >= 70 else Colors.YELLOW if percentage >= 50 else Colors.RED
+            print_colored(f"  {topic[:40]:.<40} {trend_label(analytics, topic)}", color)
+        print("\n" + "═" * 70)
+    
+    def load_search_index(self) -> SearchIndex:
+        """Load the search index on first use, rebuilding it only when content changes"""
+        if self.search_index is None:
+            self.search_index = load_cached(
+                'search', source_hash(__file__, rhcsa_search.__file__), '.json',
+                build=lambda: SearchIndex.build(self.modules).to_bytes(),
+                load=SearchIndex.load, fallback=SearchIndex.from_bytes, timings=self.timings)
+        return self.search_index
+    
+    def load_question_bank(self):
+        """Open the RHCSA Millionaire question bank on first use"""
+        if self.question_bank is None:
+            import rhcsa_questions
+            self.question_bank = rhcsa_questions.open_bank(timings=self.timings)
+        return self.question_bank
+    
+    def load_fuzzy_index(self) -> TrigramIndex:
+        """Load the trigram index over commands and Millionaire questions"""
+        if self.fuzzy_index is None:
+            import rhcsa_questions
+            bank = self.load_question_bank()
+            self.fuzzy_index = load_cached(
+                'trigrams',
+                source_hash(__file__, rhcsa_search.__file__, rhcsa_questions.__file__,
+                            rhcsa_bank.__file__),
+                '.tgi',
+                build=lambda: TrigramIndex.build(self.modules, bank).to_bytes(),
+                load=TrigramIndex.load, fallback=TrigramIndex.from_bytes, timings=self.timings)
+        return self.fuzzy_index
+    
+    def search_content(self):
+        """Search lessons and quizzes, with typo-tolerant command and question matches"""
+        while True:
+            clear_screen()
+            print_banner()
+            print_separator()
+            print_colored("  🔍 SEARCH CONTENT", Colors.BOLD)
+            print_separator()
+            
+            query = input("\n  Search for (e.g. 'chcon -Z', '/etc/fstab') or 'b' to go back: ").strip()
+            if not query or query.lower() == 'b':
+                break
+            
+            index = self.load_search_index()
+            fuzzy = self.load_fuzzy_index()
+            start = time.perf_counter()
+            ranked = index.search(query)
+            close = fuzzy.lookup(query)
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            modules = self.modules_by_id
+            # (kind, module id or question id, position, label)
+            results = [doc for _, doc in ranked if doc[1] in modules]
+            seen = {(kind, module_id, position) for kind, module_id, position, _ in results}
+            for _, target in close:
+                if target[0] == 'lesson':
+                    kind, module_id, position = target
+                    if module_id in modules and target not in seen:
+                        results.append((kind, module_id, position, modules[module_id].lessons[position].title))
+                else:
+                    question = self.load_question_bank().get(target[1])
+                    results.append(('question', target[1], -1, question.question))
+            
+            if not results:
+                print_colored(f"\n  No results for '{query}'", Colors.YELLOW)
+                wait_for_enter()
+                continue
+            
+            print_colored(f"\n  {len(results)} results ({elapsed:.1f} ms)\n", Colors.CYAN)
+            for n, (kind, key, position, title) in enumerate(results, 1):
+                if kind == 'question':
+                    print(f"  {n}. 🎮 Millionaire: {title}")
+                    continue
+                label = "📖 Lesson" if kind == 'lesson' else "🎯 Quiz"
+                print(f"  {n}. {label}: {title}")
+                print_colored(f"     {modules[key].title}", Colors.CYAN)
+            
+            choice = input("\n  Open result (number) or press Enter for a new search: ").strip()
+            try:
+                result_idx = int(choice) - 1
+            except ValueError:
+                continue
+            if 0 <= result_idx < len(results):
+                kind, key, position, _ = results[result_idx]
+                if kind == 'lesson':
+                    self.study_lesson(modules[key], position)
+                elif kind == 'quiz':
+                    self.show_quiz_question(modules[key], position)
+                else:
+                    self.show_bank_question(key)
+    
+    def show_bank_question(self, qid: int):
+        """Display a RHCSA Millionaire question with its answer"""
+        question = self.load_question_bank().get(qid)
+        clear_screen()
+        print_banner()
+        print_separator()
+        print_colored(f"  🎮 Millionaire question [{question.difficulty.upper()}] - {question.topic}", Colors.BOLD)
+        print_separator()
+        print(f"\n  {question.question}\n")
+        for option in question.options:
+            print(f"  {option}")
+        print_colored(f"\n  ✓ Correct answer: {['A', 'B', 'C', 'D'][question.correct]}", Colors.GREEN)
+        print_colored(f"\n  💡 Explanation: {question.explanation}", Colors.CYAN)
+        wait_for_enter()
+    
+    def show_quiz_question(self, module: Module, quiz_idx: int):
+        """Display a single quiz question with its answer"""
+        quiz = module.quiz[quiz_idx]
+        clear_screen()
+        print_banner()
+        print_separator()
+        print_colored(f"  🎯 {module.title} - Quiz question {quiz_idx + 1}", Colors.BOLD)
+        print_separator()
+        print(f"\n  {quiz.question}\n")
+        for option in quiz.options:
+            print(f"  {option}")
+        print_colored(f"\n  ✓ Correct answer: {['A', 'B', 'C', 'D'][quiz.correct]}", Colors.GREEN)
+        print_colored(f"\n  💡 Explanation: {quiz.explanation}", Colors.CYAN)
+        wait_for_enter()
+    
     def show_bookmarks(self):
         """Display user bookmarks"""
         clear_screen()
@@ -1285,13 +1558,14 @@ KEY POINTS:
         print_colored("  🔖 YOUR BOOKMARKS", Colors.BOLD)
         print_separator()
         
-        if not self.progress.data['bookmarks']:
+        bookmarks = self.progress.get_bookmarks()
+        if not bookmarks:
             print("\n  No bookmarks yet. Bookmark lessons as you study!")
             wait_for_enter()
             return
         
-        for idx, bookmark in enumerate(self.progress.data['bookmarks'], 1):
-            module = next((m for m in self.modules if m.id == bookmark['module_id']), None)
+        for idx, bookmark in enumerate(bookmarks, 1):
+            module = self.modules_by_id.get(bookmark['module_id'])
             if module and bookmark['lesson_index'] < len(module.lessons):
                 lesson = module.lessons[bookmark['lesson_index']]
                 print(f"\n  {idx}. {module.title} - {lesson.title}")
@@ -1329,11 +1603,9 @@ KEY POINTS:
                 print_colored("\n  📝 Notes feature - viewing all notes...", Colors.CYAN)
                 wait_for_enter()
             elif choice == '5':
-                print_colored("\n  🎯 Practice quiz mode coming soon!", Colors.YELLOW)
-                wait_for_enter()
+                self.practice_quiz()
             elif choice == '6':
-                print_colored("\n  🔍 Search feature coming soon!", Colors.YELLOW)
-                wait_for_enter()
+                self.search_content()
             elif choice == '7':
                 self.show_about()
             elif choice == '8':
@@ -1385,14 +1657,66 @@ KEY POINTS:
         """)
         wait_for_enter()
 
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="RHCSA Academy - EX200 learning platform")
+    parser.add_argument('--timings', action='store_true',
+                        help="report cache hits/misses and load times on exit")
+    parser.add_argument('--db', metavar='PATH',
+                        help="store progress in a shared SQLite database instead of rhcsa_progress.json")
+    parser.add_argument('--user', help="learner name in the --db database (default: login name)")
+    parser.add_argument('--import-json', metavar='FILE',
+                        help="import an existing progress JSON file into the --db database, then exit")
+    parser.add_argument('--reviews', metavar='PATH', default=DEFAULT_DECK,
+                        help=f"spaced-repetition deck shared with RHCSA Millionaire (default: {DEFAULT_DECK})")
+    parser.add_argument('--analytics', metavar='PATH', default=DEFAULT_STATE,
+                        help=f"per-topic trend stats shared with RHCSA Millionaire, '' to disable "
+                             f"(default: {DEFAULT_STATE})")
+    parser.add_argument('--answer-log', metavar='PATH', default=DEFAULT_LOG,
+                        help=f"RHCSA Millionaire answer log counted in the topic trends; use the same "
+                             f"--answer-log as the game (default: {DEFAULT_LOG})")
+    parser.add_argument('--compact-progress', action='store_true',
+                        help="save rhcsa_progress.json snapshots in the compact binary encoding")
+    args = parser.parse_args(argv)
+    if args.db and args.compact_progress:
+        parser.error("--compact-progress applies to rhcsa_progress.json and cannot be used with --db")
+    return args
+
 def main():
     """Main entry point"""
+    args = parse_args()
+    timings = Timings() if args.timings else None
+    if args.db:
+        progress = SQLiteProgressTracker(args.db, args.user)
+    elif args.compact_progress:
+        progress = ProgressTracker(background=True, compact=True)
+    else:
+        progress = None
+    
+    if args.import_json:
+        if not args.db:
+            print_colored("  --import-json requires --db", Colors.RED)
+            sys.exit(2)
+        if progress.import_json(args.import_json):
+            print_colored(f"  Imported {args.import_json} for user {progress.user}", Colors.GREEN)
+        else:
+            print_colored(f"  {args.import_json} was already imported for user {progress.user}", Colors.YELLOW)
+        progress.close()
+        return
+    
+    academy = None
     try:
-        academy = RHCSAAcademy()
+        academy = RHCSAAcademy(timings=timings, progress=progress, reviews_file=args.reviews,
+                               analytics_file=args.analytics, answer_log=args.answer_log)
         academy.run()
     except KeyboardInterrupt:
         print_colored("\n\n  Session interrupted. Your progress has been saved!", Colors.YELLOW)
         sys.exit(0)
+    finally:
+        if academy:
+            academy.progress.close()
+        if timings:
+            timings.report()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+RHCSA Analytics - Per-topic accuracy across every game and quiz
+
+TopicAnalytics folds two sources into per-topic (correct, total) counts:
+
+    the RHCSA Millionaire answer log (see rhcsa_answerlog)
+    RHCSA Academy module quiz scores, one module being one topic
+
+Each topic keeps a lifetime count plus day and week buckets (local dates,
+weeks starting on Monday) for trends. Folding is incremental: the state
+remembers its position in the answer log and the date of each quiz score it
+has counted, so a refresh reads only what was added since the last one and
+showing lifetime numbers never walks the raw history. Skipped questions are
+not counted. Only the latest score of each module quiz is kept by the
+progress tracker, so a quiz retaken twice between refreshes counts once.
+
+The state is a small derived file (rhcsa_topics.stats): if it is lost or
+damaged, or the log it followed changes, it is rebuilt from the log. With
+the position it keeps a mark of the log segment the position is in (see
+segment_mark), so a log deleted or truncated and started again under the
+same name is noticed too.
+"""
+
+import json
+import time
+import zlib
+import struct
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rhcsa_answerlog import DEFAULT_LOG, START, Position, follow_events, segment_mark
+from rhcsa_storage import atomic_write
+
+DEFAULT_STATE = 'rhcsa_topics.stats'
+
+STATE_MAGIC = b'RHTA'
+STATE_VERSION = 2
+STATE_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, crc32 of the uncompressed body
+
+PERIODS = ('day', 'week')
+DAYS_KEPT = 35
+WEEKS_KEPT = 52
+
+Counts = Tuple[int, int]  # (correct, total)
+
+
+def bucket(period: str, when: float) -> int:
+    """Day or week number of a unix time; consecutive buckets differ by one"""
+    ordinal = date.fromtimestamp(when).toordinal()
+    return ordinal if period == 'day' else (ordinal - 1) // 7
+
+
+class TopicStats:
+    """Counts for one topic: lifetime and per day and week"""
+    __slots__ = ('correct', 'total', 'day', 'week')
+
+    def __init__(self):
+        self.correct = 0
+        self.total = 0
+        self.day: Dict[int, List[int]] = {}
+        self.week: Dict[int, List[int]] = {}
+
+    def add(self, correct: int, total: int, when: float):
+        self.correct += correct
+        self.total += total
+        for period in PERIODS:
+            counts = getattr(self, period).setdefault(bucket(period, when), [0, 0])
+            counts[0] += correct
+            counts[1] += total
+
+    def lifetime(self) -> Counts:
+        return self.correct, self.total
+
+    def trend(self, period: str = 'week', count: int = 4, now: Optional[float] = None) -> List[Counts]:
+        """Counts for the last count periods up to now, oldest first (empty ones are (0, 0))"""
+        buckets = getattr(self, period)
+        last = bucket(period, time.time() if now is None else now)
+        return [tuple(buckets.get(n, (0, 0))) for n in range(last - count + 1, last + 1)]
+
+    def prune(self):
+        """Drop day and week buckets too old to be shown"""
+        for period, kept in (('day', DAYS_KEPT), ('week', WEEKS_KEPT)):
+            buckets = getattr(self, period)
+            if len(buckets) > kept:
+                newest = max(buckets)
+                for n in [n for n in buckets if n <= newest - kept]:
+                    del buckets[n]
+
+
+class TopicAnalytics:
+    """Per-topic accuracy folded incrementally from answer logs and quiz scores"""
+
+    def __init__(self, log_path: str = DEFAULT_LOG):
+        self.log_path = log_path
+        self.position: Position = START
+        self.mark: Optional[int] = None  # segment_mark of the position's segment
+        self.quizzes: Dict[str, str] = {}  # module id -> date of the score counted
+        self.topics: Dict[str, TopicStats] = {}
+
+    def add(self, topic: str, correct: int, total: int, when: float):
+        """Count correct out of total answers on topic at unix time when"""
+        stats = self.topics.get(topic)
+        if stats is None:
+            stats = self.topics[topic] = TopicStats()
+        stats.add(correct, total, when)
+
+    def fold_log(self) -> int:
+        """Count every answer logged since the last fold; returns how many events were read"""
+        read = 0
+        for self.position, event in follow_events(self.log_path, self.position):
+            read += 1
+            if event.get('correct') is not None and event.get('topic'):
+                self.add(event['topic'], 1 if event['correct'] else 0, 1, event['ts'])
+        if read:
+            self.mark = segment_mark(self.log_path, self.position[0])
+        return read
+
+    def fold_quizzes(self, scores: Iterable[Tuple[str, str, Optional[Dict]]]) -> int:
+        """Count (module id, topic, quiz score) entries not counted before
+
+        A score is the dict the progress trackers keep ('score', 'total' and
+        an ISO 'date'); None means the quiz was never taken. Returns how many
+        scores were new.
+        """
+        added = 0
+        for module_id, topic, quiz in scores:
+            if not quiz or self.quizzes.get(module_id) == quiz['date']:
+                continue
+            when = datetime.fromisoformat(quiz['date']).timestamp()
+            self.add(topic, quiz['score'], quiz['total'], when)
+            self.quizzes[module_id] = quiz['date']
+            added += 1
+        return added
+
+    def lifetime(self, topic: str) -> Counts:
+        stats = self.topics.get(topic)
+        return stats.lifetime() if stats else (0, 0)
+
+    def trend(self, topic: str, period: str = 'week', count: int = 4,
+              now: Optional[float] = None) -> List[Counts]:
+        stats = self.topics.get(topic)
+        return stats.trend(period, count, now) if stats else [(0, 0)] * count
+
+    def encode(self) -> bytes:
+        """Compact binary form of the state; see decode"""
+        topics = {}
+        for topic, stats in self.topics.items():
+            stats.prune()
+            topics[topic] = [stats.correct, stats.total] + [
+                [value for n, counts in sorted(getattr(stats, period).items()) for value in (n, *counts)]
+                for period in PERIODS
+            ]
+        body = json.dumps({'log': self.log_path, 'position': list(self.position), 'mark': self.mark,
+                           'quizzes': self.quizzes, 'topics': topics},
+                          separators=(',', ':')).encode('utf-8')
+        return STATE_HEADER.pack(STATE_MAGIC, STATE_VERSION, 0, zlib.crc32(body)) + zlib.compress(body, 6)
+
+    @classmethod
+    def decode(cls, buf: bytes) -> 'TopicAnalytics':
+        """Inverse of encode; raises ValueError if buf is damaged"""
+        if len(buf) < STATE_HEADER.size:
+            raise ValueError("analytics state is truncated")
+        magic, version, _, crc = STATE_HEADER.unpack_from(buf, 0)
+        if magic != STATE_MAGIC or version != STATE_VERSION:
+            raise ValueError("Not a compatible analytics state")
+        try:
+            body = zlib.decompress(buf[STATE_HEADER.size:])
+        except zlib.error as e:
+            raise ValueError(f"corrupt analytics state ({e})")
+        if zlib.crc32(body) != crc:
+            raise ValueError("checksum mismatch")
+
+        data = json.loads(body)
+        analytics = cls(data['log'])
+        analytics.position = tuple(data['position'])
+        analytics.mark = data['mark']
+        analytics.quizzes = data['quizzes']
+        for topic, (correct, total, *periods) in data['topics'].items():
+            stats = analytics.topics[topic] = TopicStats()
+            stats.correct, stats.total = correct, total
+            for period, flat in zip(PERIODS, periods):
+                getattr(stats, period).update(
+                    (flat[i], [flat[i + 1], flat[i + 2]]) for i in range(0, len(flat), 3))
+        return analytics
+
+
+def load_analytics(path: str, log_path: str = DEFAULT_LOG) -> TopicAnalytics:
+    """Read the state for log_path; a missing, damaged or mismatched file starts over
+
+    Mismatched means made for another path, or for a log that has since been
+    replaced: the segment its position points into no longer starts with
+    the line it did.
+    """
+    try:
+        with open(path, 'rb') as f:
+            analytics = TopicAnalytics.decode(f.read())
+    except (OSError, ValueError):
+        return TopicAnalytics(log_path)
+    if analytics.log_path != log_path or (
+            analytics.position != START
+            and segment_mark(log_path, analytics.position[0]) != analytics.mark):
+        return TopicAnalytics(log_path)
+    return analytics
+
+
+def refresh(path: str = DEFAULT_STATE, log_path: str = DEFAULT_LOG,
+            quizzes: Iterable[Tuple[str, str, Optional[Dict]]] = ()) -> TopicAnalytics:
+    """Load the state, fold in new answers and quiz scores, and save it if anything changed
+
+    Another program saving at the same time can only undo a fold, never
+    double-count: each saved state holds its counts together with the log
+    position and quiz dates they came from.
+    """
+    analytics = load_analytics(path, log_path)
+    if analytics.fold_log() + analytics.fold_quizzes(quizzes):
+        try:
+            atomic_write(path, analytics.encode())
+        except OSError:
+            pass  # the counts are still right in memory; the next refresh retries
+    return analytics
+
+
+def sparkline(counts: List[Counts]) -> str:
+    """One block per period, its height the accuracy; '·' where nothing was answered"""
+    blocks = '▁▂▃▄▅▆▇█'
+    return ''.join('·' if not total else blocks[min(7, correct * 8 // total)]
+                   for correct, total in counts)
+
+
+def trend_label(analytics: TopicAnalytics, topic: str, now: Optional[float] = None,
+                weeks: int = 4) -> str:
+    """'lifetime 72% of 140  4w ▃▅▆█' for a topic, or '' if it has no history"""
+    correct, total = analytics.lifetime(topic)
+    if not total:
+        return ''
+    return (f"lifetime {correct / total * 100:.0f}% of {total}  "
+            f"{weeks}w {sparkline(analytics.trend(topic, 'week', weeks, now))}")
+
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+RHCSA Answer Log - Append-only history of every RHCSA Millionaire answer
+
+Each answer (or skip) is one JSON object per line:
+
+    {"ts": 1760668800.5, "session": "3f2a9c0e51b7d4a8", "qid": 12, "bank": "a7d3e0f1",
+     "topic": "SELinux", "difficulty": "medium", "number": 7, "answer": "B",
+     "correct": false, "lifelines": ["5050"], "seconds": 8.42}
+
+"answer" is "SKIPPED" (and "correct" null) for a skipped question. Lines go
+to rhcsa_answers.jsonl; once it passes max_bytes it is renamed to
+rhcsa_answers.jsonl.<n>, with n counting up from 1, and then compressed to
+rhcsa_answers.jsonl.<n>.gz. Writers in several processes serialise on a
+lock file (where fcntl exists), so rotation never loses or splits a line;
+only the rename happens under the lock, compression after it is released.
+With background=True, append only queues the line and a writer thread does
+the file work, so an asyncio server never blocks on the disk.
+
+read_events() walks the compressed segments oldest first and then the live
+file as a generator, so analysis over millions of answers holds one line in
+memory at a time. follow_events() does the same from a saved position and
+yields the position after each event, for consumers that resume where they
+left off.
+"""
+
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import zlib
+import queue
+import shutil
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking, one writer at a time
+    fcntl = None
+
+DEFAULT_LOG = 'rhcsa_answers.jsonl'
+MAX_BYTES = 8 * 1024 * 1024
+
+# (segment number, byte offset in its uncompressed text); the live file's
+# segment number is the one it will get when rotated
+Position = Tuple[int, int]
+START: Position = (0, 0)
+
+
+def segments(path: str) -> List[Tuple[int, str]]:
+    """Rotated segments of a log as (number, path), oldest first
+
+    A segment renamed but not yet compressed is listed by its plain name;
+    once its .gz exists that is listed instead.
+    """
+    pattern = re.compile(re.escape(os.path.basename(path)) + r'\.(\d+)(\.gz)?$')
+    found = {}
+    for name in glob.glob(glob.escape(path) + '.*'):
+        match = pattern.match(os.path.basename(name))
+        if match and (match.group(2) or int(match.group(1)) not in found):
+            found[int(match.group(1))] = name
+    return sorted(found.items())
+
+
+def compress_segments(path: str):
+    """Compress every rotated segment still waiting for it
+
+    Safe to run in several processes at once: each writes its own temporary
+    file and the identical results replace one another.
+    """
+    for number, name in segments(path):
+        if name.endswith('.gz'):
+            continue
+        tmp = f"{name}.gz.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(name, 'rb') as src, gzip.open(tmp, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp, name + '.gz')
+            os.unlink(name)
+        except FileNotFoundError:
+            pass  # another writer finished it first
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+class AnswerLog:
+    """Appends answer events to a JSONL file, rotating and compressing it by size"""
+
+    def __init__(self, path: str = DEFAULT_LOG, max_bytes: int = MAX_BYTES, background: bool = False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock_file = path + '.lock'
+        self._file = None
+        self._lock_fd = None
+        self._io_lock = threading.Lock()
+        self._queue = queue.SimpleQueue() if background else None
+        self._writer = None
+
+    def append(self, event: Dict):
+        """Write one event as a line, rotating first if the file is full
+
+        In background mode the line is queued for the writer thread and
+        written in order with the others; close() waits for it.
+        """
+        line = json.dumps(event, separators=(',', ':')).encode('utf-8') + b'\n'
+        if self._queue is None:
+            self._write([line])
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._drain, name='answer-log', daemon=True)
+            self._writer.start()
+        self._queue.put(line)
+
+    def _drain(self):
+        """Writer thread: write whatever has queued up, until close() queues None"""
+        while True:
+            lines = [self._queue.get()]
+            while not self._queue.empty():
+                lines.append(self._queue.get())
+            done = lines[-1] is None
+            try:
+                self._write([line for line in lines if line is not None])
+            except OSError as e:
+                print(f"Warning: {len(lines) - done} answer(s) could not be logged ({e})", file=sys.stderr)
+            if done:
+                return
+
+    def _write(self, lines: List[bytes]):
+        rotated = False
+        with self._io_lock:
+            self._lock()
+            try:
+                for line in lines:
+                    f = self._open()
+                    if f.tell() and f.tell() + len(line) > self.max_bytes:
+                        self._rotate()
+                        rotated = True
+                        f = self._open()
+                    f.write(line)
+                f.flush()
+            finally:
+                self._unlock()
+        if rotated:
+            compress_segments(self.path)
+
+    def _open(self):
+        """The live file, reopened if another process rotated it away"""
+        if self._file is not None:
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._file.fileno()).st_ino:
+                    return self._file
+            except FileNotFoundError:
+                pass
+            self._file.close()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        return self._file
+
+    def _rotate(self):
+        """Rename the live file to the next numbered segment; _write compresses it"""
+        existing = segments(self.path)
+        number = existing[-1][0] + 1 if existing else 1
+        self._file.close()
+        self._file = None
+        os.replace(self.path, f"{self.path}.{number}")
+
+    def _lock(self):
+        if fcntl is not None:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+
+    def _unlock(self):
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def close(self):
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+
+def follow_events(path: str, position: Position = START) -> Iterator[Tuple[Position, Dict]]:
+    """Yield (position after it, event) for every event after position
+
+    A line still being written (no newline yet) is left for the next call;
+    a line that does not parse is skipped.
+    """
+    number, offset = position
+    while True:
+        rotated = dict(segments(path))
+        live = max(rotated, default=0) + 1
+        if number < live and number not in rotated:
+            # START, or a segment since deleted: go on from the next one there is
+            number, offset = min((n for n in rotated if n > number), default=live), 0
+        if number in rotated:
+            try:
+                f = _open_segment(rotated[number])
+            except FileNotFoundError:
+                continue  # compressed between listing and opening: list again
+            yield from _read_segment(f, number, offset)
+            number, offset = number + 1, 0
+            continue
+        if number != live:
+            return
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return
+        # Rotated between listing and opening: what we opened is the next file
+        if max(dict(segments(path)), default=0) >= number:
+            f.close()
+            continue
+        yield from _read_segment(f, number, offset)
+        return
+
+
+def segment_mark(path: str, number: int) -> Optional[int]:
+    """CRC-32 of the first line of segment number, or None if it has none
+
+    Saved with a Position it identifies the log the position belongs to: a
+    log deleted or truncated and started again begins with other lines.
+    """
+    rotated = dict(segments(path))
+    name = rotated.get(number, path if number == max(rotated, default=0) + 1 else None)
+    if name is None:
+        return None
+    try:
+        with _open_segment(name) as f:
+            line = f.readline()
+    except (OSError, EOFError):
+        return None
+    return zlib.crc32(line) if line.endswith(b'\n') else None
+
+
+def _open_segment(name: str):
+    return gzip.open(name, 'rb') if name.endswith('.gz') else open(name, 'rb')
+
+
+def _read_segment(f, number: int, offset: int) -> Iterator[Tuple[Position, Dict]]:
+    with f:
+        if offset:
+            f.seek(offset)
+        pos = offset
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            pos += len(line)
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            yield (number, pos), event
+
+
+def read_events(path: str = DEFAULT_LOG) -> Iterator[Dict]:
+    """Every logged event, oldest first, read lazily"""
+    for _, event in follow_events(path):
+        yield event
+
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+RHCSA Question Bank - Indexed on-disk storage for RHCSA Millionaire questions
+
+A bank file is laid out as:
+
+    header        magic, format version, question count, metadata length
+    metadata      JSON with the difficulty/topic tables and the stratum index
+    offset table  count + 1 fixed-width record offsets
+    records       one packed record per question
+    item table    IRT (discrimination, location) per question, then every id
+                  with its location sorted by location; starts at the last
+                  offset-table entry
+
+Records are sorted by (difficulty, topic) when the bank is written, so every
+stratum is a contiguous run of question ids and the index only needs to store
+(difficulty, topic, first id, count) for each one. Sampling a game therefore
+touches the header plus the handful of records that were drawn.
+
+Bank files are memory-mapped read-only, so opening one costs a header parse
+and concurrent game processes share the mapped pages.
+
+The item table holds two-parameter logistic (2PL) item response theory
+parameters. Until questions are calibrated from answer data they default to
+the difficulty tier (DEFAULT_ITEM_PARAMS); banks written before the table
+existed get the same defaults, built in memory when first needed.
+"""
+
+import io
+import json
+import mmap
+import random
+import struct
+import sys
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Callable, Container, Deque, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b'RHQB'
+FORMAT_VERSION = 1
+
+# magic, version, reserved, question count, metadata length
+HEADER = struct.Struct('<4sHHII')
+OFFSET = struct.Struct('<Q')
+# correct option, difficulty code, topic code
+RECORD_HEAD = struct.Struct('<BBH')
+STRING_LEN = struct.Struct('<I')
+
+ITEM = struct.Struct('<ff')          # discrimination a, location b
+ITEM_ORDER = struct.Struct('<If')    # id, location; sorted by location
+
+DIFFICULTY_ORDER = ['easy', 'medium', 'hard']
+# 2PL (a, b) for uncalibrated questions of each tier, and for unknown tiers
+DEFAULT_ITEM_PARAMS = {'easy': (1.0, -1.0), 'medium': (1.0, 0.0), 'hard': (1.0, 1.0)}
+DEFAULT_ITEM = (1.0, 0.0)
+
+
+class BankError(ValueError):
+    """Raised when a question bank file is missing or malformed"""
+
+
+class Question:
+    """Represents a single trivia question
+
+    Difficulty and topic are interned so a large pool shares one copy of each.
+    """
+    __slots__ = ('question', 'options', 'correct', 'difficulty', 'topic', 'hint', 'explanation')
+
+    def __init__(self, question: str, options: List[str], correct: int,
+                 difficulty: str, topic: str, hint: str, explanation: str):
+        self.question = question
+        self.options = options
+        self.correct = correct
+        self.difficulty = sys.intern(difficulty)
+        self.topic = sys.intern(topic)
+        self.hint = hint
+        self.explanation = explanation
+
+
+OPTION_LETTERS = ('A', 'B', 'C', 'D')
+def _difficulty_key(difficulty: str) -> Tuple[int, str]:
+    """Sort known difficulties in game order, anything else afterwards"""
+    if difficulty in DIFFICULTY_ORDER:
+        return (DIFFICULTY_ORDER.index(difficulty), difficulty)
+    return (len(DIFFICULTY_ORDER), difficulty)
+
+
+def _pack_string(text: str) -> bytes:
+    raw = text.encode('utf-8')
+    return STRING_LEN.pack(len(raw)) + raw
+
+
+def encode_items(params: List[Tuple[float, float]]) -> bytes:
+    """Encode per-id (a, b) pairs as an item table"""
+    table = b''.join(ITEM.pack(a, b) for a, b in params)
+    # Round-trip through float32 so the sorted locations match the table
+    located = sorted((ITEM.unpack(ITEM.pack(0, b))[1], qid) for qid, (_, b) in enumerate(params))
+    return table + b''.join(ITEM_ORDER.pack(qid, b) for b, qid in located)
+
+
+def encode_bank(questions: List[Question],
+                item_params: Optional[List[Tuple[float, float]]] = None) -> bytes:
+    """Encode questions into the indexed bank format
+
+    item_params gives calibrated 2PL (a, b) per question, in the order of
+    questions; without it every question gets its tier's default.
+    """
+    difficulties = sorted({q.difficulty for q in questions}, key=_difficulty_key)
+    topics = sorted({q.topic for q in questions})
+    diff_codes = {d: i for i, d in enumerate(difficulties)}
+    topic_codes = {t: i for i, t in enumerate(topics)}
+
+    if item_params is None:
+        item_params = [DEFAULT_ITEM_PARAMS.get(q.difficulty, DEFAULT_ITEM) for q in questions]
+    elif len(item_params) != len(questions):
+        raise BankError("item_params needs one (a, b) pair per question")
+    order = sorted(range(len(questions)),
+                   key=lambda i: (diff_codes[questions[i].difficulty], topic_codes[questions[i].topic]))
+    ordered = [questions[i] for i in order]
+
+    strata = []
+    records = []
+    for qid, q in enumerate(ordered):
+        if len(q.options) != 4:
+            raise BankError(f"Question {q.question!r} must have exactly 4 options")
+        key = (diff_codes[q.difficulty], topic_codes[q.topic])
+        if strata and (strata[-1][0], strata[-1][1]) == key:
+            strata[-1][3] += 1
+        else:
+            strata.append([key[0], key[1], qid, 1])
+
+        parts = [RECORD_HEAD.pack(q.correct, key[0], key[1])]
+        for text in [q.question] + list(q.options) + [q.hint, q.explanation]:
+            parts.append(_pack_string(text))
+        records.append(b''.join(parts))
+
+    fields = {
+        'difficulties': difficulties,
+        'topics': topics,
+        'strata': strata,
+        'items': True,
+    }
+    # The fingerprint is fixed-width hex, so its value does not move the offsets
+    meta_len = len(json.dumps(dict(fields, fingerprint='0' * 8), separators=(',', ':')).encode('utf-8'))
+
+    base = HEADER.size + meta_len + OFFSET.size * (len(records) + 1)
+    offsets = []
+    position = base
+    for record in records:
+        offsets.append(position)
+        position += len(record)
+    offsets.append(position)
+
+    body = io.BytesIO()
+    for offset in offsets:
+        body.write(OFFSET.pack(offset))
+    for record in records:
+        body.write(record)
+    body.write(encode_items([item_params[i] for i in order]))
+    body = body.getvalue()
+
+    fingerprint = zlib.crc32(body, zlib.crc32(json.dumps(fields, separators=(',', ':')).encode('utf-8')))
+    meta = json.dumps(dict(fields, fingerprint=f"{fingerprint:08x}"), separators=(',', ':')).encode('utf-8')
+    return HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(records), len(meta)) + meta + body
+
+
+def write_bank(path: str, questions: List[Question],
+               item_params: Optional[List[Tuple[float, float]]] = None):
+    """Write questions to a bank file"""
+    with open(path, 'wb') as f:
+        f.write(encode_bank(questions, item_params))
+
+
+class StratifiedIndex:
+    """Maps (difficulty, topic) to the contiguous run of ids holding that stratum
+
+    A selection (a difficulty plus an optional topic subset) is resolved once
+    into cumulative counts and cached, after which each draw is a bisect over
+    the selected strata rather than a scan of the pool.
+    """
+
+    CACHE_SIZE = 256
+
+    def __init__(self, strata: Iterable[Tuple[str, str, int, int]]):
+        self._ranges: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._topics: Dict[str, List[str]] = {}
+        for difficulty, topic, first, n in strata:
+            self._ranges[(difficulty, topic)] = (first, n)
+            self._topics.setdefault(difficulty, []).append(topic)
+        self._selections: Dict[Tuple, Tuple[List[int], List[int]]] = {}
+
+    def strata(self, difficulty: str) -> List[Tuple[str, int, int]]:
+        """Return (topic, first id, count) for every stratum of a difficulty"""
+        return [(topic,) + self._ranges[(difficulty, topic)]
+                for topic in self._topics.get(difficulty, [])]
+
+    def topics(self, difficulty: str) -> List[str]:
+        return list(self._topics.get(difficulty, []))
+
+    def _selection(self, difficulty: str, topics: Optional[Iterable[str]]) -> Tuple[List[int], List[int]]:
+        """First ids and cumulative counts of the strata in a selection"""
+        key = (difficulty, None if topics is None else tuple(sorted(set(topics))))
+        selection = self._selections.get(key)
+        if selection is None:
+            firsts, cumulative = [], []
+            for topic in self._topics.get(difficulty, []) if key[1] is None else key[1]:
+                stratum = self._ranges.get((difficulty, topic))
+                if stratum:
+                    firsts.append(stratum[0])
+                    cumulative.append((cumulative[-1] if cumulative else 0) + stratum[1])
+            if len(self._selections) >= self.CACHE_SIZE:
+                self._selections.clear()
+            selection = self._selections[key] = (firsts, cumulative)
+        return selection
+
+    def count(self, difficulty: str, topics: Optional[Iterable[str]] = None) -> int:
+        cumulative = self._selection(difficulty, topics)[1]
+        return cumulative[-1] if cumulative else 0
+
+    def sample(self, difficulty: str, k: int, topics: Optional[Iterable[str]] = None,
+               exclude: Optional[Container[int]] = None, rng: random.Random = None) -> List[int]:
+        """Draw up to k distinct ids of one difficulty, optionally from given topics
+
+        Ids in exclude are rejected as they are drawn, so the cost depends on k
+        and on how much of the selection is excluded, not on the pool size.
+        Only when rejections run out of budget (the selection is almost all
+        excluded) are the remaining ids enumerated.
+        """
+        rng = rng or random
+        firsts, cumulative = self._selection(difficulty, topics)
+        total = cumulative[-1] if cumulative else 0
+        k = min(k, total)
+
+        def id_at(position: int) -> int:
+            i = bisect_right(cumulative, position)
+            return firsts[i] + position - (cumulative[i - 1] if i else 0)
+
+        if not exclude:
+            return [id_at(p) for p in rng.sample(range(total), k)]
+
+        picked: List[int] = []
+        tried = set()
+        budget = 4 * k + 32
+        while len(picked) < k and budget > 0 and len(tried) < total:
+            budget -= 1
+            position = rng.randrange(total)
+            if position in tried:
+                continue
+            tried.add(position)
+            qid = id_at(position)
+            if qid not in exclude:
+                picked.append(qid)
+
+        if len(picked) < k:
+            chosen = set(picked)
+            remaining = []
+            for i, first in enumerate(firsts):
+                n = cumulative[i] - (cumulative[i - 1] if i else 0)
+                remaining += [qid for qid in range(first, first + n)
+                              if qid not in exclude and qid not in chosen]
+            picked += rng.sample(remaining, min(k - len(picked), len(remaining)))
+        return picked
+
+
+class ItemIndex:
+    """IRT parameters by id, plus ids ordered by location for nearest lookups
+
+    Reads the fixed-width item table in place, so opening it costs nothing
+    and each lookup is a bisect over the sorted locations.
+    """
+
+    def __init__(self, buf, start: int, count: int):
+        self._buf = buf
+        self._start = start
+        self._order_start = start + ITEM.size * count
+        self.count = count
+        if len(buf) < self._order_start + ITEM_ORDER.size * count:
+            raise BankError("Question bank item table is truncated")
+
+    def params(self, qid: int) -> Tuple[float, float]:
+        """(discrimination, location) of a question"""
+        return ITEM.unpack_from(self._buf, self._start + qid * ITEM.size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, position: int) -> float:
+        """Location at a sorted position (lets bisect search the table)"""
+        return ITEM_ORDER.unpack_from(self._buf, self._order_start + position * ITEM_ORDER.size)[1]
+
+    def id_at(self, position: int) -> int:
+        return ITEM_ORDER.unpack_from(self._buf, self._order_start + position * ITEM_ORDER.size)[0]
+
+    def nearest(self, target: float, accept: Callable[[int], bool],
+                rng: random.Random = None, width: float = 0.25) -> Optional[int]:
+        """An accepted id with location close to target, or None if none is left
+
+        Draws at random among the ids within width of target, so questions
+        sharing a location take turns, and doubles the window whenever a
+        few draws find nothing acceptable.
+        """
+        rng = rng or random
+        while True:
+            lo = bisect_left(self, target - width)
+            hi = bisect_right(self, target + width)
+            if lo < hi:
+                for _ in range(8):
+                    qid = self.id_at(rng.randrange(lo, hi))
+                    if accept(qid):
+                        return qid
+            if lo == 0 and hi == self.count:
+                break
+            width *= 2
+        # Nearly everything is excluded: settle it with one pass
+        best = None
+        for position in range(self.count):
+            qid = self.id_at(position)
+            if accept(qid):
+                distance = abs(self[position] - target)
+                if best is None or distance < best[0]:
+                    best = (distance, qid)
+        return best[1] if best else None
+
+
+class RecentQuestions:
+    """Question ids dealt in the last N sessions, with O(1) membership
+
+    Pass an instance as exclude to QuestionBank.sample to avoid repeats.
+    """
+
+    def __init__(self, sessions: int):
+        self._sessions: Deque[List[int]] = deque()
+        self._counts: Dict[int, int] = {}
+        self.limit = sessions
+
+    def __contains__(self, qid: int) -> bool:
+        return qid in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def history(self) -> List[List[int]]:
+        """Ids of each remembered session, oldest first"""
+        return [list(ids) for ids in self._sessions]
+
+    def add_session(self, ids: Iterable[int]):
+        """Record the ids dealt in one session, forgetting the oldest session"""
+        ids = list(ids)
+        self._sessions.append(ids)
+        for qid in ids:
+            self._counts[qid] = self._counts.get(qid, 0) + 1
+        while len(self._sessions) > self.limit:
+            for qid in self._sessions.popleft():
+                if self._counts[qid] == 1:
+                    del self._counts[qid]
+                else:
+                    self._counts[qid] -= 1
+
+
+class LazyQuestion:
+    """Question backed by a bank record
+
+    The fixed-width head (correct option, difficulty, topic) is unpacked
+    eagerly; the text fields are decoded from the underlying buffer the first
+    time they are read, i.e. when the question is actually displayed.
+    """
+    __slots__ = ('id', 'correct', 'difficulty', 'topic', '_buf', '_start', '_fields')
+
+    def __init__(self, qid: int, buf, start: int, difficulty: str, topic: str, correct: int):
+        self.id = qid
+        self.correct = correct
+        self.difficulty = difficulty
+        self.topic = topic
+        self._buf = buf
+        self._start = start
+        self._fields = None
+
+    def _field(self, index: int) -> str:
+        if self._fields is None:
+            self._fields = [None] * 7
+        value = self._fields[index]
+        if value is None:
+            pos = self._start + RECORD_HEAD.size
+            for _ in range(index):
+                (length,) = STRING_LEN.unpack_from(self._buf, pos)
+                pos += STRING_LEN.size + length
+            (length,) = STRING_LEN.unpack_from(self._buf, pos)
+            pos += STRING_LEN.size
+            value = self._buf[pos:pos + length].decode('utf-8')
+            self._fields[index] = value
+        return value
+
+    @property
+    def question(self) -> str:
+        return self._field(0)
+
+    @property
+    def options(self) -> List[str]:
+        return [self._field(i) for i in range(1, 5)]
+
+    @property
+    def hint(self) -> str:
+        return self._field(5)
+
+    @property
+    def explanation(self) -> str:
+        return self._field(6)
+
+
+class QuestionBank:
+    """Read-only view over an indexed question bank
+
+    The bank is accessed through a buffer: a read-only memory map for files on
+    disk, so every game process on a host shares the same page-cache copy, or
+    plain bytes for banks built in memory. Only the header and metadata are
+    parsed up front; records are located through the offset table on demand.
+    """
+
+    def __init__(self, buf, owner=None):
+        self._buf = buf
+        self._owner = owner
+        if len(buf) < HEADER.size:
+            raise BankError("Question bank is truncated")
+        magic, version, _, count, meta_len = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise BankError("Not a question bank file")
+        if version != FORMAT_VERSION:
+            raise BankError(f"Unsupported question bank version {version}")
+
+        try:
+            meta = json.loads(buf[HEADER.size:HEADER.size + meta_len].decode('utf-8'))
+        except ValueError as e:
+            raise BankError(f"Corrupt question bank metadata: {e}")
+
+        self.count = count
+        self._fingerprint = int(meta['fingerprint'], 16) if 'fingerprint' in meta else None
+        self.difficulties = meta['difficulties']
+        self.topics = meta['topics']
+        self._table_start = HEADER.size + meta_len
+        if len(buf) < self._table_start + OFFSET.size * (count + 1):
+            raise BankError("Question bank offset table is truncated")
+
+        self.index = StratifiedIndex(
+            (self.difficulties[d], self.topics[t], first, n) for d, t, first, n in meta['strata'])
+        self._items: Optional[ItemIndex] = None
+        if meta.get('items'):
+            (end,) = OFFSET.unpack_from(buf, self._table_start + count * OFFSET.size)
+            self._items = ItemIndex(buf, end, count)
+
+    @classmethod
+    def open(cls, path: str) -> 'QuestionBank':
+        """Memory-map a bank file from disk"""
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BankError(f"Cannot open question bank {path}: {e}")
+        try:
+            return cls(mapped, owner=mapped)
+        except BankError:
+            mapped.close()
+            raise
+
+    @classmethod
+    def from_questions(cls, questions: List[Question]) -> 'QuestionBank':
+        """Build an in-memory bank from Question objects"""
+        return cls(encode_bank(questions))
+
+    def close(self):
+        """Release the mapping; questions already handed out become unusable"""
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def fingerprint(self) -> int:
+        """CRC-32 of the whole bank: metadata, records and item parameters
+
+        Ids saved against one bank only mean the same questions in a bank
+        with the same fingerprint; any edit to a question changes it.
+        encode_bank stores it in the metadata, so reading it costs nothing;
+        for banks written before that it is computed over the whole buffer.
+        """
+        if self._fingerprint is None:
+            with memoryview(self._buf) as view:
+                self._fingerprint = zlib.crc32(view)
+        return self._fingerprint
+
+    @property
+    def items(self) -> ItemIndex:
+        """IRT item parameters; tier defaults for banks written without them"""
+        if self._items is None:
+            params = [DEFAULT_ITEM] * self.count
+            for difficulty in self.difficulties:
+                for _, first, n in self.index.strata(difficulty):
+                    params[first:first + n] = [DEFAULT_ITEM_PARAMS.get(difficulty, DEFAULT_ITEM)] * n
+            self._items = ItemIndex(encode_items(params), 0, self.count)
+        return self._items
+
+    def strata(self, difficulty: str) -> List[Tuple[str, int, int]]:
+        """Return (topic, first id, count) for every stratum of a difficulty"""
+        return self.index.strata(difficulty)
+
+    def count_for(self, difficulty: str, topics: Optional[Iterable[str]] = None) -> int:
+        """Number of questions of the given difficulty, optionally limited to topics"""
+        return self.index.count(difficulty, topics)
+
+    def sample(self, difficulty: str, k: int, topics: Optional[Iterable[str]] = None,
+               exclude: Optional[Container[int]] = None, rng: random.Random = None) -> List[int]:
+        """Draw up to k distinct question ids; see StratifiedIndex.sample"""
+        return self.index.sample(difficulty, k, topics, exclude, rng)
+
+    def get(self, qid: int) -> LazyQuestion:
+        """Return a lazily decoded question by id"""
+        if not 0 <= qid < self.count:
+            raise IndexError(f"Question id {qid} out of range")
+        (start,) = OFFSET.unpack_from(self._buf, self._table_start + qid * OFFSET.size)
+        correct, diff_code, topic_code = RECORD_HEAD.unpack_from(self._buf, start)
+        return LazyQuestion(qid, self._buf, start, self.difficulties[diff_code],
+                            self.topics[topic_code], correct)
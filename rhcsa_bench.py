@@ -0,0 +1,716 @@
+#!/usr/bin/env python3
+"""
+RHCSA Benchmarks - Performance checks for RHCSA Academy and RHCSA Millionaire
+
+Run a single benchmark by name, e.g.:
+
+    python3 rhcsa_bench.py startup
+"""
+
+import gc
+import os
+import random
+import sys
+import json
+import time
+import asyncio
+import argparse
+import subprocess
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+import multiprocessing
+from array import array
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from rhcsa_academy import (Lesson, Module, Quiz, RHCSAAcademy, decode_curriculum, encode_curriculum,
+                           open_curriculum)
+from rhcsa_bank import BankError, OPTION_LETTERS, Question, QuestionBank, RecentQuestions, encode_bank
+from rhcsa_progress import ProgressTracker, apply_event, compute_stats, decode_progress, encode_progress, new_progress
+
+
+def timed(fn: Callable, repeat: int = 5) -> float:
+    """Best wall time of fn() in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def synthetic_curriculum(n_modules: int, lazy: bool, lessons_per_module: int = 3,
+                         body_size: int = 4096) -> List[Module]:
+    """Build a curriculum of n_modules shaped like the real one"""
+    body = "x" * body_size
+
+    def lessons():
+        return [
+            Lesson(f"Lesson {i}", body, body, ["cmd --flag"] * 8, ["tip"] * 5,
+                   body, body, ["task"] * 4)
+            for i in range(lessons_per_module)
+        ]
+
+    def quiz():
+        return [Quiz("question?", ["A: a", "B: b", "C: c", "D: d"], 1, body)
+                for _ in range(5)]
+
+    return [
+        Module(f"module_{m:04d}", f"Module {m}", "description", "Essential",
+               lessons if lazy else lessons(), quiz if lazy else quiz(),
+               lesson_count=lessons_per_module)
+        for m in range(n_modules)
+    ]
+
+
+def bench_startup(args):
+    """Time to main menu: build the curriculum and read titles and lesson counts"""
+    def menu(modules):
+        return [(m.title, m.lesson_count) for m in modules]
+
+    print(f"  {'modules':>8} {'eager ms':>10} {'lazy ms':>10} {'speedup':>8}")
+    for n in args.sizes or [10, 100, 1000]:
+        eager = timed(lambda: menu(synthetic_curriculum(n, lazy=False)))
+        lazy = timed(lambda: menu(synthetic_curriculum(n, lazy=True)))
+        print(f"  {n:>8} {eager:>10.2f} {lazy:>10.2f} {eager / lazy:>7.1f}x")
+
+    # The real curriculum: built from source vs read from the compiled pack
+    academy = RHCSAAcademy.__new__(RHCSAAcademy)
+    pack = encode_curriculum(academy.load_curriculum())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'curriculum.pack')
+        with open(path, 'wb') as f:
+            f.write(pack)
+        source = timed(lambda: menu(academy.load_curriculum()))
+        decoded = timed(lambda: menu(decode_curriculum(pack)))
+        mapped = timed(lambda: menu(open_curriculum(path)))
+    print(f"\n  {'builtin':>8} {'source ms':>10} {'pack ms':>10} {'mmap ms':>10}")
+    print(f"  {str(len(academy.load_curriculum())) + ' mod':>8} {source:>10.3f} {decoded:>10.3f} {mapped:>10.3f}")
+
+
+class DictQuestion:
+    """The original __dict__-based Question, kept as the memory baseline"""
+    def __init__(self, question, options, correct, difficulty, topic, hint, explanation):
+        self.question = question
+        self.options = options
+        self.correct = correct
+        self.difficulty = difficulty
+        self.topic = topic
+        self.hint = hint
+        self.explanation = explanation
+
+
+# question, 4 options, hint, explanation
+QUESTION_TEXT_FIELDS = 7
+
+
+class QuestionColumns:
+    """Array-backed question pool, the most compact in-memory layout measured
+
+    The game itself reads questions from a memory-mapped QuestionBank; this
+    pool is the in-process columnar alternative the memory benchmark compares
+    against __dict__ and __slots__ objects.
+
+    Each question is a row: difficulty and topic are stored as small integer
+    codes, the correct option in a byte array, and all text as UTF-8 in one
+    shared buffer addressed through an offset array. Option strings lose their
+    standard "A: " prefix on the way in and get it back on the way out.
+    """
+
+    def __init__(self):
+        self.difficulties: List[str] = []
+        self.topics: List[str] = []
+        self._difficulty_codes: Dict[str, int] = {}
+        self._topic_codes: Dict[str, int] = {}
+        self.difficulty = array('B')
+        self.topic = array('H')
+        self.correct = array('B')
+        # bit i set when option i carried the standard letter prefix
+        self._prefixed = array('B')
+        self._text = bytearray()
+        self._offsets = array('Q', [0])
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+    @staticmethod
+    def _code(value: str, table: List[str], codes: Dict[str, int], limit: int) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = len(table)
+            if code >= limit:
+                raise BankError(f"Too many distinct values for {value!r}")
+            table.append(value)
+            codes[value] = code
+        return code
+
+    def _push(self, text: str):
+        self._text += text.encode('utf-8')
+        self._offsets.append(len(self._text))
+
+    def add(self, question: str, options: List[str], correct: int, difficulty: str,
+            topic: str, hint: str, explanation: str) -> int:
+        """Append one question and return its row number"""
+        if len(options) != 4:
+            raise BankError(f"Question {question!r} must have exactly 4 options")
+        self.difficulty.append(self._code(difficulty, self.difficulties,
+                                          self._difficulty_codes, 1 << 8))
+        self.topic.append(self._code(topic, self.topics, self._topic_codes, 1 << 16))
+        self.correct.append(correct)
+
+        self._push(question)
+        prefixed = 0
+        for i, option in enumerate(options):
+            prefix = OPTION_LETTERS[i] + ': '
+            if option.startswith(prefix):
+                prefixed |= 1 << i
+                option = option[len(prefix):]
+            self._push(option)
+        self._prefixed.append(prefixed)
+        self._push(hint)
+        self._push(explanation)
+        return len(self.correct) - 1
+
+    def _field(self, row: int, index: int) -> str:
+        slot = row * QUESTION_TEXT_FIELDS + index
+        return self._text[self._offsets[slot]:self._offsets[slot + 1]].decode('utf-8')
+
+    def get(self, row: int) -> Question:
+        """Materialise one row as a Question"""
+        prefixed = self._prefixed[row]
+        options = []
+        for i in range(4):
+            option = self._field(row, 1 + i)
+            if prefixed & (1 << i):
+                option = OPTION_LETTERS[i] + ': ' + option
+            options.append(option)
+        return Question(self._field(row, 0), options, self.correct[row],
+                        self.difficulties[self.difficulty[row]],
+                        self.topics[self.topic[row]],
+                        self._field(row, 5), self._field(row, 6))
+
+
+def synthetic_questions(n: int) -> Iterator[Tuple]:
+    """Question fields as a parser would produce them: fresh strings per record"""
+    difficulties = ['easy', 'medium', 'hard']
+    # ''.join copies, so difficulty and topic are not shared between records
+    for i in range(n):
+        yield (f"Which command configures item {i}?",
+               [f"A: cmd{i} --a", f"B: cmd{i} --b", f"C: cmd{i} --c", f"D: cmd{i} --d"],
+               i % 4, ''.join(difficulties[i % 3]), ''.join(f"Topic {i % 40}"),
+               f"Think about item {i}", f"cmd{i} --b is the documented way to configure item {i}.")
+
+
+def traced_size(build: Callable) -> int:
+    """Bytes still allocated by the object build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pool = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pool
+    return after - before
+
+
+def bench_memory(args):
+    """Resident size of a question pool per representation"""
+    ok = True
+    print(f"  {'questions':>10} {'dict MB':>9} {'slots MB':>9} {'columns MB':>11} {'B/q columns':>12}")
+    for n in args.sizes or [10_000, 100_000, 1_000_000]:
+        dict_size = traced_size(lambda: [DictQuestion(*f) for f in synthetic_questions(n)])
+        slots_size = traced_size(lambda: [Question(*f) for f in synthetic_questions(n)])
+
+        def columns():
+            pool = QuestionColumns()
+            for fields in synthetic_questions(n):
+                pool.add(*fields)
+            return pool
+
+        columns_size = traced_size(columns)
+        print(f"  {n:>10} {dict_size / 1e6:>9.1f} {slots_size / 1e6:>9.1f} "
+              f"{columns_size / 1e6:>11.1f} {columns_size / n:>12.0f}")
+        ok = ok and columns_size < slots_size < dict_size
+    sample = [Question(*fields) for fields in synthetic_questions(100)]
+    pool = QuestionColumns()
+    for q in sample:
+        pool.add(q.question, q.options, q.correct, q.difficulty, q.topic, q.hint, q.explanation)
+    fields = lambda q: [getattr(q, name) for name in Question.__slots__]
+    ok = ok and all(fields(pool.get(i)) == fields(q) for i, q in enumerate(sample))
+    if not ok:
+        print("  FAIL: compact representations did not reduce memory or did not round-trip")
+        return 1
+    return 0
+
+
+def bench_deal(args):
+    """Games dealt per second from a large bank, with topic filters and repeat exclusion"""
+    print(f"  {'questions':>10} {'plain/s':>10} {'topics/s':>10} {'recent/s':>10}")
+    for n in args.sizes or [10_000, 100_000]:
+        bank = QuestionBank(encode_bank([Question(*f) for f in synthetic_questions(n)]))
+        topics = [f"Topic {i}" for i in range(0, 40, 4)]
+        recent = RecentQuestions(sessions=50)
+
+        def deal(**kwargs):
+            ids = [qid for d in ('easy', 'medium', 'hard') for qid in bank.sample(d, 5, **kwargs)]
+            if kwargs.get('exclude') is not None:
+                recent.add_session(ids)
+
+        games = 2000
+        rates = []
+        for kwargs in ({}, {'topics': topics}, {'topics': topics, 'exclude': recent}):
+            ms = timed(lambda: [deal(**kwargs) for _ in range(games)], repeat=3)
+            rates.append(games / ms * 1000)
+        print(f"  {n:>10} {rates[0]:>10.0f} {rates[1]:>10.0f} {rates[2]:>10.0f}")
+
+
+def bench_adaptive(args):
+    """Ability estimate error after k questions, fixed 5/5/5 deal vs adaptive picks"""
+    from rhcsa_irt import probability
+    from rhcsa_engine import GameEngine
+
+    class Untimed(GameEngine):
+        LIVES = 99  # play all 15 so every checkpoint has an estimate
+
+    rng = random.Random(7)
+    checkpoints = (5, 10, 15)
+    players = 300
+    print(f"  {'questions':>10} {'mode':>9} " + ' '.join(f"{f'RMSE@{k}':>8}" for k in checkpoints)
+          + f" {'us/answer':>10}")
+    for n in args.sizes or [10_000, 100_000]:
+        fields = [Question(*f) for f in synthetic_questions(n)]
+        centre = {'easy': -1.0, 'medium': 0.0, 'hard': 1.0}
+        params = [(rng.uniform(0.8, 2.0), centre[q.difficulty] + rng.gauss(0, 0.6)) for q in fields]
+        bank = QuestionBank(encode_bank(fields, params))
+        for adaptive in (False, True):
+            errors = {k: 0.0 for k in checkpoints}
+            picks = 0.0
+            for player in range(players):
+                theta = rng.gauss(0, 1)
+                engine = Untimed(bank, adaptive=adaptive)
+                start = time.perf_counter()
+                engine.start(player)
+                picks += time.perf_counter() - start
+                while not engine.is_over():
+                    question = engine.current_question()
+                    correct = rng.random() < probability(theta, *bank.items.params(question.id))
+                    letter = OPTION_LETTERS[(question.correct + (not correct)) % len(OPTION_LETTERS)]
+                    start = time.perf_counter()
+                    engine.answer(letter)
+                    picks += time.perf_counter() - start
+                    if engine.current in errors:
+                        errors[engine.current] += (engine.estimate_ability().theta - theta) ** 2
+            rmse = ' '.join(f"{(errors[k] / players) ** 0.5:>8.3f}" for k in checkpoints)
+            per_pick = picks / (players * 15) * 1e6
+            print(f"  {n:>10} {'adaptive' if adaptive else 'fixed':>9} {rmse} {per_pick:>10.0f}")
+
+
+def bench_reviews(args):
+    """Spaced-repetition deck: next-due lookups, deck size on disk and load time"""
+    from rhcsa_srs import ReviewScheduler
+
+    rng = random.Random(3)
+    now = 1_700_000_000
+    print(f"  {'cards':>8} {'next+review us':>15} {'B/card':>7} {'load s':>7}")
+    for n in args.sizes or [100_000, 300_000]:
+        deck = ReviewScheduler()
+        for i in range(n):
+            key = ('question', 'synthetic', i) if i % 3 else ('quiz', f"module_{i % 20:02d}", i)
+            deck.review(key, rng.random() < 0.7, now - rng.randrange(30 * 86400))
+        steps = 0
+        start = time.perf_counter()
+        while steps < 2000:
+            due = deck.due(now, limit=1)
+            if not due:
+                break  # a small deck runs out of due cards
+            deck.review(due[0].key, rng.random() < 0.8, now)
+            steps += 1
+        per_step = (time.perf_counter() - start) / max(steps, 1) * 1e6
+        data = deck.encode()
+        load = timed(lambda: ReviewScheduler.decode(data), repeat=1) / 1000
+        print(f"  {n:>8} {per_step:>15.1f} {len(data) / n:>7.1f} {load:>7.2f}")
+
+
+def bench_answerlog(args):
+    """Answer log: append rate, compressed bytes per event and streaming read rate"""
+    from rhcsa_answerlog import AnswerLog, read_events, segments
+
+    rng = random.Random(5)
+    topics = ['SELinux', 'Storage Management', 'Networking', 'User Management', 'Containers']
+    print(f"  {'events':>9} {'append/s':>10} {'segments':>9} {'B/event':>8} {'read/s':>10}")
+    for n in args.sizes or [100_000, 1_000_000]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'answers.jsonl')
+            log = AnswerLog(path, max_bytes=1024 * 1024)
+            start = time.perf_counter()
+            for i in range(n):
+                log.append({'ts': 1_700_000_000 + i, 'session': f"{i // 15:016x}", 'qid': rng.randrange(57),
+                            'bank': '00000000', 'topic': rng.choice(topics), 'difficulty': 'medium',
+                            'number': i % 15 + 1, 'answer': 'ABCD'[i % 4], 'correct': rng.random() < 0.7,
+                            'lifelines': [], 'seconds': round(rng.uniform(2, 30), 2)})
+            log.close()
+            appended = time.perf_counter() - start
+            size = sum(os.path.getsize(name) for _, name in segments(path)) + os.path.getsize(path)
+            start = time.perf_counter()
+            count = sum(1 for _ in read_events(path))
+            read = time.perf_counter() - start
+            print(f"  {n:>9} {n / appended:>10.0f} {len(segments(path)):>9} {size / n:>8.1f} "
+                  f"{count / read:>10.0f}")
+            if count != n:
+                print(f"  FAIL: read back {count} of {n} events")
+                return 1
+    return 0
+
+
+def bench_analytics(args):
+    """Topic analytics: rebuilding from the whole answer log vs folding one new game"""
+    from rhcsa_analytics import load_analytics, refresh
+    from rhcsa_answerlog import AnswerLog
+
+    rng = random.Random(6)
+    topics = ['SELinux', 'Storage Management', 'Networking', 'User Management', 'Containers']
+    now = time.time()
+
+    def game(log: AnswerLog, start: float):
+        for number in range(1, 16):
+            log.append({'ts': start + number * 20, 'topic': rng.choice(topics), 'number': number,
+                        'answer': 'A', 'correct': rng.random() < 0.7, 'lifelines': []})
+
+    ok = True
+    print(f"  {'events':>9} {'rebuild s':>10} {'refresh ms':>11} {'state B':>8}")
+    for n in args.sizes or [100_000, 1_000_000]:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, 'answers.jsonl')
+            state = os.path.join(tmp, 'topics.stats')
+            log = AnswerLog(log_path, max_bytes=1024 * 1024)
+            for i in range(n // 15):
+                game(log, now - 200 * 86400 + i * 200 * 86400 * 15 / n)
+            start = time.perf_counter()
+            refresh(state, log_path)
+            rebuild = time.perf_counter() - start
+            game(log, now)
+            log.close()
+            start = time.perf_counter()
+            analytics = refresh(state, log_path)
+            incremental = time.perf_counter() - start
+            total = sum(analytics.lifetime(topic)[1] for topic in topics)
+            ok = ok and total == n // 15 * 15 + 15 and load_analytics(state, log_path).position == analytics.position
+            print(f"  {n:>9} {rebuild:>10.2f} {incremental * 1000:>11.2f} {os.path.getsize(state):>8}")
+    if not ok:
+        print("  FAIL: incremental counts disagree with the log")
+        return 1
+    return 0
+
+
+class RewriteTracker(ProgressTracker):
+    """The original tracker: every change rewrites the whole progress file in place"""
+    def record(self, op: str, **fields):
+        super().record(op, **fields)
+        with open(self.progress_file, 'w') as f:
+            json.dump(self.data, f, indent=2)
+
+    def _commit(self):
+        self._unsaved = []
+
+
+def histogram(samples: List[float], label: str):
+    """Print power-of-two millisecond buckets with p50/p99 for latency samples"""
+    samples = sorted(samples)
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"  {label}: p50 {p50:.3f} ms  p99 {p99:.3f} ms  max {samples[-1]:.3f} ms")
+    buckets = {}
+    for ms in samples:
+        bound = 0.0625
+        while ms > bound:
+            bound *= 2
+        buckets[bound] = buckets.get(bound, 0) + 1
+    for bound in sorted(buckets):
+        bar = '#' * max(1, round(50 * buckets[bound] / len(samples)))
+        print(f"    <= {bound:>8.4g} ms {buckets[bound]:>6} {bar}")
+
+
+def bench_latency(args):
+    """Keypress-to-prompt latency of lesson actions with each progress writer"""
+    trackers = [
+        ("rewrite (before)", lambda path: RewriteTracker(path)),
+        ("journal, synchronous", lambda path: ProgressTracker(path)),
+        ("journal, background writer", lambda path: ProgressTracker(path, background=True)),
+    ]
+    for n in args.sizes or [500]:
+        print(f"  {n} lesson actions in bursts of 3, on a file with {n} prior completions")
+        for label, make in trackers:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'progress.json')
+                tracker = ProgressTracker(path)
+                for i in range(n):
+                    tracker.mark_lesson_complete(f"history_{i // 50}", i % 50)
+                tracker.save_progress()
+                tracker.close()
+
+                tracker = make(path)
+                samples = []
+                for i in range(n):
+                    # study_lesson: mark complete, bookmark, take a note, then show the menu
+                    for action in (lambda: tracker.mark_lesson_complete('module', i),
+                                   lambda: tracker.add_bookmark('module', i),
+                                   lambda: tracker.add_note('module', i, "note")):
+                        start = time.perf_counter()
+                        action()
+                        samples.append((time.perf_counter() - start) * 1000)
+                tracker.close()
+                reloaded = ProgressTracker(path)
+                assert reloaded.data['seq'] == tracker.data['seq'], "lost progress events"
+            histogram(samples, label)
+
+
+def hammer(path: str, worker: int, actions: int):
+    """One session's worth of progress changes against a shared file"""
+    tracker = ProgressTracker(path, background=worker % 2 == 1)
+    for i in range(actions):
+        tracker.mark_lesson_complete(f"worker_{worker}", i)
+        tracker.add_bookmark(f"worker_{worker}", i)
+        if i % 10 == 0:
+            tracker.save_quiz_score(f"worker_{worker}", i % 6, 5)
+    tracker.close()
+
+
+def bench_contention(args):
+    """Many processes writing one progress file; fails if any update is lost"""
+    actions = 300
+    ok = True
+    print(f"  {'processes':>10} {'events':>8} {'seconds':>8} {'events/s':>9} {'lost':>6}")
+    for n in args.sizes or [2, 8, 16]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'progress.json')
+            workers = [multiprocessing.Process(target=hammer, args=(path, w, actions))
+                       for w in range(n)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+
+            data = ProgressTracker(path).data
+            expected = n * (2 * actions + (actions + 9) // 10)
+            lost = expected - data['seq']
+            for w in range(n):
+                module = data['modules'].get(f"worker_{w}", {'completed_lessons': []})
+                lost += actions - len(module['completed_lessons'])
+                lost += actions - sum(1 for b in data['bookmarks'] if b['module_id'] == f"worker_{w}")
+            if data['stats'] != compute_stats(data):
+                lost += 1
+            print(f"  {n:>10} {expected:>8} {elapsed:>8.2f} {expected / elapsed:>9.0f} {lost:>6}")
+            ok = ok and lost == 0 and all(w.exitcode == 0 for w in workers)
+    if not ok:
+        print("  FAIL: progress updates were lost")
+        return 1
+    return 0
+
+
+def synthetic_progress(n_events: int, seed: int = 0):
+    """A learner's progress dict after n_events random lesson actions"""
+    rng = random.Random(seed)
+    data = new_progress()
+    now = datetime(2024, 1, 15, 9, 0)
+    for seq in range(1, n_events + 1):
+        now += timedelta(seconds=rng.randrange(1, 3600), microseconds=rng.randrange(1000000))
+        module = f"module_{rng.randrange(20):02d}"
+        event = {'seq': seq, 'date': now.isoformat(), 'module_id': module,
+                 'lesson_index': rng.randrange(8)}
+        kind = rng.random()
+        if kind < 0.4:
+            event['op'] = 'lesson_complete'
+        elif kind < 0.55:
+            event.update(op='quiz_score', score=rng.randrange(6), total=5)
+        elif kind < 0.7:
+            event.update(op='bookmark', note=rng.choice(["", "review before exam"]))
+        else:
+            event.update(op='note', note=f"remember flag -{rng.choice('aZRv')} for item {seq}")
+        apply_event(data, event)
+    return data
+
+
+def bench_progress_size(args):
+    """Progress snapshot size and load time, JSON vs the compact encoding"""
+    ok = True
+    print(f"  {'events':>8} {'json KB':>9} {'compact KB':>11} {'json load ms':>13} {'compact load ms':>16}")
+    for n in args.sizes or [100, 1000, 10000]:
+        data = synthetic_progress(n)
+        text = json.dumps(data, indent=2).encode('utf-8')
+        packed = encode_progress(data)
+        ok = ok and decode_progress(packed) == data and json.loads(text) == data
+        json_ms = timed(lambda: json.loads(text.decode('utf-8')))
+        packed_ms = timed(lambda: decode_progress(packed))
+        print(f"  {n:>8} {len(text) / 1024:>9.1f} {len(packed) / 1024:>11.1f} "
+              f"{json_ms:>13.2f} {packed_ms:>16.2f}")
+    if not ok:
+        print("  FAIL: compact encoding did not round-trip")
+        return 1
+    return 0
+
+
+async def play_remote(address: str, seed: int, games: int, ready: List[int],
+                      go: 'asyncio.Event', latencies: List[float]):
+    """One client: deal a game, wait for the others, then play games to the end"""
+    reader, writer = await asyncio.open_unix_connection(address[len('unix:'):])
+    rng = random.Random(seed)
+
+    async def call(line: str) -> dict:
+        writer.write(line.encode('utf-8') + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    reply = await call(f"START {seed}")
+    ready.append(seed)
+    await go.wait()
+    for game in range(games):
+        if game:
+            reply = await call(f"START {seed + game}")
+        while reply.get('question'):
+            start = time.perf_counter()
+            reply = await call(f"ANSWER {rng.choice('ABCD')}")
+            latencies.append((time.perf_counter() - start) * 1000)
+    await call("QUIT")
+    writer.close()
+
+
+async def load_test(address: str, clients: int, games: int):
+    """Run clients concurrent players; returns (server stats at peak, final stats, latencies, seconds)"""
+    latencies: List[float] = []
+    ready: List[int] = []
+    go = asyncio.Event()
+    tasks = [asyncio.ensure_future(play_remote(address, 1000 * i, games, ready, go, latencies))
+             for i in range(clients)]
+    while len(ready) < clients:
+        if any(task.done() for task in tasks):
+            # A client failed before the start line; surface its exception
+            go.set()
+            await asyncio.gather(*tasks)
+        await asyncio.sleep(0.01)
+    reader, writer = await asyncio.open_unix_connection(address[len('unix:'):])
+
+    async def stats() -> dict:
+        writer.write(b"STATS\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    peak = await stats()
+    start = time.perf_counter()
+    go.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    final = await stats()
+    writer.close()
+    return peak, final, latencies, elapsed
+
+
+def bench_server(args):
+    """Concurrent remote games against one server process: capacity and answer latency"""
+    games = 3
+    print(f"  {'sessions':>8} {'answers':>8} {'answers/s':>10} {'server cpu':>11} "
+          f"{'sessions/core':>14} {'p50 ms':>8} {'p99 ms':>8} {'KB/session':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        address = 'unix:' + os.path.join(tmp, 'game.sock')
+        server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                'rhcsa_millionaire.py'), '--serve', address,
+                                   '--answer-log', os.path.join(tmp, 'answers.jsonl')],
+                                  stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(address[len('unix:'):]):
+                if server.poll() is not None:
+                    print("  FAIL: server did not start")
+                    return 1
+                time.sleep(0.05)
+            for n in args.sizes or [100, 1000]:
+                peak, final, latencies, elapsed = asyncio.run(load_test(address, n, games))
+                cpu = final['cpu_seconds'] - peak['cpu_seconds']
+                latencies.sort()
+                p50 = latencies[len(latencies) // 2]
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                # Concurrent sessions one fully busy core would carry at this pace
+                per_core = n * elapsed / cpu if cpu else float('inf')
+                print(f"  {n:>8} {len(latencies):>8} {len(latencies) / elapsed:>10.0f} {cpu:>10.2f}s "
+                      f"{per_core:>14.0f} {p50:>8.2f} {p99:>8.2f} {peak['bytes_per_session'] / 1024:>11.1f}")
+        finally:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+def bench_snapshot(args):
+    """Game server memory with every session resident vs evicted to snapshots"""
+    from rhcsa_engine import GameEngine
+    from rhcsa_questions import open_bank
+    from rhcsa_server import GameServer, Session
+
+    async def each(step, sessions):
+        for session in sessions:
+            await step(session)
+
+    bank = open_bank()
+    ok = True
+    print(f"  {'sessions':>8} {'resident MB':>12} {'evicted MB':>11} {'snapshot B':>11} "
+          f"{'evict us':>9} {'restore us':>11}")
+    for n in args.sizes or [1000, 10_000]:
+        with tempfile.TemporaryDirectory() as tmp:
+            server = GameServer(bank, spill_dir=tmp)
+            gc.collect()
+            tracemalloc.start()
+            sessions = []
+            for i in range(n):
+                engine = GameEngine(bank)
+                engine.start(i)
+                for _ in range(4):
+                    engine.answer('ABCD'[engine.current_question().correct])
+                sessions.append(Session(i, engine))
+            resident = tracemalloc.get_traced_memory()[0]
+            snapshot_size = len(sessions[0].engine.snapshot())
+            start = time.perf_counter()
+            asyncio.run(each(server.evict, sessions))
+            evict_time = time.perf_counter() - start
+            gc.collect()
+            evicted = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            asyncio.run(each(server.wake, sessions))
+            restore_time = time.perf_counter() - start
+            print(f"  {n:>8} {resident / 1e6:>12.2f} {evicted / 1e6:>11.2f} {snapshot_size:>11} "
+                  f"{evict_time / n * 1e6:>9.0f} {restore_time / n * 1e6:>11.0f}")
+            ok = ok and evicted < resident / 4 and not os.listdir(tmp)
+    if not ok:
+        print("  FAIL: eviction did not release session memory")
+        return 1
+    return 0
+
+
+BENCHMARKS = {
+    'startup': (bench_startup, "curriculum load time, eager vs lazy and source vs compiled pack"),
+    'memory': (bench_memory, "question pool memory, dict vs __slots__ vs columnar"),
+    'adaptive': (bench_adaptive, "IRT ability estimate error, fixed deal vs adaptive selection"),
+    'deal': (bench_deal, "stratified question sampling throughput"),
+    'contention': (bench_contention, "concurrent sessions sharing one progress file"),
+    'analytics': (bench_analytics, "per-topic stats refresh after one game vs full rebuild"),
+    'answerlog': (bench_answerlog, "answer history append and streaming read throughput"),
+    'reviews': (bench_reviews, "spaced-repetition due-queue lookups and deck size"),
+    'server': (bench_server, "concurrent games against one rhcsa_millionaire --serve process"),
+    'snapshot': (bench_snapshot, "game server memory with idle sessions evicted to disk"),
+    'progress-size': (bench_progress_size, "progress snapshot size and load time, JSON vs compact"),
+    'latency': (bench_latency, "progress write latency per menu action, before and after"),
+}
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="RHCSA Academy/Millionaire benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS),
+                        help="; ".join(f"{k}: {v[1]}" for k, v in sorted(BENCHMARKS.items())))
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help="problem sizes to run instead of the benchmark's defaults")
+    args = parser.parse_args()
+    return BENCHMARKS[args.benchmark][0](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
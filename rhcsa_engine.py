@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+RHCSA Engine - The rules of an RHCSA Millionaire game, without any I/O
+
+GameEngine deals a game from a QuestionBank and applies answers and
+lifelines, returning plain data for a client to render: the terminal game
+in rhcsa_millionaire, the rhcsa_server line protocol and the rhcsa_sim
+reference path all drive it. snapshot() and restore() save a game in progress
+as about a hundred bytes:
+
+    header (SNAPSHOT_HEADER)   magic, version, flags, bank fingerprint, seed,
+                               score, position, lives, unused lifelines,
+                               question and history counts
+    question ids               one uint32 per dealt question
+    history codes              one byte per answer (SKIPPED_CODE for a skip)
+    CRC-32                     of everything before it
+"""
+
+import os
+import time
+import zlib
+import random
+import struct
+from typing import Callable, Dict, List, Optional
+
+from rhcsa_bank import OPTION_LETTERS, QuestionBank, RecentQuestions
+from rhcsa_irt import AbilityEstimate
+
+LIFELINE_NAMES = {'5050': '50/50', 'hint': 'Hint', 'skip': 'Skip'}
+
+# Saved game: header, question ids, one answer code per history entry, CRC-32
+SNAPSHOT_MAGIC = b'RHGS'
+SNAPSHOT_VERSION = 1
+# magic, version, flags (SNAPSHOT_SEED, SNAPSHOT_ADAPTIVE), bank fingerprint, seed, score, current, lives,
+# unused lifelines bitmask, question count, history length
+SNAPSHOT_HEADER = struct.Struct('<4sBBIqIBBBBB')
+SNAPSHOT_CRC = struct.Struct('<I')
+SNAPSHOT_SEED = 1
+SNAPSHOT_ADAPTIVE = 2
+SKIPPED_CODE = len(OPTION_LETTERS)  # history code for a skipped question
+
+
+class GameError(Exception):
+    """Raised for a move the rules do not allow, e.g. a lifeline used twice"""
+
+
+class GameEngine:
+    """The rules of one RHCSA Millionaire game, without any I/O
+
+    Call start(), then answer() or use_lifeline() until is_over(); each call
+    returns plain data describing what happened, for any client to render.
+
+    An adaptive engine deals one question at a time instead of a fixed 5/5/5
+    set: each next question is the one whose IRT location is nearest the
+    running ability estimate, looked up in the bank's item index.
+
+    on_answer, if given, is called with an event dict for every answer and
+    skip (see rhcsa_answerlog for the fields).
+    """
+
+    # Point values for each question level
+    POINT_VALUES = [
+        100, 200, 300, 500, 1000,           # Questions 1-5 (Easy)
+        2000, 4000, 8000, 16000, 32000,     # Questions 6-10 (Medium)
+        64000, 125000, 250000, 500000, 1000000  # Questions 11-15 (Hard)
+    ]
+
+    SAFE_HAVENS = [5, 10]  # Question numbers where score is guaranteed
+    SAFE_HAVEN_SCORES = {5: 5000, 10: 50000}
+    LIVES = 3
+    LIFELINES = ('5050', 'hint', 'skip')
+    QUESTIONS_PER_DIFFICULTY = 5
+
+    def __init__(self, bank: QuestionBank, topics: List[str] = None,
+                 recent: RecentQuestions = None, adaptive: bool = False,
+                 on_answer: Callable[[Dict], None] = None):
+        self.bank = bank
+        self.topics = topics
+        self.recent = recent
+        self.adaptive = adaptive
+        self.on_answer = on_answer
+        self.session_id = None
+        self.ability: Optional[AbilityEstimate] = None
+        self.seed = None
+        self.question_ids: List[int] = []
+        self.selected_questions = []
+        self._rng = random.Random()
+        self._reset()
+
+    def _reset(self):
+        self.score = 0
+        self.current = 0
+        self.lives = self.LIVES
+        self.lifelines = {kind: True for kind in self.LIFELINES}
+        self.answers_history = []
+        self.topic_stats = {}
+        self._asked_at = time.monotonic()
+        self._used_here: List[str] = []
+
+    def start(self, seed: int = None):
+        """Deal a new game: 5 easy, 5 medium and 5 hard questions
+
+        The same seed deals the same questions (given the same recent
+        history). Draws are limited to self.topics when set and skip anything
+        in self.recent, which then remembers this game's questions; when too
+        few unseen questions are left, recently seen ones fill the gap. In
+        adaptive mode only the first question is dealt here.
+        """
+        self._reset()
+        self.seed = seed
+        self.session_id = os.urandom(8).hex()
+        rng = random.Random(seed)
+        self._rng = rng
+        if self.adaptive:
+            self.ability = AbilityEstimate()
+            self.question_ids = []
+            self.selected_questions = []
+            self._deal_next()
+            return
+        self.question_ids = []
+        for difficulty in ('easy', 'medium', 'hard'):
+            ids = self.bank.sample(difficulty, self.QUESTIONS_PER_DIFFICULTY,
+                                   topics=self.topics, exclude=self.recent, rng=rng)
+            if len(ids) < self.QUESTIONS_PER_DIFFICULTY and self.recent:
+                ids += self.bank.sample(difficulty, self.QUESTIONS_PER_DIFFICULTY - len(ids),
+                                        topics=self.topics, exclude=set(ids), rng=rng)
+            self.question_ids += ids
+        if self.recent is not None:
+            self.recent.add_session(self.question_ids)
+        self.selected_questions = [self.bank.get(qid) for qid in self.question_ids]
+
+    def _deal_next(self):
+        """Adaptive mode: deal the unseen question best matched to the ability estimate"""
+        dealt = set(self.question_ids)
+        topics = set(self.topics) if self.topics else None
+
+        def accept(qid: int, recent=self.recent) -> bool:
+            if qid in dealt or (recent is not None and qid in recent):
+                return False
+            return topics is None or self.bank.get(qid).topic in topics
+
+        qid = self.bank.items.nearest(self.ability.theta, accept, self._rng)
+        if qid is None and self.recent:
+            # Every unseen question is used up: allow recently seen ones again
+            qid = self.bank.items.nearest(self.ability.theta, lambda q: accept(q, None), self._rng)
+        if qid is not None:
+            self.question_ids.append(qid)
+            self.selected_questions.append(self.bank.get(qid))
+
+    def _move_on(self):
+        self.current += 1
+        self._asked_at = time.monotonic()
+        self._used_here = []
+        if self.adaptive and self.current == len(self.question_ids) < self.total_questions():
+            self._deal_next()
+
+    def _check_finished(self):
+        # Adaptive games only know their questions once over
+        if self.adaptive and self.recent is not None and self.is_over():
+            self.recent.add_session(self.question_ids)
+
+    def total_questions(self) -> int:
+        """Questions in a full game"""
+        return len(self.POINT_VALUES) if self.adaptive else len(self.selected_questions)
+
+    def is_over(self) -> bool:
+        return self.current >= len(self.selected_questions) or self.lives <= 0
+
+    def current_question(self):
+        """The question to answer now, or None once the game is over"""
+        if self.is_over():
+            return None
+        return self.selected_questions[self.current]
+
+    def question_shown(self):
+        """Start timing the current question now (e.g. after a pause between rounds)"""
+        self._asked_at = time.monotonic()
+
+    def current_value(self) -> int:
+        """Points the current question is worth"""
+        return self.POINT_VALUES[self.current]
+
+    def _require_question(self):
+        question = self.current_question()
+        if question is None:
+            raise GameError("The game is over")
+        return question
+
+    def answer(self, letter: str) -> Dict:
+        """Answer the current question with A, B, C or D
+
+        Returns correct, correct_answer, points (earned), lives, safe_haven
+        (the guaranteed score if one was just applied, else None) and
+        game_over.
+        """
+        question = self._require_question()
+        letter = letter.strip().upper()
+        if letter not in OPTION_LETTERS:
+            raise GameError(f"Answer must be one of {', '.join(OPTION_LETTERS)}")
+        correct_letter = OPTION_LETTERS[question.correct]
+        is_correct = letter == correct_letter
+
+        self._record_answer(question, letter)
+        self._emit(question, letter, is_correct)
+        if self.adaptive:
+            self.ability.update(*self.bank.items.params(question.id), is_correct)
+
+        points = 0
+        safe_haven = None
+        if is_correct:
+            points = self.POINT_VALUES[self.current]
+            self.score += points
+        else:
+            self.lives -= 1
+            haven = self.SAFE_HAVEN_SCORES.get(self.current + 1)
+            if self.lives > 0 and haven is not None and self.score < haven:
+                self.score = safe_haven = haven
+
+        # Losing the last life ends the game on this question
+        if self.lives > 0:
+            self._move_on()
+        self._check_finished()
+        return {
+            'correct': is_correct,
+            'correct_answer': correct_letter,
+            'points': points,
+            'lives': self.lives,
+            'safe_haven': safe_haven,
+            'game_over': self.is_over()
+        }
+
+    def _record_answer(self, question, letter: str):
+        correct_letter = OPTION_LETTERS[question.correct]
+        is_correct = letter == correct_letter
+        # History keeps question ids; text is decoded again only if reviewed
+        self.answers_history.append({
+            'question_id': question.id,
+            'your_answer': letter,
+            'correct_answer': correct_letter,
+            'correct': is_correct,
+            'topic': question.topic
+        })
+        stats = self.topic_stats.setdefault(question.topic, {'correct': 0, 'total': 0})
+        stats['total'] += 1
+        if is_correct:
+            stats['correct'] += 1
+
+    def _emit(self, question, answer: str, correct: Optional[bool]):
+        if self.on_answer is None:
+            return
+        self.on_answer({
+            'ts': round(time.time(), 3),
+            'session': self.session_id,
+            'qid': question.id,
+            'bank': f"{self.bank.fingerprint:08x}",
+            'topic': question.topic,
+            'difficulty': question.difficulty,
+            'number': self.current + 1,
+            'answer': answer,
+            'correct': correct,
+            'lifelines': self._used_here,
+            'seconds': round(time.monotonic() - self._asked_at, 3),
+        })
+
+    def _record_skip(self, question):
+        self.answers_history.append({
+            'question_id': question.id,
+            'your_answer': 'SKIPPED',
+            'correct': True,
+            'topic': question.topic
+        })
+
+    def use_lifeline(self, kind: str) -> Dict:
+        """Use one of the lifelines on the current question
+
+        '5050' returns the indexes of two wrong options it removed, 'hint'
+        returns the hint text and 'skip' moves on without points (a skipped
+        question counts as correct in the history). Raises GameError if the
+        lifeline was already used.
+        """
+        question = self._require_question()
+        if kind not in self.lifelines:
+            raise GameError(f"Unknown lifeline {kind!r}")
+        if not self.lifelines[kind]:
+            raise GameError(f"{LIFELINE_NAMES[kind]} lifeline already used!")
+        self.lifelines[kind] = False
+        self._used_here.append(kind)
+
+        if kind == '5050':
+            wrong = [i for i in range(len(OPTION_LETTERS)) if i != question.correct]
+            return {'kind': kind, 'removed': sorted(self._rng.sample(wrong, 2))}
+        if kind == 'hint':
+            return {'kind': kind, 'hint': question.hint}
+        self._record_skip(question)
+        self._emit(question, 'SKIPPED', None)
+        self._move_on()
+        self._check_finished()
+        return {'kind': kind, 'game_over': self.is_over()}
+
+    def estimate_ability(self) -> AbilityEstimate:
+        """IRT ability from the answers so far (skips carry no information)"""
+        if self.ability is not None:
+            return self.ability
+        estimate = AbilityEstimate()
+        for entry in self.answers_history:
+            if entry['your_answer'] != 'SKIPPED':
+                estimate.update(*self.bank.items.params(entry['question_id']), entry['correct'])
+        return estimate
+
+    def result(self) -> Dict:
+        """Summary of the game so far"""
+        correct = sum(1 for a in self.answers_history if a['correct'])
+        ability = self.estimate_ability()
+        return {
+            'score': self.score,
+            'questions_answered': self.current,
+            'total_questions': self.total_questions(),
+            'lives': self.lives,
+            'won': self.current >= len(self.selected_questions) > 0,
+            'accuracy': (correct / len(self.answers_history) * 100) if self.answers_history else 0,
+            'ability': ability.theta,
+            'ability_se': ability.se,
+            'topic_stats': self.topic_stats,
+            'history': self.answers_history
+        }
+
+    def snapshot(self) -> bytes:
+        """Pack the game state into about a hundred bytes
+
+        Questions are stored as bank ids and the history as one answer code
+        per question, so restore() needs the same bank (checked by its
+        fingerprint) to rebuild everything else.
+        """
+        has_seed = self.seed is not None and -2 ** 63 <= self.seed < 2 ** 63
+        flags = (SNAPSHOT_SEED if has_seed else 0) | (SNAPSHOT_ADAPTIVE if self.adaptive else 0)
+        lifelines = sum(1 << i for i, kind in enumerate(self.LIFELINES) if self.lifelines[kind])
+        codes = bytes(SKIPPED_CODE if entry['your_answer'] == 'SKIPPED'
+                      else OPTION_LETTERS.index(entry['your_answer'])
+                      for entry in self.answers_history)
+        body = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, self.bank.fingerprint,
+            self.seed if has_seed else 0, self.score, self.current, self.lives, lifelines,
+            len(self.question_ids), len(codes))
+        body += struct.pack(f'<{len(self.question_ids)}I', *self.question_ids) + codes
+        return body + SNAPSHOT_CRC.pack(zlib.crc32(body))
+
+    def restore(self, data: bytes, session_id: Optional[str] = None):
+        """Continue a game saved by snapshot()
+
+        Raises GameError if the data is damaged or was saved against a
+        different question bank. The recent-question history is left alone:
+        it already recorded these questions when the game was dealt. The
+        game is logged as a new session unless session_id carries on the
+        one it had when the snapshot was taken.
+        """
+        if len(data) < SNAPSHOT_HEADER.size + SNAPSHOT_CRC.size:
+            raise GameError("Saved game is truncated")
+        body, (crc,) = data[:-SNAPSHOT_CRC.size], SNAPSHOT_CRC.unpack_from(data, len(data) - SNAPSHOT_CRC.size)
+        (magic, version, flags, fingerprint, seed, score, current, lives, lifelines,
+         count, history) = SNAPSHOT_HEADER.unpack_from(body)
+        if magic != SNAPSHOT_MAGIC:
+            raise GameError("Not a saved game")
+        if version != SNAPSHOT_VERSION:
+            raise GameError(f"Unsupported saved game version {version}")
+        if zlib.crc32(body) != crc or len(body) != SNAPSHOT_HEADER.size + 4 * count + history:
+            raise GameError("Saved game is corrupt")
+        if fingerprint != self.bank.fingerprint:
+            raise GameError("Saved game belongs to a different question bank")
+        ids = list(struct.unpack_from(f'<{count}I', body, SNAPSHOT_HEADER.size))
+        codes = body[SNAPSHOT_HEADER.size + 4 * count:]
+        if (any(qid >= len(self.bank) for qid in ids) or any(code > SKIPPED_CODE for code in codes)
+                or history > count or current > count or lives > self.LIVES):
+            raise GameError("Saved game is corrupt")
+
+        self._reset()
+        self.session_id = session_id or os.urandom(8).hex()
+        self.seed = seed if flags & SNAPSHOT_SEED else None
+        self.adaptive = bool(flags & SNAPSHOT_ADAPTIVE)
+        self.ability = None
+        self.question_ids = ids
+        self.selected_questions = [self.bank.get(qid) for qid in ids]
+        for question, code in zip(self.selected_questions, codes):
+            if code == SKIPPED_CODE:
+                self._record_skip(question)
+            else:
+                self._record_answer(question, OPTION_LETTERS[code])
+        self.score = score
+        self.current = current
+        self.lives = lives
+        self.lifelines = {kind: bool(lifelines >> i & 1) for i, kind in enumerate(self.LIFELINES)}
+        self._rng = random.Random(self.seed)
+        if self.adaptive:
+            self.ability = self.estimate_ability()
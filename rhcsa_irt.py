@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+RHCSA IRT - Ability estimates for adaptive RHCSA Millionaire games
+
+Questions follow the two-parameter logistic model: a player of ability theta
+answers a question with discrimination a and location b correctly with
+probability 1 / (1 + exp(-a * (theta - b))). The item parameters live in the
+question bank (see rhcsa_bank.ItemIndex); this module keeps the player's side,
+a posterior over theta updated after every answer.
+"""
+
+import math
+from typing import List, Tuple
+
+# Posterior grid: theta from -4 to +4 in steps of 0.1
+GRID = [i / 10 for i in range(-40, 41)]
+
+
+def probability(theta: float, a: float, b: float) -> float:
+    """Chance a player of ability theta answers an (a, b) question correctly"""
+    return 1 / (1 + math.exp(-a * (theta - b)))
+
+
+class AbilityEstimate:
+    """Expected a posteriori (EAP) ability from a standard normal prior
+
+    The log posterior is kept on a fixed grid, so each update costs one pass
+    over the grid regardless of how many answers came before.
+    """
+    __slots__ = ('_log_posterior', 'theta', 'se', 'responses')
+
+    def __init__(self):
+        self._log_posterior = [-x * x / 2 for x in GRID]
+        self.theta = 0.0
+        self.se = 1.0
+        self.responses = 0
+
+    def update(self, a: float, b: float, correct: bool):
+        """Fold in one answer to an (a, b) question"""
+        log_posterior = self._log_posterior
+        for i, x in enumerate(GRID):
+            # Clamped so a very discriminating item cannot zero the posterior
+            p = min(max(probability(x, a, b), 1e-9), 1 - 1e-9)
+            log_posterior[i] += math.log(p if correct else 1 - p)
+        self.responses += 1
+        self.theta, self.se = self._moments()
+
+    def _moments(self) -> Tuple[float, float]:
+        top = max(self._log_posterior)
+        weights: List[float] = [math.exp(v - top) for v in self._log_posterior]
+        total = sum(weights)
+        mean = sum(w * x for w, x in zip(weights, GRID)) / total
+        variance = sum(w * (x - mean) ** 2 for w, x in zip(weights, GRID)) / total
+        return mean, math.sqrt(variance)
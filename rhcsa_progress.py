@@ -0,0 +1,1005 @@
+#!/usr/bin/env python3
+"""
+RHCSA Progress - Persistent learner progress for RHCSA Academy
+
+Progress lives in two files:
+
+    rhcsa_progress.json           snapshot of the full progress dict
+    rhcsa_progress.json.journal   append-only log of changes since the snapshot
+
+Every mutation is an event that is applied to the in-memory dict and appended
+to the journal as one JSON line, so a change costs one small write no matter
+how much history has accumulated. Every COMPACT_EVERY events the journal is
+folded into a new snapshot (written atomically) and emptied. Loading replays
+the journal over the snapshot; a torn final line from a crash is discarded,
+losing at most that one event. Snapshots carry a checksum and the previous
+two are kept with their journals (.1, .2), so a damaged snapshot is
+replaced by an older one plus the journals written since. Dashboard totals live in data['stats'] and are
+updated by each event, so reading them never walks the history.
+
+With background=True the journal appends and compaction run on a writer
+thread that group-commits each burst of changes with a single fsync, so menu
+actions return as soon as the in-memory dict is updated. close() flushes the
+queue and is also registered with atexit.
+
+SQLiteProgressTracker offers the same interface on a shared SQLite database
+with one row set per user, for hosting the Academy for a whole class.
+"""
+
+import os
+import sys
+import json
+import zlib
+import struct
+import time
+import hashlib
+import atexit
+import sqlite3
+import getpass
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from rhcsa_storage import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking, one session at a time
+    fcntl = None
+
+COMPACT_EVERY = 200
+# Snapshots kept: rhcsa_progress.json plus .1 and .2, each with its journal
+KEEP_SNAPSHOTS = 3
+
+# Version 1 is the original, unversioned file; see MIGRATIONS
+SCHEMA_VERSION = 2
+
+
+def new_progress() -> Dict:
+    """Create new progress structure"""
+    return {
+        'version': SCHEMA_VERSION,
+        'started_at': datetime.now().isoformat(),
+        'last_accessed': datetime.now().isoformat(),
+        'modules': {},
+        'bookmarks': [],
+        'notes': {},
+        'quiz_scores': {},
+        'completed_lessons': [],
+        'stats': compute_stats({}),
+        'seq': 0
+    }
+
+
+def _migrate_v1(data: Dict) -> Dict:
+    """v1 -> v2: add seq and stats, drop the never-used placeholder keys"""
+    for key, value in new_progress().items():
+        data.setdefault(key, value)
+    # Only drop them while they still hold the defaults nothing ever changed
+    if data.get('total_study_time') == 0:
+        del data['total_study_time']
+    if data.get('achievements') == []:
+        del data['achievements']
+    data['stats'] = compute_stats(data)
+    return data
+
+
+# MIGRATIONS[n] upgrades a version n dict to version n + 1
+MIGRATIONS = {
+    1: _migrate_v1,
+}
+
+
+def migrate(data: Dict) -> Dict:
+    """Bring a loaded progress dict up to SCHEMA_VERSION in memory
+
+    The file itself is only rewritten at the next compaction, so upgrading
+    never delays startup. Keys this version does not know about are left
+    alone, and dicts from a newer version are returned unchanged.
+    """
+    version = data.get('version', 1)
+    while version < SCHEMA_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+        data['version'] = version
+    return data
+
+
+def compute_stats(data: Dict) -> Dict:
+    """Aggregates over a progress dict, computed from scratch
+
+    apply_event keeps data['stats'] up to date incrementally; this is only
+    needed when migrating files written before the aggregates existed.
+    """
+    quizzes = data.get('quiz_scores', {})
+    return {
+        'completed_modules': sum(1 for m in data.get('modules', {}).values()
+                                 if m.get('quiz_completed', False)),
+        'lessons_completed': len(data.get('completed_lessons', [])),
+        'bookmarks': len(data.get('bookmarks', [])),
+        'notes': sum(len(notes) for notes in data.get('notes', {}).values()),
+        'quizzes': len(quizzes),
+        'quiz_percentage_total': sum(q['percentage'] for q in quizzes.values()),
+    }
+
+
+class ProgressIndex:
+    """Set and dict views over a progress dict for constant-time lookups
+
+    The serialized dict keeps its lists so the file format does not change;
+    the views are built once on load and kept in step by apply_event.
+    Bookmark entries are shared with data['bookmarks'], not copied.
+    """
+    __slots__ = ('completed', 'module_lessons', 'bookmarks_by_module')
+
+    def __init__(self, data: Dict):
+        self.completed = set(data['completed_lessons'])
+        self.module_lessons: Dict[str, Set[int]] = {
+            module_id: set(module['completed_lessons'])
+            for module_id, module in data['modules'].items()
+        }
+        self.bookmarks_by_module: Dict[str, List[Dict]] = {}
+        for bookmark in data['bookmarks']:
+            self.bookmarks_by_module.setdefault(bookmark['module_id'], []).append(bookmark)
+
+
+def apply_event(data: Dict, event: Dict, index: Optional[ProgressIndex] = None):
+    """Apply one journal event to a progress dict and its index"""
+    if index is None:
+        index = ProgressIndex(data)
+    op = event['op']
+    module_id = event.get('module_id')
+    date = event['date']
+    stats = data['stats']
+
+    if op == 'lesson_complete':
+        lesson_index = event['lesson_index']
+        key = f"{module_id}_{lesson_index}"
+        if key not in index.completed:
+            index.completed.add(key)
+            data['completed_lessons'].append(key)
+            stats['lessons_completed'] += 1
+        if module_id not in data['modules']:
+            data['modules'][module_id] = {
+                'started': True,
+                'completed_lessons': [],
+                'quiz_completed': False
+            }
+        lessons = index.module_lessons.setdefault(module_id, set())
+        if lesson_index not in lessons:
+            lessons.add(lesson_index)
+            data['modules'][module_id]['completed_lessons'].append(lesson_index)
+    elif op == 'quiz_score':
+        score, total = event['score'], event['total']
+        previous = data['quiz_scores'].get(module_id)
+        if previous is None:
+            stats['quizzes'] += 1
+        else:
+            stats['quiz_percentage_total'] -= previous['percentage']
+        data['quiz_scores'][module_id] = {
+            'score': score,
+            'total': total,
+            'percentage': (score / total * 100) if total > 0 else 0,
+            'date': date
+        }
+        stats['quiz_percentage_total'] += data['quiz_scores'][module_id]['percentage']
+        module = data['modules'].get(module_id)
+        if module is not None and not module.get('quiz_completed', False):
+            module['quiz_completed'] = True
+            stats['completed_modules'] += 1
+    elif op == 'bookmark':
+        bookmark = {
+            'module_id': module_id,
+            'lesson_index': event['lesson_index'],
+            'note': event['note'],
+            'date': date
+        }
+        data['bookmarks'].append(bookmark)
+        stats['bookmarks'] += 1
+        index.bookmarks_by_module.setdefault(module_id, []).append(bookmark)
+    elif op == 'note':
+        key = f"{module_id}_{event['lesson_index']}"
+        data['notes'].setdefault(key, []).append({
+            'note': event['note'],
+            'date': date
+        })
+        stats['notes'] += 1
+    else:
+        raise ValueError(f"Unknown progress event {op!r}")
+
+    data['last_accessed'] = date
+    data['seq'] = event['seq']
+
+
+def copy_progress(data: Dict) -> Dict:
+    """A copy of a progress dict that later apply_event calls leave alone
+
+    apply_event only appends to lists, adds or replaces dict entries and
+    updates module dicts and stats; the bookmark, note and quiz score
+    entries it creates are never changed afterwards, so they are shared.
+    """
+    copy = dict(data)
+    for key in ('completed_lessons', 'bookmarks'):
+        copy[key] = list(data[key])
+    copy['stats'] = dict(data['stats'])
+    copy['quiz_scores'] = dict(data['quiz_scores'])
+    copy['notes'] = {key: list(notes) for key, notes in data['notes'].items()}
+    copy['modules'] = {module_id: dict(module, completed_lessons=list(module['completed_lessons']))
+                       for module_id, module in data['modules'].items()}
+    return copy
+
+
+def read_journal(path: str, after_seq: int = 0):
+    """Return (events newer than after_seq, byte length of the intact prefix)
+
+    Reading stops at the first line that is unterminated or not valid JSON,
+    which is where a crash mid-append leaves the file.
+    """
+    events = []
+    good = 0
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+                if event.get('seq', 0) > after_seq:
+                    events.append(event)
+    except FileNotFoundError:
+        pass
+    return events, good
+
+# Compact snapshot encoding: the JSON form without indentation, zlib-compressed
+# behind a header with a checksum
+PACK_MAGIC = b'RHPP'
+PACK_VERSION = 3
+PACK_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, crc32 of the uncompressed body
+
+
+def encode_progress(data: Dict) -> bytes:
+    """Compact binary form of a progress dict; see decode_progress"""
+    body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, zlib.crc32(body)) + zlib.compress(body, 9)
+
+
+def decode_progress(buf: bytes) -> Dict:
+    """Inverse of encode_progress; raises ValueError if buf is damaged"""
+    if len(buf) < PACK_HEADER.size:
+        raise ValueError("progress pack is truncated")
+    magic, version, _, crc = PACK_HEADER.unpack_from(buf, 0)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError("Not a compatible progress pack")
+    try:
+        body = zlib.decompress(buf[PACK_HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"corrupt progress pack ({e})")
+    if zlib.crc32(body) != crc:
+        raise ValueError("checksum mismatch")
+    return json.loads(body.decode('utf-8'))
+
+
+def snapshot_checksum(data: Dict) -> str:
+    """Checksum of a progress dict, independent of key order and indentation"""
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return 'sha256:' + hashlib.sha256(canonical).hexdigest()
+
+
+def encode_snapshot(data: Dict, compact: bool = False) -> bytes:
+    """Snapshot file contents: JSON plus its checksum, or the compact encoding"""
+    if compact:
+        return encode_progress(data)
+    return json.dumps(dict(data, checksum=snapshot_checksum(data)), indent=2).encode('utf-8')
+
+
+def read_snapshot(path: str) -> Dict:
+    """Load and verify a snapshot in either encoding; raises ValueError if it is damaged
+
+    JSON snapshots written before checksums existed have none and are accepted.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if raw.startswith(PACK_MAGIC):
+        return decode_progress(raw)
+    data = json.loads(raw.decode('utf-8'))
+    if not isinstance(data, dict):
+        raise ValueError("not a progress snapshot")
+    checksum = data.pop('checksum', None)
+    if checksum is not None and checksum != snapshot_checksum(data):
+        raise ValueError("checksum mismatch")
+    return data
+
+
+def read_progress(progress_file: str) -> Dict:
+    """Progress as ProgressTracker would load it, read without changing any file
+
+    No lock is taken, damaged snapshots are skipped rather than moved aside
+    and a torn journal tail is ignored rather than truncated, so this is safe
+    to use on another learner's files (e.g. for an import).
+    """
+    data, generation = None, 0
+    for generation in range(KEEP_SNAPSHOTS):
+        path = f"{progress_file}.{generation}" if generation else progress_file
+        try:
+            data = read_snapshot(path)
+            break
+        except (OSError, ValueError):
+            continue
+    if data is None:
+        data, generation = new_progress(), 0
+    data = migrate(data)
+    index = ProgressIndex(data)
+    journal = progress_file + '.journal'
+    for path in [f"{journal}.{g}" for g in range(generation, 0, -1)] + [journal]:
+        events, _ = read_journal(path, data['seq'])
+        for event in events:
+            if event['seq'] > data['seq']:
+                apply_event(data, event, index)
+    return data
+
+
+class ProgressWriter(threading.Thread):
+    """Background thread that group-commits journal writes
+
+    Changes submitted within one burst window are written with a single
+    write and fsync, so the input loop never waits on the disk.
+    """
+    def __init__(self, commit, window: float = 0.05):
+        super().__init__(name='progress-writer', daemon=True)
+        self._commit = commit
+        self.window = window
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._closing = False
+
+    def submit(self):
+        with self._cond:
+            self._submitted += 1
+            self._cond.notify_all()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._committed == self._submitted and not self._closing:
+                    self._cond.wait()
+                if self._committed == self._submitted:
+                    return
+                closing = self._closing
+            if not closing:
+                # Let the rest of the burst arrive before touching the disk
+                time.sleep(self.window)
+            with self._cond:
+                target = self._submitted
+            try:
+                self._commit()
+            except OSError as e:
+                # The changes stay queued in the tracker and are retried
+                print(f"Warning: could not save progress ({e})", file=sys.stderr)
+            with self._cond:
+                self._committed = target
+                self._cond.notify_all()
+
+    def flush(self):
+        """Block until everything submitted so far has been written"""
+        with self._cond:
+            target = self._submitted
+            self._cond.notify_all()
+            while self._committed < target and self.is_alive():
+                self._cond.wait()
+
+    def close(self):
+        """Write out pending changes and stop the thread"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self.join()
+
+
+class ProgressTracker:
+    """Tracks and persists user progress
+
+    Several sessions may share one progress file: every write takes an
+    advisory lock on <progress_file>.lock, and if another session changed
+    the journal since this one last looked, the store is re-read and only
+    this session's unsaved events are re-applied on top before appending.
+
+    With background=True journal writes and compaction happen on a
+    ProgressWriter thread; call close() (also registered with atexit) to
+    flush before exiting. With compact=True snapshots are written with
+    encode_progress instead of JSON; either kind is read back.
+    """
+    def __init__(self, progress_file='rhcsa_progress.json', background: bool = False,
+                 compact: bool = False):
+        self.progress_file = progress_file
+        self.compact = compact
+        self.journal_file = progress_file + '.journal'
+        self.lock_file = progress_file + '.lock'
+        self._journal = None
+        self._journal_events = 0
+        # (inode, size) of the journal as this session last left it
+        self._journal_stat = None
+        # Events applied in memory but not yet in the journal, oldest first
+        self._unsaved: List[Dict] = []
+        # Guards self.data and self._unsaved; held only for in-memory work,
+        # never while reading, writing or encoding, so record() cannot stall
+        self._lock = threading.RLock()
+        self._snapshot_seq = 0
+        # flock() does not exclude threads of one process, so pair it with an RLock
+        self._io_lock = threading.RLock()
+        self._lock_fd = None
+        self._lock_depth = 0
+        self._writer: Optional[ProgressWriter] = None
+        self.background = background
+        self.data = self.load_progress()
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold the inter-process lock on the progress store (re-entrant)"""
+        with self._io_lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                if self._lock_fd is None:
+                    self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def load_progress(self) -> Dict:
+        """Load the snapshot and replay the journal over it"""
+        with self._file_lock():
+            data, self.index = self._read_store()
+        return data
+
+    def _read_store(self):
+        """Return (data, index) from disk; call with the file lock held
+
+        When recovering from an older snapshot its journal and every newer
+        one are replayed, so only changes in damaged files are lost.
+        """
+        data, generation, failures = self._load_snapshot()
+        self._snapshot_seq = data['seq']
+        saved_at = data['last_accessed']
+        index = ProgressIndex(data)
+        journals = [f"{self.journal_file}.{g}" for g in range(generation or 0, 0, -1)]
+        lost = 0
+        for path in journals + [self.journal_file]:
+            events, good = read_journal(path, data['seq'])
+            for event in events:
+                if event['seq'] <= data['seq']:
+                    continue
+                lost += event['seq'] - data['seq'] - 1
+                apply_event(data, event, index)
+        self._journal_events = len(events)
+        if os.path.exists(self.journal_file) and os.path.getsize(self.journal_file) > good:
+            # Drop the torn tail so new events are not appended after garbage
+            os.truncate(self.journal_file, good)
+        self._open_journal()
+        if failures:
+            for path, aside, error in failures:
+                print(f"Warning: {path} is damaged ({error}); moved it to {aside}", file=sys.stderr)
+            if generation is None:
+                print("Warning: no intact progress snapshot was found; starting over", file=sys.stderr)
+            else:
+                source = f"{self.progress_file}.{generation}" if generation else self.progress_file
+                print(f"Warning: restored progress from {source} (saved "
+                      f"{saved_at[:16].replace('T', ' ')}) and its journals; "
+                      f"{lost} change(s) could not be recovered", file=sys.stderr)
+        return data, index
+
+    def _open_journal(self):
+        """(Re)open the journal for appending and note its (inode, size)
+
+        Keeping it open stops its inode number being reused by a journal
+        created later, which could otherwise look like the same file.
+        """
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self.journal_file, 'a')
+        st = os.fstat(self._journal.fileno())
+        self._journal_stat = (st.st_ino, st.st_size)
+
+    def _stat_journal(self):
+        try:
+            st = os.stat(self.journal_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size)
+
+    def _merge(self):
+        """Reload the store written by other sessions and re-apply our unsaved events
+
+        Call with the file lock held. The files are read without self._lock;
+        events recorded meanwhile are in self._unsaved and get re-applied too.
+        """
+        data, index = self._read_store()
+        with self._lock:
+            for event in self._unsaved:
+                event['seq'] = data['seq'] + 1
+                apply_event(data, event, index)
+            self.data, self.index = data, index
+
+    def _load_snapshot(self):
+        """Return (data, generation, failures) for the newest intact snapshot
+
+        generation is 0 for the main file, n for its .n rotation and None when
+        nothing could be loaded. Damaged snapshots are moved aside for
+        inspection and listed in failures as (path, new path, error).
+        """
+        failures = []
+        for generation in range(KEEP_SNAPSHOTS):
+            path = f"{self.progress_file}.{generation}" if generation else self.progress_file
+            if not os.path.exists(path):
+                continue
+            try:
+                data = read_snapshot(path)
+            except (OSError, ValueError) as e:
+                aside = f"{path}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                os.replace(path, aside)
+                failures.append((path, aside, e))
+                continue
+            if data.get('version', 1) > SCHEMA_VERSION:
+                print(f"Warning: {path} was written by a newer version "
+                      f"(schema {data['version']}); fields it added are kept as they are",
+                      file=sys.stderr)
+            return migrate(data), generation, failures
+        return self.create_new_progress(), (None if failures else 0), failures
+
+    def create_new_progress(self) -> Dict:
+        """Create new progress structure"""
+        return new_progress()
+
+    def record(self, op: str, **fields):
+        """Apply a change and append it to the journal"""
+        with self._lock:
+            event = dict(fields, op=op, seq=self.data['seq'] + 1, date=datetime.now().isoformat())
+            apply_event(self.data, event, self.index)
+            self._unsaved.append(event)
+        if not self.background:
+            self._commit()
+            return
+        if self._writer is None:
+            self._writer = ProgressWriter(self._commit)
+            self._writer.start()
+            # Unregistered by close(), so closed trackers are not kept alive
+            atexit.register(self.close)
+        self._writer.submit()
+
+    def _commit(self):
+        """Append every unsaved event with one write and fsync, compacting when due"""
+        with self._file_lock():
+            self._append()
+            if self._journal_events >= COMPACT_EVERY:
+                self.save_progress()
+
+    def _append(self):
+        """Write unsaved events to the journal; call with the file lock held"""
+        if self._journal_stat != self._stat_journal():
+            self._merge()
+        with self._lock:
+            events, self._unsaved = self._unsaved, []
+        if not events:
+            return
+        try:
+            if self._journal is None:
+                self._open_journal()
+            self._journal.write(''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in events))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        except OSError:
+            with self._lock:
+                self._unsaved[:0] = events
+            raise
+        self._journal_stat = self._stat_journal()
+        self._journal_events += len(events)
+
+    def save_progress(self):
+        """Write a checksummed snapshot and start an empty journal
+
+        Does nothing if nothing changed since the last snapshot. The previous
+        snapshot and its journal are kept as .1 (and that one as .2) so a
+        damaged file can be recovered from; every event is in a journal before
+        the snapshot that contains it is written.
+        """
+        with self._file_lock():
+            while True:
+                self._append()
+                with self._lock:
+                    # Retry if a change came in after the append, so the
+                    # snapshot holds nothing that is not in a journal yet
+                    if self._unsaved:
+                        continue
+                    if self.data['seq'] == self._snapshot_seq:
+                        return
+                    data = copy_progress(self.data)
+                break
+            seq = data['seq']
+            raw = encode_snapshot(data, self.compact)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self._rotate()
+            atomic_write(self.progress_file, raw)
+            atomic_write(self.journal_file, b'')
+            self._snapshot_seq = seq
+            self._open_journal()
+            self._journal_events = 0
+
+    def _rotate(self):
+        """Shift snapshot n and its journal to n + 1, dropping the oldest"""
+        for generation in range(KEEP_SNAPSHOTS - 1, 0, -1):
+            for base in (self.progress_file, self.journal_file):
+                src = f"{base}.{generation - 1}" if generation > 1 else base
+                dst = f"{base}.{generation}"
+                if os.path.exists(src):
+                    os.replace(src, dst)
+                elif os.path.exists(dst):
+                    os.unlink(dst)
+
+    def flush(self):
+        """Wait until every recorded change is on disk"""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Flush pending changes and close the journal
+
+        Runs at exit, so a failure to write the last changes is reported on
+        stderr rather than raised.
+        """
+        if self._writer is not None:
+            atexit.unregister(self.close)
+            self._writer.close()
+            self._writer = None
+        try:
+            if self._unsaved:
+                # Last attempt for changes a failed background write left behind
+                self._commit()
+        except OSError as e:
+            print(f"Warning: {len(self._unsaved)} progress change(s) could not be saved ({e})",
+                  file=sys.stderr)
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def mark_lesson_complete(self, module_id: str, lesson_index: int):
+        """Mark a lesson as complete"""
+        self.record('lesson_complete', module_id=module_id, lesson_index=lesson_index)
+
+    def save_quiz_score(self, module_id: str, score: int, total: int):
+        """Save quiz score"""
+        self.record('quiz_score', module_id=module_id, score=score, total=total)
+
+    def add_bookmark(self, module_id: str, lesson_index: int, note: str = ""):
+        """Add a bookmark"""
+        self.record('bookmark', module_id=module_id, lesson_index=lesson_index, note=note)
+
+    def add_note(self, module_id: str, lesson_index: int, note: str):
+        """Add a note"""
+        self.record('note', module_id=module_id, lesson_index=lesson_index, note=note)
+
+    def is_lesson_complete(self, module_id: str, lesson_index: int) -> bool:
+        """Whether a lesson has been marked complete"""
+        return f"{module_id}_{lesson_index}" in self.index.completed
+
+    def get_quiz_score(self, module_id: str) -> Optional[Dict]:
+        """Latest quiz result for a module, if any"""
+        return self.data['quiz_scores'].get(module_id)
+
+    def get_bookmarks(self, module_id: Optional[str] = None) -> List[Dict]:
+        """Bookmarks in the order they were added, optionally for one module"""
+        if module_id is None:
+            return self.data['bookmarks']
+        return self.index.bookmarks_by_module.get(module_id, [])
+
+    def get_note_count(self) -> int:
+        """Total number of notes across all lessons"""
+        return self.data['stats']['notes']
+
+    def get_bookmark_count(self) -> int:
+        """Total number of bookmarks"""
+        return self.data['stats']['bookmarks']
+
+    def get_activity(self) -> Dict:
+        """When progress tracking started and when it was last touched"""
+        return {'started_at': self.data['started_at'], 'last_accessed': self.data['last_accessed']}
+
+    def get_module_progress(self, module_id: str, total_lessons: int) -> Dict:
+        """Get progress for a specific module"""
+        if module_id not in self.index.module_lessons:
+            return {'completed': 0, 'total': total_lessons, 'percentage': 0}
+
+        completed = len(self.index.module_lessons[module_id])
+        return {
+            'completed': completed,
+            'total': total_lessons,
+            'percentage': (completed / total_lessons * 100) if total_lessons > 0 else 0
+        }
+
+    def get_overall_progress(self, total_modules: int) -> Dict:
+        """Get overall progress"""
+        stats = self.data['stats']
+        completed_modules = stats['completed_modules']
+        return {
+            'completed_modules': completed_modules,
+            'total_modules': total_modules,
+            'percentage': (completed_modules / total_modules * 100) if total_modules > 0 else 0,
+            'total_lessons_completed': stats['lessons_completed'],
+            'quiz_average': (stats['quiz_percentage_total'] / stats['quizzes']) if stats['quizzes'] else None
+        }
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    started_at TEXT NOT NULL,
+    last_accessed TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modules (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    module_id TEXT NOT NULL,
+    quiz_completed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, module_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS completed_lessons (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    module_id TEXT NOT NULL,
+    lesson_index INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (user_id, module_id, lesson_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS quiz_scores (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    module_id TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (user_id, module_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS bookmarks (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    module_id TEXT NOT NULL,
+    lesson_index INTEGER NOT NULL,
+    note TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookmarks_by_user ON bookmarks (user_id, module_id);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    module_id TEXT NOT NULL,
+    lesson_index INTEGER NOT NULL,
+    note TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_by_user ON notes (user_id, module_id, lesson_index);
+CREATE TABLE IF NOT EXISTS imports (
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    source TEXT NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (user_id, source)
+) WITHOUT ROWID;
+"""
+
+
+# Keeps whichever score is newer, so importing an old file cannot overwrite a later attempt
+UPSERT_QUIZ_SCORE = """
+INSERT INTO quiz_scores VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (user_id, module_id) DO UPDATE SET
+    score = excluded.score, total = excluded.total,
+    percentage = excluded.percentage, date = excluded.date
+WHERE excluded.date > quiz_scores.date
+"""
+
+
+class SQLiteProgressTracker:
+    """Tracks user progress in a shared SQLite database
+
+    Every user gets their own rows in indexed tables; the database runs in WAL
+    mode so concurrent sessions read without blocking and writers only hold
+    the lock for one short transaction per change.
+    """
+    def __init__(self, db_path: str = 'rhcsa_progress.db', user: Optional[str] = None):
+        self.db_path = db_path
+        self.user = user or getpass.getuser()
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SQLITE_SCHEMA)
+        self.user_id = self._ensure_user()
+
+    def _ensure_user(self) -> int:
+        now = datetime.now().isoformat()
+        with self._transaction() as cur:
+            cur.execute('INSERT OR IGNORE INTO users (name, started_at, last_accessed) VALUES (?, ?, ?)',
+                        (self.user, now, now))
+            return cur.execute('SELECT id FROM users WHERE name = ?', (self.user,)).fetchone()[0]
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    def _touch(self, cur, date: str):
+        cur.execute('UPDATE users SET last_accessed = ? WHERE id = ?', (date, self.user_id))
+
+    def close(self):
+        self.conn.close()
+
+    def mark_lesson_complete(self, module_id: str, lesson_index: int):
+        """Mark a lesson as complete"""
+        now = datetime.now().isoformat()
+        with self._transaction() as cur:
+            cur.execute('INSERT OR IGNORE INTO completed_lessons VALUES (?, ?, ?, ?)',
+                        (self.user_id, module_id, lesson_index, now))
+            cur.execute('INSERT OR IGNORE INTO modules (user_id, module_id) VALUES (?, ?)',
+                        (self.user_id, module_id))
+            self._touch(cur, now)
+
+    def save_quiz_score(self, module_id: str, score: int, total: int):
+        """Save quiz score"""
+        now = datetime.now().isoformat()
+        percentage = (score / total * 100) if total > 0 else 0
+        with self._transaction() as cur:
+            cur.execute(UPSERT_QUIZ_SCORE, (self.user_id, module_id, score, total, percentage, now))
+            cur.execute('UPDATE modules SET quiz_completed = 1 WHERE user_id = ? AND module_id = ?',
+                        (self.user_id, module_id))
+            self._touch(cur, now)
+
+    def add_bookmark(self, module_id: str, lesson_index: int, note: str = ""):
+        """Add a bookmark"""
+        now = datetime.now().isoformat()
+        with self._transaction() as cur:
+            cur.execute('INSERT INTO bookmarks (user_id, module_id, lesson_index, note, date) '
+                        'VALUES (?, ?, ?, ?, ?)', (self.user_id, module_id, lesson_index, note, now))
+            self._touch(cur, now)
+
+    def add_note(self, module_id: str, lesson_index: int, note: str):
+        """Add a note"""
+        now = datetime.now().isoformat()
+        with self._transaction() as cur:
+            cur.execute('INSERT INTO notes (user_id, module_id, lesson_index, note, date) '
+                        'VALUES (?, ?, ?, ?, ?)', (self.user_id, module_id, lesson_index, note, now))
+            self._touch(cur, now)
+
+    def is_lesson_complete(self, module_id: str, lesson_index: int) -> bool:
+        """Whether a lesson has been marked complete"""
+        return self.conn.execute(
+            'SELECT 1 FROM completed_lessons WHERE user_id = ? AND module_id = ? AND lesson_index = ?',
+            (self.user_id, module_id, lesson_index)).fetchone() is not None
+
+    def get_quiz_score(self, module_id: str) -> Optional[Dict]:
+        """Latest quiz result for a module, if any"""
+        row = self.conn.execute(
+            'SELECT score, total, percentage, date FROM quiz_scores WHERE user_id = ? AND module_id = ?',
+            (self.user_id, module_id)).fetchone()
+        return dict(row) if row else None
+
+    def get_bookmarks(self, module_id: Optional[str] = None) -> List[Dict]:
+        """Bookmarks in the order they were added, optionally for one module"""
+        if module_id is None:
+            rows = self.conn.execute(
+                'SELECT module_id, lesson_index, note, date FROM bookmarks WHERE user_id = ? ORDER BY id',
+                (self.user_id,))
+        else:
+            rows = self.conn.execute(
+                'SELECT module_id, lesson_index, note, date FROM bookmarks '
+                'WHERE user_id = ? AND module_id = ? ORDER BY id', (self.user_id, module_id))
+        return [dict(row) for row in rows]
+
+    def get_note_count(self) -> int:
+        """Total number of notes across all lessons"""
+        return self.conn.execute('SELECT COUNT(*) FROM notes WHERE user_id = ?',
+                                 (self.user_id,)).fetchone()[0]
+
+    def get_bookmark_count(self) -> int:
+        """Total number of bookmarks"""
+        return self.conn.execute('SELECT COUNT(*) FROM bookmarks WHERE user_id = ?',
+                                 (self.user_id,)).fetchone()[0]
+
+    def get_activity(self) -> Dict:
+        """When progress tracking started and when it was last touched"""
+        row = self.conn.execute('SELECT started_at, last_accessed FROM users WHERE id = ?',
+                                (self.user_id,)).fetchone()
+        return dict(row)
+
+    def get_module_progress(self, module_id: str, total_lessons: int) -> Dict:
+        """Get progress for a specific module"""
+        completed = self.conn.execute(
+            'SELECT COUNT(*) FROM completed_lessons WHERE user_id = ? AND module_id = ?',
+            (self.user_id, module_id)).fetchone()[0]
+        return {
+            'completed': completed,
+            'total': total_lessons,
+            'percentage': (completed / total_lessons * 100) if total_lessons > 0 else 0
+        }
+
+    def get_overall_progress(self, total_modules: int) -> Dict:
+        """Get overall progress"""
+        completed_modules = self.conn.execute(
+            'SELECT COUNT(*) FROM modules WHERE user_id = ? AND quiz_completed = 1',
+            (self.user_id,)).fetchone()[0]
+        lessons = self.conn.execute('SELECT COUNT(*) FROM completed_lessons WHERE user_id = ?',
+                                    (self.user_id,)).fetchone()[0]
+        quiz_average = self.conn.execute('SELECT AVG(percentage) FROM quiz_scores WHERE user_id = ?',
+                                         (self.user_id,)).fetchone()[0]
+        return {
+            'completed_modules': completed_modules,
+            'total_modules': total_modules,
+            'percentage': (completed_modules / total_modules * 100) if total_modules > 0 else 0,
+            'total_lessons_completed': lessons,
+            'quiz_average': quiz_average
+        }
+
+    def import_json(self, progress_file: str) -> bool:
+        """Import a rhcsa_progress.json (and its journal) into this user's rows
+
+        Each source file is imported at most once per user; returns False when
+        it had already been imported.
+        """
+        source = os.path.abspath(progress_file)
+        data = read_progress(progress_file)
+        with self._transaction() as cur:
+            if cur.execute('SELECT 1 FROM imports WHERE user_id = ? AND source = ?',
+                           (self.user_id, source)).fetchone():
+                return False
+            for module_id, module in data['modules'].items():
+                cur.execute('INSERT OR IGNORE INTO modules VALUES (?, ?, ?)',
+                            (self.user_id, module_id, int(module.get('quiz_completed', False))))
+                for lesson_index in module['completed_lessons']:
+                    cur.execute('INSERT OR IGNORE INTO completed_lessons VALUES (?, ?, ?, ?)',
+                                (self.user_id, module_id, lesson_index, data['last_accessed']))
+            for module_id, quiz in data['quiz_scores'].items():
+                cur.execute(UPSERT_QUIZ_SCORE,
+                            (self.user_id, module_id, quiz['score'], quiz['total'],
+                             quiz['percentage'], quiz['date']))
+            for bookmark in data['bookmarks']:
+                cur.execute('INSERT INTO bookmarks (user_id, module_id, lesson_index, note, date) '
+                            'VALUES (?, ?, ?, ?, ?)',
+                            (self.user_id, bookmark['module_id'], bookmark['lesson_index'],
+                             bookmark['note'], bookmark['date']))
+            for key, notes in data['notes'].items():
+                module_id, lesson_index = key.rsplit('_', 1)
+                for note in notes:
+                    cur.execute('INSERT INTO notes (user_id, module_id, lesson_index, note, date) '
+                                'VALUES (?, ?, ?, ?, ?)',
+                                (self.user_id, module_id, int(lesson_index), note['note'], note['date']))
+            cur.execute('UPDATE users SET started_at = MIN(started_at, ?) WHERE id = ?',
+                        (data['started_at'], self.user_id))
+            cur.execute('INSERT INTO imports VALUES (?, ?, ?)',
+                        (self.user_id, source, datetime.now().isoformat()))
+        return True
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT around a cursor, rolling back on error"""
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self.cursor = self.conn.cursor()
+        self.cursor.execute('BEGIN IMMEDIATE')
+        return self.cursor
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.cursor.execute('COMMIT')
+        else:
+            self.cursor.execute('ROLLBACK')
+        self.cursor.close()
+        return False
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+RHCSA Questions - The built-in RHCSA Millionaire question pool
+
+builtin_questions() is the source of the pool; open_bank() compiles it into
+a memory-mapped bank in the user's cache directory on first use (and again
+whenever this file changes), or opens a bank file written by
+rhcsa_millionaire.py --build-bank.
+"""
+
+import time
+from typing import List
+
+import rhcsa_bank
+from rhcsa_bank import Question, QuestionBank, encode_bank
+from rhcsa_storage import Timings, load_cached, source_hash
+
+
+def builtin_questions() -> List[Question]:
+    """Built-in question pool, used when no bank file is given"""
+    questions = {
+        'easy': [
+            Question(
+                "What command displays the current working directory?",
+                ["A: ls", "B: pwd", "C: cd", "D: dir"],
+                1, "easy", "Basic Commands",
+                "This command 'prints' the 'working directory'",
+                "pwd (print working directory) displays the full path of the current directory."
+            ),
+            Question(
+                "Which file contains user account information in Linux?",
+                ["A: /etc/shadow", "B: /etc/group", "C: /etc/passwd", "D: /etc/users"],
+                2, "easy", "User Management",
+                "This file has 'passwd' in its name",
+                "/etc/passwd contains user account information including username, UID, GID, home directory, and shell."
+            ),
+            Question(
+                "What is the default permission for newly created files (before umask)?",
+                ["A: 777", "B: 755", "C: 666", "D: 644"],
+                2, "easy", "File Permissions",
+                "Files don't get execute permission by default",
+                "The default permission for files is 666 (rw-rw-rw-), which is then modified by umask."
+            ),
+            Question(
+                "Which command is used to change file ownership?",
+                ["A: chmod", "B: chown", "C: chgrp", "D: chattr"],
+                1, "easy", "File Permissions",
+                "The command name includes 'own'",
+                "chown (change owner) is used to change the user and/or group ownership of files."
+            ),
+            Question(
+                "What does the 'systemctl status' command do?",
+                ["A: Shows system time", "B: Displays service status", "C: Shows disk status", "D: Displays CPU status"],
+                1, "easy", "System Services",
+                "systemctl manages system services",
+                "systemctl status displays the current status of a systemd service or unit."
+            ),
+            Question(
+                "Which directory contains system log files?",
+                ["A: /var/log", "B: /etc/log", "C: /usr/log", "D: /tmp/log"],
+                0, "easy", "Logging",
+                "Variable data like logs go in /var",
+                "/var/log is the standard directory for system log files in Linux."
+            ),
+            Question(
+                "What command displays running processes?",
+                ["A: ls", "B: ps", "C: top", "D: Both B and C"],
+                3, "easy", "Process Management",
+                "Multiple commands can show processes",
+                "Both ps and top display running processes, with top providing real-time updates."
+            ),
+            Question(
+                "Which package manager is used in RHEL 9/10?",
+                ["A: apt", "B: yum", "C: dnf", "D: pacman"],
+                2, "easy", "Package Management",
+                "RHEL 8+ uses the 'dandified' version",
+                "dnf (Dandified YUM) is the default package manager in RHEL 8 and later versions."
+            ),
+            Question(
+                "What command shows disk usage of mounted filesystems?",
+                ["A: du", "B: df", "C: fdisk", "D: lsblk"],
+                1, "easy", "Storage",
+                "Think 'disk free'",
+                "df (disk free) displays disk space usage of mounted filesystems."
+            ),
+            Question(
+                "Which command displays SELinux status?",
+                ["A: selinux-status", "B: getenforce", "C: seinfo", "D: sestatus"],
+                3, "easy", "SELinux",
+                "Status commands often start with 'se'",
+                "sestatus provides detailed SELinux status information. getenforce shows the mode only."
+            ),
+            Question(
+                "What file must be edited to make filesystems mount automatically at boot?",
+                ["A: /etc/mtab", "B: /etc/fstab", "C: /proc/mounts", "D: /etc/auto.mount"],
+                1, "easy", "Storage Management",
+                "The 'fs' stands for filesystem",
+                "/etc/fstab (filesystem table) contains information about filesystems to mount at boot time."
+            ),
+            Question(
+                "Which command creates a new user account?",
+                ["A: adduser", "B: newuser", "C: useradd", "D: createuser"],
+                2, "easy", "User Management",
+                "The command starts with 'user'",
+                "useradd is the standard command for creating new user accounts."
+            ),
+            Question(
+                "What command shows network interface configuration?",
+                ["A: ifconfig", "B: ip addr", "C: netstat", "D: route"],
+                1, "easy", "Networking",
+                "The 'ip' command is the modern tool",
+                "'ip addr' or 'ip a' displays network interface configuration in modern Linux systems."
+            ),
+            Question(
+                "Which command makes a service start automatically at boot?",
+                ["A: systemctl start", "B: systemctl enable", "C: systemctl restart", "D: systemctl autostart"],
+                1, "easy", "System Services",
+                "Enable means 'make it automatic'",
+                "systemctl enable configures a service to start automatically at boot time."
+            ),
+            Question(
+                "What is the command to view the last 10 lines of a file?",
+                ["A: head", "B: tail", "C: cat", "D: less"],
+                1, "easy", "File Operations",
+                "Think of the 'tail' end of a file",
+                "tail displays the last 10 lines of a file by default."
+            ),
+            Question(
+                "Which key interrupt signal terminates a running process in the terminal?",
+                ["A: Ctrl+Z", "B: Ctrl+C", "C: Ctrl+D", "D: Ctrl+X"],
+                1, "easy", "Process Management",
+                "C for 'Cancel'",
+                "Ctrl+C sends SIGINT to terminate the current foreground process."
+            ),
+            Question(
+                "What command searches for files in a directory hierarchy?",
+                ["A: search", "B: locate", "C: find", "D: grep"],
+                2, "easy", "File Operations",
+                "The most direct command name",
+                "find searches for files in a directory hierarchy based on various criteria."
+            ),
+        ],
+        'medium': [
+            Question(
+                "What is the correct syntax to create a logical volume named 'lv_data' of size 5GB in volume group 'vg_main'?",
+                ["A: lvcreate -L 5G -n lv_data vg_main", "B: lvcreate -n lv_data -L 5G vg_main",
+                 "C: lvmcreate -L 5GB lv_data vg_main", "D: Both A and B"],
+                3, "medium", "LVM",
+                "Both -L and -n flag orders work",
+                "lvcreate accepts flags in any order. Both 'lvcreate -L 5G -n lv_data vg_main' and 'lvcreate -n lv_data -L 5G vg_main' are correct."
+            ),
+            Question(
+                "Which SELinux boolean allows httpd to connect to network databases?",
+                ["A: httpd_can_network_connect", "B: httpd_can_network_connect_db",
+                 "C: httpd_enable_network_db", "D: httpd_network_db_access"],
+                1, "medium", "SELinux",
+                "The boolean name is very descriptive and includes 'db'",
+                "httpd_can_network_connect_db is the SELinux boolean that allows Apache to connect to remote databases."
+            ),
+            Question(
+                "What command sets a static IP address using nmcli?",
+                ["A: nmcli con mod eth0 ipv4.addresses 192.168.1.10/24",
+                 "B: nmcli dev set eth0 ip 192.168.1.10/24",
+                 "C: nmcli connection modify eth0 ip.address 192.168.1.10/24",
+                 "D: nmcli set eth0 ipv4 192.168.1.10/24"],
+                0, "medium", "Networking",
+                "Use 'con mod' with ipv4.addresses",
+                "nmcli con mod <connection> ipv4.addresses <IP/prefix> is the correct syntax for setting a static IP."
+            ),
+            Question(
+                "What is the correct command to add a firewall rule allowing HTTP traffic permanently?",
+                ["A: firewall-cmd --add-service=http --permanent",
+                 "B: iptables -A INPUT -p tcp --dport 80 -j ACCEPT",
+                 "C: firewall-cmd --permanent --add-port=80/tcp",
+                 "D: Both A and C"],
+                3, "medium", "Firewall",
+                "Multiple methods work with firewalld",
+                "Both adding the http service and opening port 80/tcp are valid methods with firewall-cmd."
+            ),
+            Question(
+                "How do you set a password to expire in 90 days for user 'john'?",
+                ["A: chage -M 90 john", "B: passwd -e 90 john",
+                 "C: usermod --expiredate 90 john", "D: passwd --maxdays 90 john"],
+                0, "medium", "User Management",
+                "chage manages password aging, -M is for maximum days",
+                "chage -M 90 john sets the maximum number of days between password changes to 90."
+            ),
+            Question(
+                "What command creates a compressed tar archive with gzip?",
+                ["A: tar -czf archive.tar.gz files/", "B: tar -xzf archive.tar.gz",
+                 "C: gzip -c files/ > archive.tar.gz", "D: compress -z files/ archive.tar.gz"],
+                0, "medium", "File Management",
+                "c=create, z=gzip, f=file",
+                "tar -czf creates a gzip-compressed tar archive. c=create, z=gzip compression, f=filename."
+            ),
+            Question(
+                "Which command shows all currently loaded kernel modules?",
+                ["A: modprobe -l", "B: lsmod", "C: insmod --list", "D: kmod list"],
+                1, "medium", "Kernel Management",
+                "ls usually means 'list'",
+                "lsmod lists all currently loaded kernel modules by reading /proc/modules."
+            ),
+            Question(
+                "What is the correct ACL command to give user 'bob' read and write access to file.txt?",
+                ["A: setfacl -m u:bob:rw file.txt", "B: setfacl -m user:bob:rw file.txt",
+                 "C: setfacl --modify u:bob:rw file.txt", "D: All of the above"],
+                3, "medium", "ACLs",
+                "setfacl accepts multiple syntax formats",
+                "All three syntaxes are valid for setfacl. -m and --modify are equivalent, and u: and user: are interchangeable."
+            ),
+            Question(
+                "How do you schedule a one-time job to run at 2:30 AM tomorrow?",
+                ["A: at 02:30 tomorrow", "B: cron 02:30 +1day",
+                 "C: schedule --time 02:30 --date tomorrow", "D: systemd-run --on-calendar tomorrow 02:30"],
+                0, "medium", "Job Scheduling",
+                "The 'at' command is for one-time jobs",
+                "The 'at' command schedules one-time jobs. 'at 02:30 tomorrow' schedules a job for 2:30 AM the next day."
+            ),
+            Question(
+                "What command creates a swap partition on a logical volume?",
+                ["A: mkswap /dev/vg/lv_swap", "B: swapon /dev/vg/lv_swap",
+                 "C: mkfs.swap /dev/vg/lv_swap", "D: swapinit /dev/vg/lv_swap"],
+                0, "medium", "Storage Management",
+                "mk usually means 'make'",
+                "mkswap initializes a swap area on a device or partition. Then use swapon to activate it."
+            ),
+            Question(
+                "How do you create a user 'alice' with UID 2000?",
+                ["A: useradd -u 2000 alice", "B: useradd --uid=2000 alice",
+                 "C: adduser -u 2000 alice", "D: Both A and B"],
+                3, "medium", "User Management",
+                "Both -u and --uid work",
+                "useradd accepts both -u 2000 and --uid=2000 to specify a custom UID."
+            ),
+            Question(
+                "What command displays ACLs on a file?",
+                ["A: lsacl", "B: getfacl", "C: showacl", "D: acl -l"],
+                1, "medium", "File Permissions",
+                "get means retrieve",
+                "getfacl displays the file access control lists (ACLs) of a file or directory."
+            ),
+            Question(
+                "How do you find all files modified in the last 7 days?",
+                ["A: find / -mtime -7", "B: find / -mtime +7",
+                 "C: locate --modified 7", "D: search -mtime 7"],
+                0, "medium", "File Operations",
+                "Negative number means 'less than'",
+                "find / -mtime -7 finds files modified within the last 7 days. -7 means 'less than 7 days ago'."
+            ),
+            Question(
+                "What is the command to extend a logical volume by 500MB?",
+                ["A: lvextend -L +500M /dev/vg/lv", "B: lvgrow -L +500M /dev/vg/lv",
+                 "C: lvresize +500M /dev/vg/lv", "D: lvexpand -L 500M /dev/vg/lv"],
+                0, "medium", "LVM",
+                "extend means grow",
+                "lvextend -L +500M extends the logical volume by 500MB. The + sign means 'add to current size'."
+            ),
+            Question(
+                "How do you make journald logs persistent across reboots?",
+                ["A: Edit /etc/systemd/journald.conf, set Storage=persistent",
+                 "B: mkdir /var/log/journal",
+                 "C: systemctl enable journald-persistent",
+                 "D: journalctl --persistent"],
+                0, "medium", "Logging",
+                "Configuration is in journald.conf",
+                "Setting Storage=persistent in /etc/systemd/journald.conf makes journal logs persistent."
+            ),
+            Question(
+                "What command adds a repository in RHEL using yum-config-manager?",
+                ["A: yum-config-manager --add-repo=http://repo.url",
+                 "B: yum add-repo http://repo.url",
+                 "C: dnf-config add-repo http://repo.url",
+                 "D: repoconfig --add http://repo.url"],
+                0, "medium", "Package Management",
+                "yum-config-manager is the tool",
+                "yum-config-manager --add-repo=<url> adds a new repository configuration."
+            ),
+            Question(
+                "How do you set the hostname permanently?",
+                ["A: hostname newhostname", "B: hostnamectl set-hostname newhostname",
+                 "C: echo newhostname > /etc/hostname", "D: Both B and C"],
+                3, "medium", "System Configuration",
+                "hostnamectl is the modern way, but editing /etc/hostname also works",
+                "Both hostnamectl set-hostname and editing /etc/hostname make the hostname change persistent."
+            ),
+            Question(
+                "What command searches for a string in files recursively?",
+                ["A: grep -r 'pattern' /path", "B: find /path -string 'pattern'",
+                 "C: search -r 'pattern'", "D: locate 'pattern'"],
+                0, "medium", "File Operations",
+                "grep with -r for recursive",
+                "grep -r (or -R) searches for a pattern recursively through directories."
+            ),
+            Question(
+                "How do you create a cron job that runs daily at 11 PM?",
+                ["A: 0 23 * * * /path/to/script", "B: 23 0 * * * /path/to/script",
+                 "C: 0 11 * * * /path/to/script", "D: * 23 * * * /path/to/script"],
+                0, "medium", "Job Scheduling",
+                "Format is: minute hour day month weekday",
+                "Cron format: 0 23 * * * means 0 minutes past 23 hours (11 PM) every day."
+            ),
+            Question(
+                "What is the correct way to give a group 'developers' ownership of a directory?",
+                ["A: chown :developers /path/dir", "B: chgrp developers /path/dir",
+                 "C: chmod g:developers /path/dir", "D: Both A and B"],
+                3, "medium", "File Permissions",
+                "Both chown and chgrp can change group ownership",
+                "Both 'chown :groupname' and 'chgrp groupname' can change group ownership of files/directories."
+            ),
+        ],
+        'hard': [
+            Question(
+                "What is the correct procedure to extend an XFS filesystem on a logical volume?",
+                ["A: lvextend -L +5G /dev/vg/lv && xfs_growfs /mount/point",
+                 "B: lvextend -L +5G /dev/vg/lv && resize2fs /dev/vg/lv",
+                 "C: lvresize -L +5G /dev/vg/lv && xfs_resize /dev/vg/lv",
+                 "D: vgextend -L +5G /dev/vg/lv && xfs_growfs /mount/point"],
+                0, "hard", "LVM & Filesystems",
+                "XFS uses xfs_growfs, not resize2fs",
+                "For XFS, you must first extend the LV with lvextend, then grow the filesystem with xfs_growfs using the mount point."
+            ),
+            Question(
+                "Which command correctly configures a Podman container to start automatically at boot as a systemd service?",
+                ["A: podman generate systemd --name mycontainer --files --new",
+                 "B: systemctl enable podman-mycontainer.service",
+                 "C: podman create --restart=always mycontainer",
+                 "D: podman systemd-enable mycontainer"],
+                0, "hard", "Containers",
+                "Podman can generate systemd unit files",
+                "podman generate systemd creates systemd unit files for containers. The --new flag recreates the container on start."
+            ),
+            Question(
+                "What is the correct SELinux context type for files in /var/www/html/?",
+                ["A: httpd_sys_content_t", "B: httpd_sys_script_exec_t",
+                 "C: public_content_t", "D: user_home_t"],
+                0, "hard", "SELinux",
+                "httpd_sys_content_t is for web content",
+                "httpd_sys_content_t is the correct SELinux type for static web content in Apache's document root."
+            ),
+            Question(
+                "How do you configure a network team interface with activebackup runner using nmcli?",
+                ["A: nmcli con add type team con-name team0 ifname team0 config '{\"runner\": {\"name\": \"activebackup\"}}'",
+                 "B: nmcli dev team add team0 mode activebackup",
+                 "C: nmcli connection team create team0 --runner activebackup",
+                 "D: ip link add team0 type team mode activebackup"],
+                0, "hard", "Advanced Networking",
+                "nmcli uses JSON config for team interfaces",
+                "Network teaming in nmcli requires a JSON configuration string specifying the runner type."
+            ),
+            Question(
+                "What is the correct command sequence to reset root password from rescue mode?",
+                ["A: mount -o remount,rw /sysroot && chroot /sysroot && passwd root && touch /.autorelabel",
+                 "B: chroot /sysroot && passwd root && reboot",
+                 "C: mount /dev/sda1 /mnt && chroot /mnt && passwd",
+                 "D: passwd --root=/sysroot root"],
+                0, "hard", "System Recovery",
+                "Must remount rw, chroot, change password, and trigger SELinux relabel",
+                "The complete procedure requires remounting /sysroot as read-write, chrooting, changing password, and creating /.autorelabel for SELinux."
+            ),
+            Question(
+                "Which command creates a stratis pool named 'pool1' using /dev/sdb and /dev/sdc?",
+                ["A: stratis pool create pool1 /dev/sdb /dev/sdc",
+                 "B: stratis create pool pool1 /dev/sdb /dev/sdc",
+                 "C: stratis-pool --create pool1 --devices /dev/sdb,/dev/sdc",
+                 "D: stratisctl pool add pool1 /dev/sdb /dev/sdc"],
+                0, "hard", "Stratis Storage",
+                "The syntax is 'stratis pool create'",
+                "stratis pool create <pool_name> <device1> <device2> is the correct syntax for creating a Stratis pool."
+            ),
+            Question(
+                "How do you configure persistent kernel parameters?",
+                ["A: Edit /etc/default/grub, add to GRUB_CMDLINE_LINUX, run grub2-mkconfig -o /boot/grub2/grub.cfg",
+                 "B: Edit /boot/grub2/grub.cfg directly",
+                 "C: Use grubby --update-kernel=ALL --args='parameter'",
+                 "D: Both A and C"],
+                3, "hard", "Boot Process",
+                "Both methods work for persistent kernel parameters",
+                "Both editing /etc/default/grub and using grubby are valid methods for setting persistent kernel parameters."
+            ),
+            Question(
+                "What is the correct syntax for a cron job that runs every 15 minutes during business hours (9 AM - 5 PM) on weekdays?",
+                ["A: */15 9-17 * * 1-5", "B: 0,15,30,45 9-17 * * 1-5",
+                 "C: */15 9-17 * * MON-FRI", "D: All of the above"],
+                3, "hard", "Advanced Scheduling",
+                "Multiple valid cron syntaxes exist",
+                "All three syntaxes are valid. */15 means every 15 minutes, 9-17 is 9 AM to 5 PM, and 1-5 or MON-FRI represents weekdays."
+            ),
+            Question(
+                "Which command correctly configures a VDO volume with 10:1 logical to physical ratio on LVM?",
+                ["A: vdo create --name=vdo1 --device=/dev/sdb --vdoLogicalSize=100G",
+                 "B: lvcreate --type vdo -L 10G -V 100G -n vdo1 vg_name",
+                 "C: vdocreate -L 10G -V 100G vdo1",
+                 "D: Both A and B"],
+                3, "hard", "VDO Storage",
+                "VDO can be created standalone or as LVM type",
+                "Both standalone VDO and LVM-VDO are valid. With LVM: -L is physical size, -V is virtual/logical size."
+            ),
+            Question(
+                "How do you configure autofs to automount NFS home directories?",
+                ["A: Create /etc/auto.master.d/home.autofs with '/home/guests /etc/auto.home'",
+                 "B: Edit /etc/auto.home with '* -rw,sync server:/path/&'",
+                 "C: systemctl enable --now autofs",
+                 "D: All of the above"],
+                3, "hard", "Advanced Storage",
+                "All steps are required for autofs NFS mounting",
+                "Autofs requires creating master map entry, indirect map with wildcards, and enabling the service."
+            ),
+            Question(
+                "What is the complete command to create a Podman container as a user service on port 8080?",
+                ["A: podman run -d -p 8080:80 --name web httpd",
+                 "B: podman run -d -p 8080:80 -v /data:/var/www:Z --name web httpd",
+                 "C: Create container, generate systemd unit, enable with --user flag, loginctl enable-linger",
+                 "D: podman create --user-service -p 8080:80 web"],
+                2, "hard", "Containers",
+                "Multiple steps required for persistent user service",
+                "User services require: create container, generate systemd unit in ~/.config/systemd/user/, enable with --user, and enable-linger."
+            ),
+            Question(
+                "How do you set SELinux context for a directory permanently?",
+                ["A: chcon -R -t httpd_sys_content_t /web",
+                 "B: semanage fcontext -a -t httpd_sys_content_t '/web(/.*)?' && restorecon -Rv /web",
+                 "C: restorecon -Rv /web",
+                 "D: setcontext -R httpd_sys_content_t /web"],
+                1, "hard", "SELinux",
+                "semanage makes changes permanent in policy",
+                "semanage fcontext adds the rule to policy, then restorecon applies it. chcon is temporary only."
+            ),
+            Question(
+                "What is the correct procedure to reduce an LVM logical volume with ext4 filesystem?",
+                ["A: Unmount, e2fsck, resize2fs to smaller size, lvreduce, mount",
+                 "B: lvreduce -L -2G /dev/vg/lv && resize2fs /dev/vg/lv",
+                 "C: resize2fs /dev/vg/lv 5G && lvreduce -L 5G /dev/vg/lv",
+                 "D: lvreduce -r -L 5G /dev/vg/lv"],
+                0, "hard", "LVM & Filesystems",
+                "Must shrink filesystem BEFORE reducing LV",
+                "For ext4 reduction: unmount, check filesystem with e2fsck, shrink filesystem with resize2fs, then reduce LV with lvreduce."
+            ),
+            Question(
+                "How do you configure a system to use a specific tuned profile?",
+                ["A: tuned-adm profile virtual-guest",
+                 "B: systemctl enable tuned && tuned-adm profile throughput-performance",
+                 "C: Edit /etc/tuned/active_profile",
+                 "D: All of the above work"],
+                3, "hard", "System Tuning",
+                "Multiple valid approaches",
+                "All methods work: tuned-adm is the primary tool, editing active_profile works, and tuned service must be enabled."
+            ),
+            Question(
+                "What command creates a VDO volume with deduplication on /dev/sdb?",
+                ["A: vdo create --name=vdo1 --device=/dev/sdb --vdoLogicalSize=50G",
+                 "B: mkfs.xfs -K /dev/mapper/vdo1 after creating VDO",
+                 "C: Mount with _netdev,x-systemd.requires=vdo.service in fstab",
+                 "D: All of the above are required"],
+                3, "hard", "VDO Storage",
+                "VDO setup requires multiple steps",
+                "Complete VDO setup: create volume with vdo, format with -K (no discard), mount with systemd dependencies."
+            ),
+            Question(
+                "How do you configure boot target to multi-user (non-graphical)?",
+                ["A: systemctl set-default multi-user.target",
+                 "B: systemctl isolate multi-user.target",
+                 "C: ln -sf /lib/systemd/system/multi-user.target /etc/systemd/system/default.target",
+                 "D: Both A and C"],
+                3, "hard", "Boot Process",
+                "Both methods change default target",
+                "systemctl set-default creates the symlink automatically. Manual symlink creation also works."
+            ),
+            Question(
+                "What is the correct way to add a kernel parameter only for the current boot?",
+                ["A: Press 'e' at GRUB, add parameter to linux line, Ctrl-x to boot",
+                 "B: Edit /etc/default/grub and reboot",
+                 "C: grubby --update-kernel=DEFAULT --args='parameter'",
+                 "D: Edit /boot/grub2/grub.cfg"],
+                0, "hard", "Boot Process",
+                "GRUB editor allows one-time boot changes",
+                "Editing GRUB at boot with 'e' key allows temporary kernel parameter changes for that boot only."
+            ),
+            Question(
+                "How do you find all files in /etc owned by user ID 1000?",
+                ["A: find /etc -uid 1000",
+                 "B: find /etc -user 1000",
+                 "C: locate /etc -uid 1000",
+                 "D: grep -r uid:1000 /etc"],
+                0, "hard", "File Operations",
+                "find with -uid for numeric user ID",
+                "find /etc -uid 1000 searches for files owned by UID 1000. -user expects username not number."
+            ),
+            Question(
+                "What command correctly configures NFS mount with _netdev option in fstab?",
+                ["A: server:/share /mnt nfs defaults,_netdev 0 0",
+                 "B: server:/share /mnt nfs4 rw,_netdev 0 0",
+                 "C: Both are correct",
+                 "D: NFS doesn't need _netdev"],
+                2, "hard", "Advanced Storage",
+                "_netdev is important for network filesystems",
+                "Both nfs and nfs4 work. _netdev option ensures mount waits for network, critical for NFS at boot."
+            ),
+            Question(
+                "How do you create a shared directory with SGID bit for group collaboration?",
+                ["A: mkdir /shared && chmod 2770 /shared && chgrp developers /shared",
+                 "B: mkdir /shared && chmod g+s,770 /shared && chown :developers /shared",
+                 "C: Both A and B are correct",
+                 "D: chmod 770 /shared && setgid developers"],
+                2, "hard", "Advanced Permissions",
+                "SGID is 2000 in octal or g+s",
+                "Both methods set SGID (2770 or g+s). SGID ensures new files inherit group ownership. chgrp or chown :group both work."
+            ),
+        ]
+    }
+    return questions['easy'] + questions['medium'] + questions['hard']
+
+
+def open_bank(bank_path: str = None, timings: Timings = None) -> QuestionBank:
+    """Open a bank file, or the built-in pool when no path is given
+
+    The built-in pool is compiled once into the user's cache directory and
+    rebuilt whenever this source changes.
+    """
+    if bank_path:
+        start = time.perf_counter()
+        bank = QuestionBank.open(bank_path)
+        if timings:
+            timings.record('questions', 'file', time.perf_counter() - start)
+        return bank
+    return load_cached(
+        'questions', source_hash(__file__, rhcsa_bank.__file__), '.qbank',
+        build=lambda: encode_bank(builtin_questions()),
+        load=QuestionBank.open, fallback=QuestionBank, timings=timings)
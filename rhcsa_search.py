@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+RHCSA Search - Full-text search over RHCSA Academy lessons and quizzes
+
+Content is tokenized with shell syntax in mind: flags ("-Z", "--uid"),
+permission modes ("g+s", "2770"), paths ("/etc/fstab") and assignments
+("SELINUX=enforcing") survive as whole tokens, and their pieces are indexed
+too so a search for "fstab" still finds "/etc/fstab". The inverted index is
+ranked with BM25 and serialized to JSON so it can be cached between runs.
+
+A separate trigram index covers lesson commands and Millionaire question
+text and options for typo-tolerant lookups ("semanag fcontxt").
+"""
+
+import re
+import json
+import math
+import heapq
+import struct
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Runs of characters that make up words, flags, paths and modes
+_TOKEN = re.compile(r"[\w./+=:@%~-]+")
+_SPLIT = re.compile(r"[./+=:@%~-]+")
+_TRIM = '.,:;'
+
+# Field weights: a hit in a title counts more than one in the theory text
+LESSON_FIELD_WEIGHTS = {
+    'title': 3, 'commands': 2, 'theory': 1, 'example': 1, 'tips': 1,
+    'exam_question': 1, 'exam_solution': 1,
+}
+QUIZ_FIELD_WEIGHTS = {'question': 2, 'options': 1, 'explanation': 1}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into search terms
+
+    Flags keep their case ("-Z" and "-z" differ); everything else is
+    lowercased. Compound tokens also yield their alphanumeric pieces.
+    """
+    terms = []
+    for raw in _TOKEN.findall(text):
+        token = raw.rstrip(_TRIM)
+        if not token:
+            continue
+        if not token.startswith('-'):
+            token = token.lower()
+        if len(token) > 1 or token.isalnum():
+            terms.append(token)
+        if _SPLIT.search(token):
+            terms.extend(part.lower() for part in _SPLIT.split(token) if len(part) > 1)
+    return terms
+
+
+def _field_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return '\n'.join(str(v) for v in value)
+    return str(value)
+
+
+class SearchIndex:
+    """Inverted index from term to {document: weighted term frequency}
+
+    Documents are (kind, module id, position, title) tuples where kind is
+    'lesson' or 'quiz' and position indexes module.lessons or module.quiz.
+    """
+
+    def __init__(self):
+        self.docs: List[Tuple[str, str, int, str]] = []
+        self.lengths: List[int] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+    @classmethod
+    def build(cls, modules: Iterable) -> 'SearchIndex':
+        """Index every lesson and quiz question of the given modules"""
+        index = cls()
+        for module in modules:
+            for i, lesson in enumerate(module.lessons):
+                index.add(('lesson', module.id, i, lesson.title),
+                          {f: getattr(lesson, f) for f in LESSON_FIELD_WEIGHTS})
+            for i, quiz in enumerate(module.quiz):
+                index.add(('quiz', module.id, i, quiz.question),
+                          {f: getattr(quiz, f) for f in QUIZ_FIELD_WEIGHTS})
+        return index
+
+    def add(self, doc: Tuple[str, str, int, str], fields: Dict[str, object]):
+        """Add one document given its field values"""
+        weights = LESSON_FIELD_WEIGHTS if doc[0] == 'lesson' else QUIZ_FIELD_WEIGHTS
+        doc_id = len(self.docs)
+        self.docs.append(tuple(doc))
+        length = 0
+        for field, value in fields.items():
+            weight = weights.get(field, 1)
+            for term in tokenize(_field_text(value)):
+                postings = self.postings.setdefault(term, {})
+                postings[doc_id] = postings.get(doc_id, 0) + weight
+                length += weight
+        self.lengths.append(length)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[float, Tuple[str, str, int, str]]]:
+        """Return up to limit (score, doc) pairs ranked by BM25"""
+        if not self.docs:
+            return []
+        n_docs = len(self.docs)
+        avg_length = sum(self.lengths) / n_docs or 1
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, self.docs[doc_id]) for doc_id, score in ranked]
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({
+            'docs': self.docs,
+            'lengths': self.lengths,
+            'postings': {term: [[d, tf] for d, tf in p.items()] for term, p in self.postings.items()},
+        }, separators=(',', ':')).encode('utf-8')
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SearchIndex':
+        raw = json.loads(data.decode('utf-8'))
+        index = cls()
+        index.docs = [tuple(doc) for doc in raw['docs']]
+        index.lengths = raw['lengths']
+        index.postings = {term: dict(p) for term, p in raw['postings'].items()}
+        return index
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+# Trigram index entry kinds: a lesson command, a question's text, one option
+ENTRY_COMMAND = 0
+ENTRY_QUESTION = 1
+ENTRY_OPTION = 2
+
+TRIGRAM_MAGIC = b'RHTG'
+TRIGRAM_VERSION = 1
+TRIGRAM_HEADER = struct.Struct('<4sHHII')  # magic, version, reserved, entries, table length
+
+_SPACES = re.compile(r"\s+")
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct character trigrams of normalized, space-padded text"""
+    text = ' ' + _SPACES.sub(' ', text.lower()).strip() + ' '
+    return list({text[i:i + 3] for i in range(len(text) - 2)})
+
+
+class TrigramIndex:
+    """Typo-tolerant lookup over commands, questions and options
+
+    Each entry points back at its source: (ENTRY_COMMAND, module number,
+    lesson index) or (ENTRY_QUESTION / ENTRY_OPTION, question id, option
+    index). Entries are stored column-wise in arrays and the postings in one
+    array of entry ids, so the serialized index stays small. Entries can be
+    added at any time, including after loading.
+    """
+
+    def __init__(self):
+        self.modules: List[str] = []
+        self._module_codes: Dict[str, int] = {}
+        self.kinds = array('B')
+        self.keys = array('I')
+        self.positions = array('h')
+        self.sizes = array('H')
+        self._postings: Dict[str, array] = {}
+        # postings of a loaded index stay in the serialized blob until touched
+        self._table: Dict[str, Tuple[int, int]] = {}
+        self._blob = b''
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def _postings_for(self, gram: str, writable: bool = False) -> array:
+        postings = self._postings.get(gram)
+        if postings is None:
+            postings = array('I')
+            if gram in self._table:
+                offset, count = self._table[gram]
+                postings.frombytes(self._blob[offset * 4:(offset + count) * 4])
+            if writable or gram in self._table:
+                self._postings[gram] = postings
+        return postings
+
+    def _add(self, kind: int, key: int, position: int, text: str):
+        entry = len(self.kinds)
+        grams = trigrams(text)
+        self.kinds.append(kind)
+        self.keys.append(key)
+        self.positions.append(position)
+        self.sizes.append(min(len(grams), 0xFFFF))
+        for gram in grams:
+            self._postings_for(gram, writable=True).append(entry)
+
+    def add_command(self, module_id: str, lesson_index: int, command: str):
+        code = self._module_codes.get(module_id)
+        if code is None:
+            code = self._module_codes[module_id] = len(self.modules)
+            self.modules.append(module_id)
+        self._add(ENTRY_COMMAND, code, lesson_index, command)
+
+    def add_question(self, qid: int, question: str, options: List[str]):
+        self._add(ENTRY_QUESTION, qid, -1, question)
+        for i, option in enumerate(options):
+            self._add(ENTRY_OPTION, qid, i, option)
+
+    def lookup(self, query: str, limit: int = 5, budget: int = 20000,
+               min_score: float = 0.4) -> List[Tuple[float, Tuple]]:
+        """Best matching targets for a possibly misspelled query
+
+        Trigrams are visited rarest first and counting stops once budget
+        postings have been scanned, which bounds latency for common trigrams.
+        Returns (score, target) pairs where target is ('lesson', module id,
+        lesson index) or ('question', question id); each target appears once.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        lists = sorted((self._postings_for(g) for g in grams), key=len)
+        counts: Dict[int, int] = {}
+        scanned = 0
+        for postings in lists:
+            if counts and scanned + len(postings) > budget:
+                break
+            scanned += len(postings)
+            for entry in postings:
+                counts[entry] = counts.get(entry, 0) + 1
+
+        n = len(grams)
+        best: Dict[Tuple, float] = {}
+        for entry, shared in counts.items():
+            # containment of the query, nudged towards entries of similar size
+            score = shared / n - 0.1 * abs(self.sizes[entry] - n) / max(self.sizes[entry], n)
+            if score < min_score:
+                continue
+            if self.kinds[entry] == ENTRY_COMMAND:
+                target = ('lesson', self.modules[self.keys[entry]], self.positions[entry])
+            else:
+                target = ('question', self.keys[entry])
+            if score > best.get(target, -1.0):
+                best[target] = score
+        ranked = heapq.nlargest(limit, best.items(), key=lambda item: item[1])
+        return [(score, target) for target, score in ranked]
+
+    def to_bytes(self) -> bytes:
+        table = {}
+        postings = array('I')
+        for gram in set(self._table) | set(self._postings):
+            entries = self._postings_for(gram)
+            table[gram] = (len(postings), len(entries))
+            postings.extend(entries)
+        raw_table = json.dumps({'modules': self.modules, 'trigrams': table},
+                               separators=(',', ':')).encode('utf-8')
+        header = TRIGRAM_HEADER.pack(TRIGRAM_MAGIC, TRIGRAM_VERSION, 0, len(self.kinds), len(raw_table))
+        return b''.join([header, raw_table, self.kinds.tobytes(), self.keys.tobytes(),
+                         self.positions.tobytes(), self.sizes.tobytes(), postings.tobytes()])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'TrigramIndex':
+        magic, version, _, count, table_len = TRIGRAM_HEADER.unpack_from(data, 0)
+        if magic != TRIGRAM_MAGIC or version != TRIGRAM_VERSION:
+            raise ValueError("Not a compatible trigram index")
+        pos = TRIGRAM_HEADER.size
+        raw = json.loads(data[pos:pos + table_len].decode('utf-8'))
+        pos += table_len
+        index = cls()
+        index.modules = raw['modules']
+        index._module_codes = {m: i for i, m in enumerate(index.modules)}
+        index._table = {gram: tuple(loc) for gram, loc in raw['trigrams'].items()}
+        for column in (index.kinds, index.keys, index.positions, index.sizes):
+            size = column.itemsize * count
+            column.frombytes(data[pos:pos + size])
+            pos += size
+        index._blob = data[pos:]
+        return index
+
+    @classmethod
+    def load(cls, path: str) -> 'TrigramIndex':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def build(cls, modules: Iterable, bank=None) -> 'TrigramIndex':
+        """Index every lesson command and, given a bank, every question"""
+        index = cls()
+        for module in modules:
+            for i, lesson in enumerate(module.lessons):
+                for command in lesson.commands:
+                    index.add_command(module.id, i, command)
+        if bank is not None:
+            for qid in range(len(bank)):
+                question = bank.get(qid)
+                index.add_question(qid, question.question, question.options)
+        return index
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+RHCSA Server - Host many RHCSA Millionaire games in one process
+
+Clients connect over TCP or a Unix socket and send one command per line;
+every command gets exactly one JSON object per line back.
+
+    START [seed]                deal a new game, returns the first question
+    QUESTION                    repeat the current question
+    ANSWER <A|B|C|D>            answer it, returns the outcome and the next question
+    LIFELINE <5050|hint|skip>   use a lifeline on the current question
+    RESULT                      score, accuracy and topic stats so far
+    STATS                       server-wide session, memory and CPU counters
+    QUIT
+
+Each connection gets its own GameEngine over the one shared, memory-mapped
+question bank. Pauses between rounds are asyncio timers, so a slow or idle
+player never holds up anyone else. With evict_after set, a session that has
+been quiet that long is written to disk as a ~100 byte snapshot and its
+engine dropped; the next command restores it, so resident memory tracks the
+active players rather than every open connection.
+
+    python3 rhcsa_millionaire.py --serve 127.0.0.1:8200
+    python3 rhcsa_millionaire.py --serve unix:/run/rhcsa/game.sock
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+from typing import Dict, Optional
+
+from rhcsa_bank import QuestionBank
+from rhcsa_answerlog import AnswerLog
+from rhcsa_engine import GameEngine, GameError
+from rhcsa_storage import cache_dir
+
+IDLE_TIMEOUT = 600  # seconds without a command before a session is dropped
+BACKLOG = 4096  # pending connections; the asyncio default of 100 drops bursts
+
+# Engine attributes shared by every session, left out of per-session sizes
+_SHARED = {'bank', 'recent'}
+
+
+def deep_size(obj, seen: set = None) -> int:
+    """Approximate bytes held by obj and the containers it references"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+class Session:
+    """One connection's game
+
+    engine is None while the session is evicted; spilled is then the path
+    of its snapshot, or None if no game had been dealt yet, and session_id
+    the game's answer-log session, which the snapshot does not hold.
+    """
+    __slots__ = ('serial', 'engine', 'spilled', 'session_id', 'commands')
+
+    def __init__(self, serial: int, engine: GameEngine):
+        self.serial = serial
+        self.engine = engine
+        self.spilled: Optional[str] = None
+        self.session_id: Optional[str] = None
+        self.commands = 0
+
+    def memory(self) -> int:
+        """Bytes of game state owned by this session (the bank is shared)"""
+        if self.engine is None:
+            return sys.getsizeof(self) + sum(sys.getsizeof(value) for value in (self.spilled, self.session_id)
+                                             if value is not None)
+        state = {k: v for k, v in vars(self.engine).items() if k not in _SHARED}
+        return sys.getsizeof(self) + sys.getsizeof(self.engine) + deep_size(state)
+
+
+def question_payload(engine: GameEngine) -> Optional[Dict]:
+    """The current question as the client sees it (without the answer)"""
+    question = engine.current_question()
+    if question is None:
+        return None
+    return {
+        'number': engine.current + 1,
+        'of': engine.total_questions(),
+        'difficulty': question.difficulty,
+        'topic': question.topic,
+        'text': question.question,
+        'options': question.options,
+        'worth': engine.current_value(),
+        'score': engine.score,
+        'lives': engine.lives,
+        'lifelines': [kind for kind, left in engine.lifelines.items() if left],
+    }
+
+
+class GameServer:
+    """Serves the line protocol for any number of concurrent sessions
+
+    pace delays each answer's reply the way the terminal game pauses after
+    a result; idle_timeout drops sessions that stop sending commands and
+    evict_after (if shorter) moves quiet sessions out to snapshots in
+    spill_dir until they speak again. Every answer is appended to
+    answer_log when one is given; give it background=True so the appends
+    happen on its writer thread rather than in the event loop.
+    """
+    def __init__(self, bank: QuestionBank, pace: float = 0.0, idle_timeout: float = IDLE_TIMEOUT,
+                 evict_after: Optional[float] = None, spill_dir: Optional[str] = None,
+                 answer_log: Optional[AnswerLog] = None):
+        self.bank = bank
+        self.answer_log = answer_log
+        self.pace = pace
+        self.idle_timeout = idle_timeout
+        self.evict_after = evict_after
+        self.spill_dir = spill_dir or os.path.join(cache_dir(), 'sessions')
+        self.sessions = set()
+        self.peak_sessions = 0
+        self.connections = 0
+        self.games = 0
+        self.commands = 0
+        self.evictions = 0
+        self.restores = 0
+        self.started = time.monotonic()
+
+    def new_engine(self) -> GameEngine:
+        return GameEngine(self.bank, on_answer=self.answer_log.append if self.answer_log else None)
+
+    async def readline(self, reader: asyncio.StreamReader, session: Session) -> bytes:
+        """Next command line, evicting the session if it stays quiet long enough"""
+        timeout = self.idle_timeout
+        if self.evict_after is not None and self.evict_after < timeout and session.engine is not None:
+            try:
+                return await asyncio.wait_for(reader.readline(), self.evict_after)
+            except asyncio.TimeoutError:
+                await self.evict(session)
+            timeout -= self.evict_after
+        return await asyncio.wait_for(reader.readline(), timeout)
+
+    async def evict(self, session: Session):
+        """Write the session's game to disk and drop its engine
+
+        The file is written on a worker thread. If it cannot be written the
+        engine simply stays in memory.
+        """
+        engine = session.engine
+        if engine.question_ids:
+            path = os.path.join(self.spill_dir, f"{os.getpid()}-{session.serial}.game")
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _write_spill, path, engine.snapshot())
+            except OSError as e:
+                print(f"Warning: cannot evict session {session.serial}, keeping it in memory ({e})",
+                      file=sys.stderr)
+                return
+            session.spilled = path
+            session.session_id = engine.session_id
+        session.engine = None
+        self.evictions += 1
+
+    async def wake(self, session: Session):
+        """Bring an evicted session's game back into memory
+
+        The snapshot is read (and removed) on a worker thread, and the game
+        keeps its session id so the answer log sees one session. If the
+        spilled game is gone or cannot be restored the session gets a fresh
+        engine and GameError says the game was lost; the next START begins
+        a new one.
+        """
+        engine = self.new_engine()
+        path, session.spilled = session.spilled, None
+        try:
+            if path:
+                data = await asyncio.get_running_loop().run_in_executor(None, _take_spill, path)
+                engine.restore(data, session_id=session.session_id)
+        except (OSError, GameError) as e:
+            session.engine = self.new_engine()
+            raise GameError(f"Your game could not be restored ({e}); send START for a new one")
+        finally:
+            session.session_id = None
+        session.engine = engine
+        self.restores += 1
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        session = Session(self.connections, self.new_engine())
+        self.sessions.add(session)
+        self.peak_sessions = max(self.peak_sessions, len(self.sessions))
+        try:
+            while True:
+                try:
+                    line = await self.readline(reader, session)
+                except asyncio.TimeoutError:
+                    self.send(writer, {'ok': False, 'error': "idle timeout"})
+                    break
+                if not line:
+                    break
+                command, _, arg = line.decode('utf-8', 'replace').strip().partition(' ')
+                command = command.upper()
+                if command == 'QUIT':
+                    self.send(writer, {'ok': True})
+                    break
+                reply = await self.dispatch(session, command, arg.strip())
+                if self.pace and command == 'ANSWER' and reply['ok']:
+                    await asyncio.sleep(self.pace)
+                self.send(writer, reply)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            if session.spilled:
+                asyncio.get_running_loop().run_in_executor(None, _remove_spill, session.spilled)
+            writer.close()
+
+    @staticmethod
+    def send(writer: asyncio.StreamWriter, reply: Dict):
+        writer.write(json.dumps(reply, separators=(',', ':')).encode('utf-8') + b'\n')
+
+    async def dispatch(self, session: Session, command: str, arg: str) -> Dict:
+        """Run one command against a session and build its reply"""
+        session.commands += 1
+        self.commands += 1
+        try:
+            if session.engine is None:
+                await self.wake(session)
+            engine = session.engine
+            if command == 'START':
+                engine.start(int(arg) if arg else None)
+                self.games += 1
+                return {'ok': True, 'question': question_payload(engine)}
+            if command == 'QUESTION':
+                return {'ok': True, 'question': question_payload(engine)}
+            if command == 'ANSWER':
+                outcome = engine.answer(arg)
+                return dict(outcome, ok=True, question=question_payload(engine))
+            if command == 'LIFELINE':
+                used = engine.use_lifeline(arg.lower())
+                return dict(used, ok=True, question=question_payload(engine))
+            if command == 'RESULT':
+                result = engine.result()
+                del result['history']
+                return dict(result, ok=True)
+            if command == 'STATS':
+                return dict(self.stats(), ok=True)
+        except (GameError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}
+        return {'ok': False, 'error': f"unknown command {command!r}"}
+
+    def stats(self) -> Dict:
+        """Session counts, game state memory and CPU time so far"""
+        memory = sum(session.memory() for session in self.sessions)
+        return {
+            'sessions': len(self.sessions),
+            'resident_sessions': sum(1 for session in self.sessions if session.engine is not None),
+            'peak_sessions': self.peak_sessions,
+            'connections': self.connections,
+            'games': self.games,
+            'commands': self.commands,
+            'evictions': self.evictions,
+            'restores': self.restores,
+            'session_bytes': memory,
+            'bytes_per_session': memory // len(self.sessions) if self.sessions else 0,
+            'cpu_seconds': time.process_time(),
+            'uptime_seconds': time.monotonic() - self.started,
+        }
+
+
+def _write_spill(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _take_spill(path: str) -> bytes:
+    """Read a spilled snapshot and remove its file, even if reading fails"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        _remove_spill(path)
+
+
+def _remove_spill(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+async def start_server(server: GameServer, address: str):
+    """Listen on "unix:PATH" or "[HOST]:PORT"""
+    if address.startswith('unix:'):
+        path = address[len('unix:'):]
+        if os.path.exists(path):
+            os.unlink(path)
+        return await asyncio.start_unix_server(server.handle, path=path, backlog=BACKLOG)
+    host, _, port = address.rpartition(':')
+    return await asyncio.start_server(server.handle, host=host or None, port=int(port), backlog=BACKLOG)
+
+
+def serve(address: str, bank: QuestionBank, pace: float = 0.0, idle_timeout: float = IDLE_TIMEOUT,
+          evict_after: Optional[float] = None, answer_log: Optional[AnswerLog] = None):
+    """Run a game server until interrupted"""
+    async def run():
+        server = GameServer(bank, pace, idle_timeout, evict_after, answer_log=answer_log)
+        listener = await start_server(server, address)
+        print(f"  Serving RHCSA Millionaire on {address}", file=sys.stderr, flush=True)
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if answer_log:
+            answer_log.close()
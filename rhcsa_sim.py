@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+RHCSA Sim - Monte Carlo simulation of RHCSA Millionaire scoring rules
+
+Plays large numbers of games with bot players to show how the point ladder,
+safe havens, lives and lifelines shape the scores real players would see.
+A bot knows the answer to a question with its accuracy for that question's
+topic; otherwise it is unsure and, following its lifeline policy, takes the
+hint (which lets it work out the answer with probability hint_gain), then
+50/50 (then guesses between two), then skip, or simply guesses among four.
+
+Games are played in NumPy batches, one vector operation per question
+position across the whole batch, using the constants and rules of
+GameEngine: a correct answer earns the question's points; a wrong one costs
+a life, lifts the score to the safe-haven value when lives remain on a
+haven question, and ends the game on the question itself when it was the
+last life; a skip moves on without points. Topics are drawn per question
+from the bank's topic mix for that difficulty (with replacement, where a
+real deal draws without).
+
+Without NumPy, or with --engine, games are played one at a time through
+GameEngine itself; that path is the reference the batches are checked
+against, at a few thousand games a second.
+
+    python3 rhcsa_sim.py --games 10000000 --accuracy 0.7
+    python3 rhcsa_sim.py --topic-accuracy SELinux=0.4 --topic-accuracy Networking=0.5
+    python3 rhcsa_sim.py --lives 2 --safe-haven 5=10000 --safe-haven 10=100000
+"""
+
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # fall back to playing games through GameEngine
+    np = None
+
+from rhcsa_bank import DIFFICULTY_ORDER, OPTION_LETTERS, QuestionBank
+from rhcsa_engine import GameEngine
+from rhcsa_questions import open_bank
+
+BATCH = 1_000_000
+# Score thresholds reported as "share of games at or above"
+MILESTONES = (5000, 50000, 250000, 1000000)
+
+
+class Bot:
+    """A simulated player: per-topic accuracy plus a lifeline policy
+
+    Each lifeline is only used from its (0-based) question position on, and
+    only when the bot does not know the answer.
+    """
+    def __init__(self, accuracy: float = 0.7, topic_accuracy: Dict[str, float] = None,
+                 hint_gain: float = 0.5, lifeline_from: Dict[str, int] = None):
+        self.accuracy = accuracy
+        self.topic_accuracy = topic_accuracy or {}
+        self.hint_gain = hint_gain
+        self.lifeline_from = {'5050': 0, 'hint': 0, 'skip': 0}
+        self.lifeline_from.update(lifeline_from or {})
+
+    def knows(self, topic: str) -> float:
+        return self.topic_accuracy.get(topic, self.accuracy)
+
+
+class Rules:
+    """Scoring constants, GameEngine's unless overridden"""
+    def __init__(self, point_values: List[int] = None, safe_haven_scores: Dict[int, int] = None,
+                 lives: int = None, lifelines: List[str] = None):
+        self.point_values = list(point_values or GameEngine.POINT_VALUES)
+        self.safe_haven_scores = dict(GameEngine.SAFE_HAVEN_SCORES if safe_haven_scores is None
+                                      else safe_haven_scores)
+        self.lives = GameEngine.LIVES if lives is None else lives
+        self.lifelines = tuple(GameEngine.LIFELINES if lifelines is None else lifelines)
+        questions = GameEngine.QUESTIONS_PER_DIFFICULTY * len(DIFFICULTY_ORDER)
+        if len(self.point_values) != questions:
+            raise ValueError(f"The point ladder needs {questions} values")
+
+    def without(self, lifeline: str) -> 'Rules':
+        """The same rules with one lifeline taken away"""
+        return Rules(self.point_values, self.safe_haven_scores, self.lives,
+                     [kind for kind in self.lifelines if kind != lifeline])
+
+    def engine_class(self) -> type:
+        """GameEngine with these constants, for the reference path"""
+        return type('TunedEngine', (GameEngine,), {
+            'POINT_VALUES': self.point_values,
+            'SAFE_HAVEN_SCORES': self.safe_haven_scores,
+            'SAFE_HAVENS': sorted(self.safe_haven_scores),
+            'LIVES': self.lives,
+        })
+
+
+def topic_mix(bank: QuestionBank, questions: int) -> List[Dict[str, float]]:
+    """Topic probabilities for each question position, as GameEngine deals them"""
+    per_difficulty = GameEngine.QUESTIONS_PER_DIFFICULTY
+    mix = []
+    for position in range(questions):
+        difficulty = DIFFICULTY_ORDER[min(position // per_difficulty, len(DIFFICULTY_ORDER) - 1)]
+        strata = bank.strata(difficulty)
+        total = sum(count for _, _, count in strata)
+        mix.append({topic: count / total for topic, _, count in strata})
+    return mix
+
+
+class Summary:
+    """Running totals over simulated games"""
+    def __init__(self, rules: Rules):
+        self.rules = rules
+        self.games = 0
+        self.completed = 0
+        self.answered = 0
+        self.score_total = 0
+        self.milestones = [0] * len(MILESTONES)
+        # Every reachable score is a sum of ladder values or a haven, so a
+        # Counter-style dict stays small however many games are played
+        self.scores: Dict[int, int] = {}
+
+    def add_batch(self, scores, answered, completed):
+        values, counts = np.unique(scores, return_counts=True)
+        for value, count in zip(values.tolist(), counts.tolist()):
+            self.scores[value] = self.scores.get(value, 0) + count
+        self.games += len(scores)
+        self.completed += int(completed.sum())
+        self.answered += int(answered.sum())
+        self.score_total += int(scores.sum(dtype=np.int64))
+        for i, threshold in enumerate(MILESTONES):
+            self.milestones[i] += int((scores >= threshold).sum())
+
+    def add_game(self, score: int, answered: int, completed: bool):
+        self.scores[score] = self.scores.get(score, 0) + 1
+        self.games += 1
+        self.completed += completed
+        self.answered += answered
+        self.score_total += score
+        for i, threshold in enumerate(MILESTONES):
+            self.milestones[i] += score >= threshold
+
+    @property
+    def mean(self) -> float:
+        return self.score_total / self.games if self.games else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Score below which a fraction q of games fall"""
+        target = q * self.games
+        seen = 0
+        for value in sorted(self.scores):
+            seen += self.scores[value]
+            if seen >= target:
+                return value
+        return 0
+
+    def report(self) -> Dict:
+        games = self.games or 1
+        return {
+            'games': self.games,
+            'mean_score': self.mean,
+            'p10': self.percentile(0.10),
+            'median': self.percentile(0.50),
+            'p90': self.percentile(0.90),
+            'completion_rate': self.completed / games,
+            'questions_answered': self.answered / games,
+            'milestones': {threshold: count / games
+                           for threshold, count in zip(MILESTONES, self.milestones)},
+        }
+
+
+def play_batch(rules: Rules, bot: Bot, mix: List[Dict[str, float]], n: int, rng) -> tuple:
+    """Play n games at once; returns (scores, questions answered, completed)"""
+    questions = len(rules.point_values)
+    score = np.zeros(n, dtype=np.int64)
+    lives = np.full(n, rules.lives, dtype=np.int8)
+    current = np.zeros(n, dtype=np.int8)
+    have = {kind: np.full(n, kind in rules.lifelines) for kind in GameEngine.LIFELINES}
+
+    for position in range(questions):
+        alive = lives > 0
+        if not alive.any():
+            break
+        topics = list(mix[position])
+        p_know = np.array([bot.knows(topic) for topic in topics], dtype=np.float32)
+        if len(topics) > 1:
+            weights = np.array([mix[position][topic] for topic in topics])
+            p_know = p_know[rng.choice(len(topics), size=n, p=weights)]
+        knows = rng.random(n, dtype=np.float32) < p_know
+        unsure = alive & ~knows
+
+        use = unsure & have['hint'] & (position >= bot.lifeline_from['hint'])
+        have['hint'] &= ~use
+        knows |= use & (rng.random(n, dtype=np.float32) < bot.hint_gain)
+        unsure &= ~knows
+
+        halved = unsure & have['5050'] & (position >= bot.lifeline_from['5050'])
+        have['5050'] &= ~halved
+        skipped = unsure & ~halved & have['skip'] & (position >= bot.lifeline_from['skip'])
+        have['skip'] &= ~skipped
+
+        guess = rng.random(n, dtype=np.float32)
+        correct = knows | (unsure & ~skipped &
+                           (guess < np.where(halved, 0.5, 1 / len(OPTION_LETTERS))))
+        answered = alive & ~skipped
+        right = answered & correct
+        wrong = answered & ~correct
+
+        score += np.where(right, rules.point_values[position], 0)
+        lives -= wrong
+        haven = rules.safe_haven_scores.get(position + 1)
+        if haven is not None:
+            clamp = wrong & (lives > 0) & (score < haven)
+            score[clamp] = haven
+        # Losing the last life ends the game on this question
+        current += (alive & (lives > 0)).astype(np.int8)
+
+    completed = (current >= questions) & (lives > 0)
+    return score, current, completed
+
+
+def simulate(bot: Bot, games: int, bank: QuestionBank = None, rules: Rules = None,
+             seed: Optional[int] = None, batch: int = BATCH, engine: bool = False) -> Summary:
+    """Play games and summarise them; engine=True (or no NumPy) uses GameEngine"""
+    rules = rules or Rules()
+    bank = bank or open_bank()
+    summary = Summary(rules)
+    if engine or np is None:
+        play_engine_games(rules, bot, bank, games, random.Random(seed), summary)
+        return summary
+    mix = topic_mix(bank, len(rules.point_values))
+    rng = np.random.default_rng(seed)
+    while summary.games < games:
+        summary.add_batch(*play_batch(rules, bot, mix, min(batch, games - summary.games), rng))
+    return summary
+
+
+def play_engine_games(rules: Rules, bot: Bot, bank: QuestionBank, games: int,
+                      rng: random.Random, summary: Summary):
+    """The reference path: the same bot driving real GameEngine games"""
+    engine = rules.engine_class()(bank)
+    for _ in range(games):
+        engine.start(rng.getrandbits(32))
+        for kind in GameEngine.LIFELINES:
+            engine.lifelines[kind] = kind in rules.lifelines
+        while not engine.is_over():
+            question = engine.current_question()
+            position = engine.current
+            knows = rng.random() < bot.knows(question.topic)
+            options = len(OPTION_LETTERS)
+            if not knows and engine.lifelines['hint'] and position >= bot.lifeline_from['hint']:
+                engine.use_lifeline('hint')
+                knows = rng.random() < bot.hint_gain
+            if not knows:
+                if engine.lifelines['5050'] and position >= bot.lifeline_from['5050']:
+                    engine.use_lifeline('5050')
+                    options = 2
+                elif engine.lifelines['skip'] and position >= bot.lifeline_from['skip']:
+                    engine.use_lifeline('skip')
+                    continue
+            correct = knows or rng.random() < 1 / options
+            wrong = OPTION_LETTERS[(question.correct + 1) % len(OPTION_LETTERS)]
+            engine.answer(OPTION_LETTERS[question.correct] if correct else wrong)
+        result = engine.result()
+        summary.add_game(result['score'], result['questions_answered'], result['won'])
+
+
+def print_report(summary: Summary, lifeline_values: Dict[str, float], seconds: float):
+    report = summary.report()
+    print(f"  Games:              {report['games']:,} in {seconds:.1f}s "
+          f"({report['games'] / seconds * 60 / 1e6:.1f}M/min)")
+    print(f"  Mean score:         {report['mean_score']:,.0f}")
+    print(f"  p10 / median / p90: {report['p10']:,} / {report['median']:,} / {report['p90']:,}")
+    print(f"  Completion rate:    {report['completion_rate'] * 100:.1f}%")
+    print(f"  Questions answered: {report['questions_answered']:.2f}")
+    for threshold, share in report['milestones'].items():
+        print(f"  Score >= {threshold:>9,}: {share * 100:5.1f}%")
+    for kind, value in lifeline_values.items():
+        print(f"  Value of {kind:<5} lifeline: {value:+,.0f} points per game")
+
+
+def parse_pairs(pairs: List[str], convert) -> Dict:
+    result = {}
+    for pair in pairs or []:
+        key, sep, value = pair.rpartition('=')
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got {pair!r}")
+        result[convert[0](key)] = convert[1](value)
+    return result
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="RHCSA Millionaire scoring simulator")
+    parser.add_argument('--games', type=int, default=1_000_000)
+    parser.add_argument('--accuracy', type=float, default=0.7,
+                        help="probability the bot knows an answer (default 0.7)")
+    parser.add_argument('--topic-accuracy', action='append', metavar='TOPIC=P',
+                        help="accuracy for one topic (repeatable)")
+    parser.add_argument('--hint-gain', type=float, default=0.5,
+                        help="chance the hint lets an unsure bot work out the answer")
+    parser.add_argument('--lifeline-from', action='append', metavar='KIND=POSITION',
+                        help="only use a lifeline from this 0-based question on (repeatable)")
+    parser.add_argument('--lives', type=int)
+    parser.add_argument('--safe-haven', action='append', metavar='QUESTION=SCORE',
+                        help="replace the safe havens (repeatable)")
+    parser.add_argument('--points', type=int, nargs='+', metavar='POINTS',
+                        help="replace the point ladder")
+    parser.add_argument('--bank', metavar='PATH', help="take the topic mix from a bank file")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--batch', type=int, default=BATCH)
+    parser.add_argument('--engine', action='store_true',
+                        help="play through GameEngine one game at a time (reference, slow)")
+    parser.add_argument('--no-lifeline-values', action='store_true',
+                        help="skip the extra runs that price each lifeline")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    try:
+        bot = Bot(args.accuracy, parse_pairs(args.topic_accuracy, (str, float)), args.hint_gain,
+                  parse_pairs(args.lifeline_from, (str, int)))
+        havens = parse_pairs(args.safe_haven, (int, int)) if args.safe_haven else None
+        rules = Rules(args.points, havens, args.lives)
+    except ValueError as e:
+        print(f"  {e}", file=sys.stderr)
+        sys.exit(2)
+    bank = QuestionBank.open(args.bank) if args.bank else open_bank()
+    if np is None and not args.engine:
+        print("  NumPy not found; playing through GameEngine (slow)", file=sys.stderr)
+
+    start = time.perf_counter()
+    summary = simulate(bot, args.games, bank, rules, args.seed, args.batch, args.engine)
+    seconds = time.perf_counter() - start
+    values = {}
+    if not args.no_lifeline_values:
+        for kind in rules.lifelines:
+            without = simulate(bot, args.games, bank, rules.without(kind), args.seed,
+                               args.batch, args.engine)
+            values[kind] = summary.mean - without.mean
+    print_report(summary, values, seconds)
+
+
+if __name__ == "__main__":
+    main()
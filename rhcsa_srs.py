@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+RHCSA SRS - Spaced-repetition review scheduling for Academy and Millionaire
+
+Every quiz question in RHCSA Academy and every question in the RHCSA
+Millionaire bank can become a card. Cards are scheduled with SM-2: a correct
+answer stretches the next interval by the card's ease (1 day, 6 days, then
+interval * ease), a wrong one lowers the ease, restarts the sequence and
+brings the card back after a short relearning delay.
+
+Due cards sit in a binary heap ordered by due time, so the next due cards
+come off in O(log n) each however many cards a learner has. Rescheduling
+pushes a fresh heap entry and leaves the old one to be skipped when it
+surfaces; the heap is rebuilt once stale entries outnumber live ones.
+
+Card keys are (kind, ref, index) tuples:
+
+    ('quiz', module_id, quiz_index)       an Academy module quiz question
+    ('question', bank_ref(bank), qid)     a Millionaire bank question
+
+The deck is saved as a zlib-compressed column store, about 10 bytes a card,
+and saves merge with the file on disk (the later review of a card wins)
+while holding <path>.lock (where fcntl exists), so the Academy and
+Millionaire can share one deck file.
+"""
+
+import os
+import sys
+import time
+import zlib
+import heapq
+import struct
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from rhcsa_storage import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking, one writer at a time
+    fcntl = None
+
+DEFAULT_DECK = 'rhcsa_reviews.srs'
+
+DECK_MAGIC = b'RHSR'
+DECK_VERSION = 1
+DECK_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, crc32 of the uncompressed body
+
+KINDS = ('quiz', 'question')
+DAY = 86400
+RELEARN_DELAY = 600  # seconds before a missed card comes back
+MIN_EASE = 1.3
+START_EASE = 2.5
+
+Key = Tuple[str, str, int]
+
+# (typecode, attribute) for each column of the saved deck
+_COLUMNS = (
+    ('B', 'kind'), ('H', 'ref'), ('I', 'index'), ('H', 'reps'), ('H', 'lapses'),
+    ('H', 'ease'), ('f', 'interval'), ('I', 'due'), ('I', 'reviewed'),
+)
+
+
+def bank_ref(bank) -> str:
+    """The ref for question cards: ids are only stable within one bank build"""
+    return f"{bank.fingerprint:08x}"
+
+
+class Card:
+    """Scheduling state of one reviewable item"""
+    __slots__ = ('key', 'ease', 'interval', 'reps', 'lapses', 'due', 'reviewed')
+
+    def __init__(self, key: Key, ease: float = START_EASE, interval: float = 0.0,
+                 reps: int = 0, lapses: int = 0, due: int = 0, reviewed: int = 0):
+        self.key = key
+        self.ease = ease
+        self.interval = interval  # days
+        self.reps = reps
+        self.lapses = lapses
+        self.due = due            # unix seconds
+        self.reviewed = reviewed  # unix seconds of the last review
+
+    def grade(self, quality: int, now: int):
+        """Apply one SM-2 review of quality 0 (blackout) to 5 (perfect)"""
+        if quality < 3:
+            self.reps = 0
+            self.lapses += 1
+            self.interval = 1.0
+            self.due = now + RELEARN_DELAY
+        else:
+            self.reps += 1
+            if self.reps == 1:
+                self.interval = 1.0
+            elif self.reps == 2:
+                self.interval = 6.0
+            else:
+                self.interval = round(self.interval * self.ease, 1)
+            self.due = now + int(self.interval * DAY)
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.reviewed = now
+
+
+class ReviewScheduler:
+    """All of one learner's cards with a due-time heap"""
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self.cards: Dict[Key, Card] = {card.key: card for card in cards}
+        self._heap: List[Tuple[int, Key]] = [(card.due, card.key) for card in self.cards.values()]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self.cards
+
+    def review(self, key: Key, correct: bool, now: Optional[int] = None,
+               quality: Optional[int] = None) -> Card:
+        """Record an answer (quality defaults to 4 if correct, 1 if not)"""
+        now = int(time.time()) if now is None else now
+        card = self.cards.get(key)
+        if card is None:
+            card = self.cards[key] = Card(key)
+        else:
+            self._stale += 1
+        card.grade(quality if quality is not None else (4 if correct else 1), now)
+        heapq.heappush(self._heap, (card.due, key))
+        if self._stale > len(self.cards) + 64:
+            self._heap = [(c.due, c.key) for c in self.cards.values()]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        return card
+
+    def due(self, now: Optional[int] = None, limit: int = 20,
+            accept: Optional[Callable[[Key], bool]] = None) -> List[Card]:
+        """Up to limit cards due by now, most overdue first
+
+        Cards whose key accept rejects (e.g. quizzes of a removed module) are
+        passed over but kept. Costs O((limit + passed over) log n).
+        """
+        now = int(time.time()) if now is None else now
+        heap = self._heap
+        found: List[Card] = []
+        popped = []
+        seen = set()
+        while heap and len(found) < limit and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            card = self.cards.get(entry[1])
+            if card is None or card.due != entry[0] or entry[1] in seen:
+                self._stale -= 1
+                continue
+            seen.add(entry[1])
+            popped.append(entry)
+            if accept is None or accept(card.key):
+                found.append(card)
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def merge(self, other: 'ReviewScheduler'):
+        """Take every card from other that was reviewed more recently than ours"""
+        for key, theirs in other.cards.items():
+            ours = self.cards.get(key)
+            if ours is None or theirs.reviewed > ours.reviewed:
+                if ours is not None:
+                    self._stale += 1
+                self.cards[key] = theirs
+                heapq.heappush(self._heap, (theirs.due, key))
+
+    def encode(self) -> bytes:
+        """Compact binary form of the deck; see decode"""
+        refs: Dict[str, int] = {}
+        columns = [array(code) for code, _ in _COLUMNS]
+        for card in self.cards.values():
+            kind, ref, index = card.key
+            row = (KINDS.index(kind), refs.setdefault(ref, len(refs)), index, card.reps,
+                   card.lapses, round(card.ease * 100), card.interval, card.due, card.reviewed)
+            for column, value in zip(columns, row):
+                column.append(value)
+        table = '\0'.join(refs).encode('utf-8')
+        body = struct.pack('<II', len(self.cards), len(table)) + table
+        if sys.byteorder == 'big':
+            for column in columns:
+                column.byteswap()
+        body += b''.join(column.tobytes() for column in columns)
+        return DECK_HEADER.pack(DECK_MAGIC, DECK_VERSION, 0, zlib.crc32(body)) + zlib.compress(body, 6)
+
+    @classmethod
+    def decode(cls, buf: bytes) -> 'ReviewScheduler':
+        """Inverse of encode; raises ValueError if buf is damaged"""
+        if len(buf) < DECK_HEADER.size:
+            raise ValueError("review deck is truncated")
+        magic, version, _, crc = DECK_HEADER.unpack_from(buf, 0)
+        if magic != DECK_MAGIC or version != DECK_VERSION:
+            raise ValueError("Not a compatible review deck")
+        try:
+            body = zlib.decompress(buf[DECK_HEADER.size:])
+        except zlib.error as e:
+            raise ValueError(f"corrupt review deck ({e})")
+        if zlib.crc32(body) != crc:
+            raise ValueError("checksum mismatch")
+
+        count, table_len = struct.unpack_from('<II', body)
+        pos = 8 + table_len
+        refs = body[8:pos].decode('utf-8').split('\0') if table_len else ['']
+        values = []
+        for code, _ in _COLUMNS:
+            column = array(code)
+            size = column.itemsize * count
+            column.frombytes(body[pos:pos + size])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            values.append(column)
+            pos += size
+        cards = [Card((KINDS[kind], refs[ref], index), ease / 100, interval, reps, lapses, due, reviewed)
+                 for kind, ref, index, reps, lapses, ease, interval, due, reviewed in zip(*values)]
+        return cls(cards)
+
+
+def load_deck(path: str) -> ReviewScheduler:
+    """Read a deck file; a missing one gives an empty deck
+
+    A damaged file is moved aside to <path>.corrupt rather than overwritten
+    by the next save.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return ReviewScheduler.decode(f.read())
+    except OSError:
+        return ReviewScheduler()
+    except ValueError:
+        try:
+            os.replace(path, path + '.corrupt')
+        except OSError:
+            pass
+        return ReviewScheduler()
+
+
+def save_deck(path: str, deck: ReviewScheduler):
+    """Write deck to path, keeping newer reviews another program saved meanwhile
+
+    The load, merge and write happen under an exclusive lock on <path>.lock,
+    so two programs saving at once cannot drop each other's reviews.
+    """
+    lock_fd = None
+    if fcntl is not None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        lock_fd = os.open(path + '.lock', os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+    try:
+        if os.path.exists(path):
+            deck.merge(load_deck(path))
+        atomic_write(path, deck.encode())
+    finally:
+        if lock_fd is not None:
+            os.close(lock_fd)
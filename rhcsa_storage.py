@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+RHCSA Storage - Shared file helpers for RHCSA Academy and RHCSA Millionaire
+
+Provides the per-user cache directory, content hashing for cache keys,
+atomic file replacement and a small load-time recorder for --timings.
+"""
+
+import os
+import sys
+import glob
+import stat
+import time
+import struct
+import hashlib
+import tempfile
+from typing import Callable, List, Optional, Tuple
+
+APP_NAME = 'rhcsa'
+
+# Read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def cache_dir() -> str:
+    """Per-user cache directory ($RHCSA_CACHE_DIR, $XDG_CACHE_HOME/rhcsa or ~/.cache/rhcsa)"""
+    override = os.environ.get('RHCSA_CACHE_DIR')
+    if override:
+        return override
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, APP_NAME)
+
+
+def source_hash(*paths: str) -> str:
+    """Short hex digest of the concatenated contents of the given files"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def atomic_write(path: str, data: bytes):
+    """Replace path with data so readers see either the old or the new file
+
+    The new file keeps the old one's permission bits; a new file gets the
+    usual 0666 less the umask rather than mkstemp's 0600.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), mode)
+            else:  # Windows
+                os.chmod(tmp, mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class Timings:
+    """Collects (what, status, milliseconds) entries for the --timings report"""
+    def __init__(self):
+        self.entries: List[Tuple[str, str, float]] = []
+
+    def record(self, what: str, status: str, seconds: float):
+        self.entries.append((what, status, seconds * 1000))
+
+    def report(self, stream=None):
+        """Print the collected timings"""
+        stream = stream or sys.stderr
+        for what, status, ms in self.entries:
+            print(f"  [timings] {what:<12} {status:<5} {ms:8.2f} ms", file=stream)
+
+
+def load_cached(name: str, key: str, suffix: str, build: Callable[[], bytes],
+                load: Callable[[str], object], fallback: Callable[[bytes], object],
+                timings: Optional[Timings] = None):
+    """Load a compiled artefact from the cache, rebuilding it when the key changes
+
+    The cache file is named <name>-<key><suffix>, so a changed source maps to a
+    new file and stale ones are removed after a successful rebuild. If the
+    cache directory cannot be written the freshly built data is handed to
+    fallback instead. A cache file that load rejects with OSError, ValueError
+    or struct.error (short buffer) is rebuilt; any other exception is a bug
+    and propagates.
+    """
+    start = time.perf_counter()
+    path = os.path.join(cache_dir(), f"{name}-{key}{suffix}")
+    if os.path.exists(path):
+        try:
+            result = load(path)
+        except (OSError, ValueError, struct.error):
+            pass
+        else:
+            if timings:
+                timings.record(name, 'hit', time.perf_counter() - start)
+            return result
+
+    data = build()
+    try:
+        atomic_write(path, data)
+    except OSError:
+        result = fallback(data)
+    else:
+        for stale in glob.glob(os.path.join(cache_dir(), f"{name}-*{suffix}")):
+            if stale != path:
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+        result = load(path)
+    if timings:
+        timings.record(name, 'miss', time.perf_counter() - start)
+    return result